@@ -5,18 +5,86 @@ AuthMiddleware - Middleware ASGI pour l'authentification Bearer Token.
 Vérifie le header Authorization et valide le token via TokenManager.
 """
 
+import json
+import logging
 import os
-import sys
+from datetime import date, datetime
 from typing import Optional
 
 from ..config import get_settings
 from .context import current_auth
+from .token_manager import TOKEN_MAX_LENGTH, TOKEN_MIN_LENGTH
+
+try:
+    import orjson
+except ImportError:  # Repli sur json (stdlib) si orjson n'est pas installé
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
 
 
 # NOTE: HostNormalizerMiddleware supprimé (migration SSE → Streamable HTTP).
 # L'ancien transport SSE nécessitait une normalisation du Host header pour les reverse
 # proxies (HTTP 421). Streamable HTTP n'a plus ce problème.
 
+# Endpoints publics (pas d'auth requise) — tuple pour str.startswith(tuple)
+# Note: /api/ N'EST PLUS public — nécessite un token Bearer
+PUBLIC_PATH_PREFIXES = ("/health", "/healthz", "/ready", "/graph", "/static/")
+
+# Adresses considérées comme requêtes internes (localhost)
+LOCALHOST_IPS = frozenset({"127.0.0.1", "::1"})
+
+# Sérialiseur JSON lié au niveau module (évite la résolution d'attribut par requête)
+_dumps = json.dumps
+
+
+def _json_default(obj):
+    """Repli json : datetime au format ISO 8601 (comme orjson), sinon str()."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _encode_json(data) -> bytes:
+    """
+    Sérialise en JSON UTF-8 (orjson si disponible, sinon json).
+    
+    Les datetime sont encodés nativement en ISO 8601 (même sortie que isoformat()).
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return _dumps(data, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+# Taille des blocs envoyés pour les réponses JSON streamées (/api/graph)
+JSON_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Taille des blocs pour l'envoi des gros fichiers statiques
+STATIC_CHUNK_SIZE = 256 * 1024
+
+# En-têtes communs des réponses JSON de l'API REST (content-length ajouté par réponse)
+_JSON_HEADERS_BASE = (
+    (b"content-type", b"application/json; charset=utf-8"),
+    (b"access-control-allow-origin", b"*"),
+)
+
+# En-tête content-type partagé par les pages d'erreur HTML (404/500)
+_HTML_CONTENT_TYPE = (b"content-type", b"text/html")
+
+
+def _build_json_error(status: int, message: str) -> tuple:
+    """Construit les messages ASGI (start, body) d'une erreur JSON."""
+    body = _dumps({"error": message}).encode()
+    start = {
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    }
+    return start, {"type": "http.response.body", "body": body}
+
 
 class AuthMiddleware:
     """
@@ -26,6 +94,18 @@ class AuthMiddleware:
     Pour le bootstrap initial, accepte aussi ADMIN_BOOTSTRAP_KEY.
     """
     
+    # Réponses pré-construites pour les erreurs d'auth connues (chemin chaud
+    # en cas de brute-force : pas de sérialisation JSON par requête)
+    _PREBUILT_ERRORS = {
+        (status, message): _build_json_error(status, message)
+        for status, message in (
+            (401, "Authorization header required"),
+            (401, "Invalid authorization format. Use: Bearer <token>"),
+            (401, "Invalid or expired token"),
+            (500, "Authentication error"),
+        )
+    }
+    
     def __init__(self, app, debug: bool = False):
         """
         Initialise le middleware.
@@ -36,6 +116,8 @@ class AuthMiddleware:
         """
         self.app = app
         self.debug = debug
+        # Niveau résolu une fois : aucun formatage de log par requête hors debug
+        self._log_debug = debug and logger.isEnabledFor(logging.DEBUG)
         self._settings = get_settings()
         self._token_manager = None
     
@@ -57,9 +139,7 @@ class AuthMiddleware:
         path = scope.get("path", "")
         
         # Endpoints publics (pas d'auth requise)
-        # Note: /api/ N'EST PLUS public — nécessite un token Bearer
-        public_paths = ["/health", "/healthz", "/ready", "/graph", "/static/"]
-        if any(path.startswith(p) for p in public_paths):
+        if path.startswith(PUBLIC_PATH_PREFIXES):
             await self.app(scope, receive, send)
             return
         
@@ -67,24 +147,28 @@ class AuthMiddleware:
         # MAIS les endpoints /api/ exigent toujours un token (pour le client web)
         client = scope.get("client", ("", 0))
         client_ip = client[0] if client else ""
-        if client_ip in ("127.0.0.1", "::1") and not path.startswith("/api/"):
+        if client_ip in LOCALHOST_IPS and not path.startswith("/api/"):
             await self.app(scope, receive, send)
             return
         
-        # Récupérer le header Authorization
-        headers = dict(scope.get("headers", []))
-        auth_header = headers.get(b"authorization", b"").decode("utf-8")
+        # Récupérer le header Authorization (parcours direct, sans construire de dict)
+        auth_header_bytes = b""
+        for name, value in scope.get("headers", ()):
+            if name == b"authorization":
+                auth_header_bytes = value
+                break
+        auth_header = auth_header_bytes.decode("utf-8")
         
         if not auth_header:
-            if self.debug:
-                print(f"❌ [Auth] Header Authorization manquant pour {path}", file=sys.stderr)
+            if self._log_debug:
+                logger.debug("❌ [Auth] Header Authorization manquant pour %s", path)
             await self._send_error(send, 401, "Authorization header required")
             return
         
         # Parser le Bearer token
         if not auth_header.startswith("Bearer "):
-            if self.debug:
-                print(f"❌ [Auth] Format invalide (attendu: Bearer <token>)", file=sys.stderr)
+            if self._log_debug:
+                logger.debug("❌ [Auth] Format invalide (attendu: Bearer <token>)")
             await self._send_error(send, 401, "Invalid authorization format. Use: Bearer <token>")
             return
         
@@ -93,8 +177,8 @@ class AuthMiddleware:
         # Vérifier si c'est la clé bootstrap admin
         bootstrap_key = self._settings.admin_bootstrap_key
         if bootstrap_key and token == bootstrap_key:
-            if self.debug:
-                print(f"✅ [Auth] Authentification avec clé bootstrap admin", file=sys.stderr)
+            if self._log_debug:
+                logger.debug("✅ [Auth] Authentification avec clé bootstrap admin")
             # Ajouter info d'auth au scope
             scope["auth"] = {
                 "type": "bootstrap",
@@ -107,18 +191,26 @@ class AuthMiddleware:
             await self.app(scope, receive, send)
             return
         
+        # Pré-filtrage : format manifestement invalide → rejet sans hash ni Neo4j
+        # (même réponse qu'un token inconnu, pour ne rien révéler aux scanners)
+        if not (TOKEN_MIN_LENGTH <= len(token) <= TOKEN_MAX_LENGTH and token.isascii()):
+            if self._log_debug:
+                logger.debug("❌ [Auth] Token au format invalide")
+            await self._send_error(send, 401, "Invalid or expired token")
+            return
+        
         # Valider le token client
         try:
             token_info = await self.token_manager.validate_token(token)
             
             if not token_info:
-                if self.debug:
-                    print(f"❌ [Auth] Token invalide ou expiré", file=sys.stderr)
+                if self._log_debug:
+                    logger.debug("❌ [Auth] Token invalide ou expiré")
                 await self._send_error(send, 401, "Invalid or expired token")
                 return
             
-            if self.debug:
-                print(f"✅ [Auth] Client '{token_info.client_name}' authentifié", file=sys.stderr)
+            if self._log_debug:
+                logger.debug("✅ [Auth] Client '%s' authentifié", token_info.client_name)
             
             # Ajouter info d'auth au scope
             scope["auth"] = {
@@ -134,28 +226,16 @@ class AuthMiddleware:
             await self.app(scope, receive, send)
             
         except Exception as e:
-            if self.debug:
-                print(f"❌ [Auth] Erreur validation: {e}", file=sys.stderr)
+            if self._log_debug:
+                logger.debug("❌ [Auth] Erreur validation: %s", e)
             await self._send_error(send, 500, "Authentication error")
     
     async def _send_error(self, send, status: int, message: str):
         """Envoie une réponse d'erreur HTTP."""
-        import json
-        
-        body = json.dumps({"error": message}).encode()
-        
-        await send({
-            "type": "http.response.start",
-            "status": status,
-            "headers": [
-                (b"content-type", b"application/json"),
-                (b"content-length", str(len(body)).encode()),
-            ],
-        })
-        await send({
-            "type": "http.response.body",
-            "body": body,
-        })
+        prebuilt = self._PREBUILT_ERRORS.get((status, message))
+        start, body = prebuilt if prebuilt is not None else _build_json_error(status, message)
+        await send(start)
+        await send(body)
 
 
 class LoggingMiddleware:
@@ -177,7 +257,7 @@ class LoggingMiddleware:
         query = scope.get("query_string", b"").decode()
         
         full_path = f"{path}?{query}" if query else path
-        print(f"📥 [HTTP] {method} {full_path}", file=sys.stderr)
+        logger.debug("📥 [HTTP] %s %s", method, full_path)
         
         # Wrapper pour logger la réponse
         status_code = [None]
@@ -191,7 +271,7 @@ class LoggingMiddleware:
         
         if status_code[0]:
             emoji = "✅" if status_code[0] < 400 else "❌"
-            print(f"{emoji} [HTTP] {method} {path} -> {status_code[0]}", file=sys.stderr)
+            logger.debug("%s [HTTP] %s %s -> %s", emoji, method, path, status_code[0])
 
 
 class StaticFilesMiddleware:
@@ -212,6 +292,31 @@ class StaticFilesMiddleware:
         )
         self._graph_service = None
         self._extractor_service = None
+        
+        # Cache de /api/memories : (GraphService.memories_version, body JSON)
+        self._memories_cache = None
+        
+        # Cache des fichiers statiques : filepath → (mtime_ns, body, content-length)
+        self._file_cache: dict = {}
+        
+        # Table de routage : correspondance exacte (méthode, chemin) → handler
+        # Méthode None = toutes les méthodes acceptées
+        self._exact_routes = {
+            (None, "/graph"): self._route_graph_page,
+            (None, "/graph/"): self._route_graph_page,
+            (None, "/health"): self._route_health,
+            (None, "/healthz"): self._route_health,
+            (None, "/ready"): self._route_health,
+            ("GET", "/api/memories"): self._route_memories,
+            ("POST", "/api/ask"): self._route_ask,
+            ("POST", "/api/query"): self._route_query,
+        }
+        # Routes par préfixe : (préfixe, méthode, handler) — le handler reçoit
+        # le suffixe du chemin et retourne False s'il ne gère pas la requête
+        self._prefix_routes = (
+            ("/static/", None, self._route_static),
+            ("/api/graph/", "GET", self._route_graph_api),
+        )
     
     @property
     def graph_service(self):
@@ -237,52 +342,64 @@ class StaticFilesMiddleware:
         path = scope.get("path", "")
         method = scope.get("method", "GET")
         
-        # Page de visualisation
-        if path == "/graph" or path == "/graph/":
-            await self._serve_file(send, "graph.html", "text/html")
-            return
-        
-        # Fichiers statiques (CSS, JS)
-        if path.startswith("/static/"):
-            rel_path = path[len("/static/"):]
-            # Sécurité : pas de traversée de répertoire
-            if ".." not in rel_path and rel_path:
-                ct = self._guess_content_type(rel_path)
-                await self._serve_file(send, rel_path, ct)
-                return
-        
-        # Health check
-        if path in ("/health", "/healthz", "/ready"):
-            await self._api_health(send)
-            return
-        
-        # API REST - Liste des mémoires
-        if path == "/api/memories" and method == "GET":
-            await self._api_memories(send)
-            return
-        
-        # API REST - Graphe d'une mémoire
-        if path.startswith("/api/graph/") and method == "GET":
-            memory_id = path[len("/api/graph/"):]
-            if memory_id:
-                await self._api_graph(send, memory_id)
-                return
-        
-        # API REST - Question/Réponse (POST)
-        if path == "/api/ask" and method == "POST":
-            body = await self._read_body(receive)
-            await self._api_ask(send, body)
+        # Correspondance exacte : une seule recherche dans le dict
+        handler = self._exact_routes.get((method, path)) or self._exact_routes.get((None, path))
+        if handler is not None:
+            await handler(scope, receive, send)
             return
         
-        # API REST - Query structuré (POST) — données brutes sans LLM
-        if path == "/api/query" and method == "POST":
-            body = await self._read_body(receive)
-            await self._api_query(send, body)
-            return
+        # Correspondance par préfixe
+        for prefix, route_method, prefix_handler in self._prefix_routes:
+            if path.startswith(prefix) and (route_method is None or route_method == method):
+                if await prefix_handler(scope, send, path[len(prefix):]):
+                    return
+                break
         
         # Passer au handler suivant
         await self.app(scope, receive, send)
     
+    # =========================================================================
+    # Handlers de routes
+    # =========================================================================
+    
+    async def _route_graph_page(self, scope, receive, send):
+        """Page de visualisation."""
+        await self._serve_file(scope, send, "graph.html", "text/html")
+    
+    async def _route_health(self, scope, receive, send):
+        """Health check."""
+        await self._api_health(send)
+    
+    async def _route_memories(self, scope, receive, send):
+        """API REST - Liste des mémoires."""
+        await self._api_memories(send)
+    
+    async def _route_ask(self, scope, receive, send):
+        """API REST - Question/Réponse (POST)."""
+        body = await self._read_body(receive)
+        await self._api_ask(send, body)
+    
+    async def _route_query(self, scope, receive, send):
+        """API REST - Query structuré (POST) — données brutes sans LLM."""
+        body = await self._read_body(receive)
+        await self._api_query(send, body)
+    
+    async def _route_static(self, scope, send, rel_path: str) -> bool:
+        """Fichiers statiques (CSS, JS)."""
+        # Sécurité : pas de traversée de répertoire
+        if ".." in rel_path or not rel_path:
+            return False
+        ct = self._guess_content_type(rel_path)
+        await self._serve_file(scope, send, rel_path, ct)
+        return True
+    
+    async def _route_graph_api(self, scope, send, memory_id: str) -> bool:
+        """API REST - Graphe d'une mémoire."""
+        if not memory_id:
+            return False
+        await self._api_graph(send, memory_id)
+        return True
+    
     async def _read_body(self, receive) -> bytes:
         """Lit le corps complet d'une requête ASGI."""
         body = b""
@@ -310,7 +427,6 @@ class StaticFilesMiddleware:
 
     async def _api_health(self, send):
         """Retourne l'état de santé du serveur (format compact)."""
-        import json
         version = self._read_version()
         try:
             data = {
@@ -329,10 +445,21 @@ class StaticFilesMiddleware:
             }, 500)
     
     async def _api_memories(self, send):
-        """Retourne la liste des mémoires en JSON."""
-        import json
+        """
+        Retourne la liste des mémoires en JSON.
+        
+        Le corps sérialisé est réutilisé tant que GraphService.memories_version
+        n'a pas changé (aucune création/suppression/restauration de mémoire).
+        """
         try:
-            memories = await self.graph_service.list_memories()
+            graph_service = self.graph_service
+            version = graph_service.memories_version
+            cached = self._memories_cache
+            if cached is not None and cached[0] == version:
+                await self._send_json_body(send, cached[1])
+                return
+            
+            memories = await graph_service.list_memories()
             data = {
                 "status": "ok",
                 "count": len(memories),
@@ -343,33 +470,43 @@ class StaticFilesMiddleware:
                         "description": m.description,
                         "ontology": m.ontology,
                         "ontology_uri": m.ontology_uri,
-                        "created_at": m.created_at.isoformat() if m.created_at else None
+                        "created_at": m.created_at,
                     }
                     for m in memories
                 ]
             }
-            await self._send_json(send, data)
+            body = _encode_json(data)
+            self._memories_cache = (version, body)
+            await self._send_json_body(send, body)
         except Exception as e:
             await self._send_json(send, {"status": "error", "message": str(e)}, 500)
     
     async def _api_graph(self, send, memory_id: str):
-        """Retourne le graphe complet d'une mémoire en JSON."""
-        import json
+        """
+        Retourne le graphe complet d'une mémoire en JSON.
+        
+        La réponse est streamée par blocs (nœuds, arêtes, documents encodés
+        un à un) pour ne jamais matérialiser le JSON complet en mémoire.
+        """
         try:
             graph_data = await self.graph_service.get_full_graph(memory_id)
-            data = {
-                "status": "ok",
-                "memory_id": memory_id,
-                "node_count": len(graph_data["nodes"]),
-                "edge_count": len(graph_data["edges"]),
-                "document_count": len(graph_data["documents"]),
-                "nodes": graph_data["nodes"],
-                "edges": graph_data["edges"],
-                "documents": graph_data["documents"]
-            }
-            await self._send_json(send, data)
         except Exception as e:
             await self._send_json(send, {"status": "error", "message": str(e)}, 500)
+            return
+        
+        envelope = {
+            "status": "ok",
+            "memory_id": memory_id,
+            "node_count": len(graph_data["nodes"]),
+            "edge_count": len(graph_data["edges"]),
+            "document_count": len(graph_data["documents"]),
+        }
+        sections = {
+            "nodes": graph_data["nodes"],
+            "edges": graph_data["edges"],
+            "documents": graph_data["documents"],
+        }
+        await self._send_json_stream(send, envelope, sections)
     
     async def _api_ask(self, send, body: bytes):
         """
@@ -379,7 +516,6 @@ class StaticFilesMiddleware:
         Body JSON: {memory_id, question, limit?}
         Retourne: {status, answer, entities, source_documents}
         """
-        import json
         try:
             payload = json.loads(body.decode('utf-8'))
             memory_id = payload.get("memory_id")
@@ -393,7 +529,7 @@ class StaticFilesMiddleware:
                 }, 400)
                 return
             
-            print(f"💬 [ASK] {memory_id}: {question}", file=sys.stderr)
+            logger.info("💬 [ASK] %s: %s", memory_id, question)
             
             # Appel direct à la fonction MCP (source unique de logique)
             from ..server import question_answer
@@ -410,7 +546,7 @@ class StaticFilesMiddleware:
                 "message": "JSON invalide dans le body"
             }, 400)
         except Exception as e:
-            print(f"❌ [ASK] Erreur: {e}", file=sys.stderr)
+            logger.error("❌ [ASK] Erreur: %s", e)
             await self._send_json(send, {
                 "status": "error",
                 "message": str(e)
@@ -424,7 +560,6 @@ class StaticFilesMiddleware:
         Body JSON: {memory_id, query, limit?}
         Retourne: {status, entities, rag_chunks, source_documents, stats}
         """
-        import json
         try:
             payload = json.loads(body.decode('utf-8'))
             memory_id = payload.get("memory_id")
@@ -438,7 +573,7 @@ class StaticFilesMiddleware:
                 }, 400)
                 return
             
-            print(f"📊 [Query] {memory_id}: {query}", file=sys.stderr)
+            logger.info("📊 [Query] %s: %s", memory_id, query)
             
             from ..server import memory_query
             result = await memory_query(memory_id, query, limit)
@@ -451,7 +586,7 @@ class StaticFilesMiddleware:
                 "message": "JSON invalide dans le body"
             }, 400)
         except Exception as e:
-            print(f"❌ [Query] Erreur: {e}", file=sys.stderr)
+            logger.error("❌ [Query] Erreur: %s", e)
             await self._send_json(send, {
                 "status": "error",
                 "message": str(e)
@@ -459,43 +594,98 @@ class StaticFilesMiddleware:
     
     async def _send_json(self, send, data: dict, status: int = 200):
         """Envoie une réponse JSON."""
-        import json
-        body = json.dumps(data, ensure_ascii=False, default=str).encode('utf-8')
+        await self._send_json_body(send, _encode_json(data), status)
+    
+    async def _send_json_body(self, send, body: bytes, status: int = 200):
+        """Envoie un corps JSON déjà sérialisé."""
         await send({
             "type": "http.response.start",
             "status": status,
-            "headers": [
-                (b"content-type", b"application/json; charset=utf-8"),
-                (b"content-length", str(len(body)).encode()),
-                (b"access-control-allow-origin", b"*"),
-            ],
+            "headers": _JSON_HEADERS_BASE + ((b"content-length", str(len(body)).encode()),),
         })
         await send({"type": "http.response.body", "body": body})
     
-    async def _serve_file(self, send, filename: str, content_type: str):
-        """Sert un fichier statique."""
+    async def _send_json_stream(self, send, envelope: dict, sections: dict, status: int = 200):
+        """
+        Envoie une réponse JSON streamée (http.response.body avec more_body).
+        
+        Le document produit est `envelope` complété des listes de `sections`,
+        sérialisées élément par élément et envoyées par blocs de JSON_STREAM_CHUNK_SIZE.
+        """
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": _JSON_HEADERS_BASE,
+        })
+        
+        buf = bytearray(_encode_json(envelope)[:-1])  # Retire le "}" final
+        for name, items in sections.items():
+            buf += b"," + _encode_json(name) + b":["
+            for i, item in enumerate(items):
+                if i:
+                    buf += b","
+                buf += _encode_json(item)
+                if len(buf) >= JSON_STREAM_CHUNK_SIZE:
+                    await send({"type": "http.response.body", "body": bytes(buf), "more_body": True})
+                    buf.clear()
+            buf += b"]"
+        buf += b"}"
+        await send({"type": "http.response.body", "body": bytes(buf)})
+    
+    async def _serve_file(self, scope, send, filename: str, content_type: str):
+        """
+        Sert un fichier statique.
+        
+        Si le serveur ASGI annonce l'extension "http.response.pathsend", il
+        envoie lui-même le fichier (sendfile noyau). Sinon le contenu est gardé
+        en mémoire, invalidé par la date de modification du fichier (un seul
+        stat() par requête), et les gros fichiers sont envoyés par blocs.
+        """
         filepath = os.path.join(self._static_dir, filename)
         
-        if not os.path.exists(filepath):
+        try:
+            st = os.stat(filepath)
+        except OSError:
             await self._send_404(send, f"File not found: {filename}")
             return
         
         try:
-            with open(filepath, "rb") as f:
-                body = f.read()
+            headers = [
+                (b"content-type", content_type.encode()),
+                (b"cache-control", b"no-cache"),
+            ]
             
-            await send({
-                "type": "http.response.start",
-                "status": 200,
-                "headers": [
-                    (b"content-type", content_type.encode()),
-                    (b"content-length", str(len(body)).encode()),
-                    (b"cache-control", b"no-cache"),
-                ],
-            })
+            if "http.response.pathsend" in (scope.get("extensions") or {}):
+                headers.append((b"content-length", str(st.st_size).encode()))
+                await send({"type": "http.response.start", "status": 200, "headers": headers})
+                await send({"type": "http.response.pathsend", "path": filepath})
+                return
+            
+            cached = self._file_cache.get(filepath)
+            if cached is not None and cached[0] == st.st_mtime_ns:
+                _, body, content_length = cached
+            else:
+                with open(filepath, "rb") as f:
+                    body = f.read()
+                content_length = str(len(body)).encode()
+                self._file_cache[filepath] = (st.st_mtime_ns, body, content_length)
+            
+            headers.append((b"content-length", content_length))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            
+            # Envoi par blocs : laisse le serveur appliquer son contrôle de flux
+            # sans pousser tout le fichier d'un coup dans le buffer d'écriture
+            offset = 0
+            while len(body) - offset > STATIC_CHUNK_SIZE:
+                await send({
+                    "type": "http.response.body",
+                    "body": body[offset:offset + STATIC_CHUNK_SIZE],
+                    "more_body": True,
+                })
+                offset += STATIC_CHUNK_SIZE
             await send({
                 "type": "http.response.body",
-                "body": body,
+                "body": body[offset:] if offset else body,
             })
         except Exception as e:
             await self._send_500(send, str(e))
@@ -507,7 +697,7 @@ class StaticFilesMiddleware:
             "type": "http.response.start",
             "status": 404,
             "headers": [
-                (b"content-type", b"text/html"),
+                _HTML_CONTENT_TYPE,
                 (b"content-length", str(len(body)).encode()),
             ],
         })
@@ -520,7 +710,7 @@ class StaticFilesMiddleware:
             "type": "http.response.start",
             "status": 500,
             "headers": [
-                (b"content-type", b"text/html"),
+                _HTML_CONTENT_TYPE,
                 (b"content-length", str(len(body)).encode()),
             ],
         })
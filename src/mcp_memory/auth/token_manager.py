@@ -7,14 +7,44 @@ Seul le hash du token est stocké (pas le token en clair).
 """
 
 import sys
+import time
+import logging
 import secrets
 import hashlib
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional, List
 
 from ..config import get_settings
 from ..core.models import TokenInfo, TokenCreateRequest
 
+logger = logging.getLogger(__name__)
+
+# Cache en mémoire des tokens validés (évite une requête Neo4j par requête HTTP).
+# TTL court : une révocation faite depuis un autre processus est prise en
+# compte au plus tard après TOKEN_CACHE_TTL_SECONDS.
+TOKEN_CACHE_TTL_SECONDS = 30.0
+TOKEN_CACHE_MAX_SIZE = 1024
+
+# Cache négatif des tokens inconnus/expirés : absorbe le brute-force en mémoire
+# au lieu d'envoyer une requête Neo4j par tentative (éviction FIFO)
+NEGATIVE_CACHE_TTL_SECONDS = 10.0
+NEGATIVE_CACHE_MAX_SIZE = 4096
+
+# Bornes de longueur d'un token plausible (secrets.token_urlsafe(32) ≈ 43 caractères).
+# En dehors : rejet immédiat, sans hash ni requête Neo4j.
+TOKEN_MIN_LENGTH = 20
+TOKEN_MAX_LENGTH = 512
+
+# Permissions connues, internées : les listes issues de Neo4j partagent les
+# mêmes objets str (comparaison par identité dans `in`, pas de doublons en mémoire)
+_PERM_INTERN = {p: sys.intern(p) for p in ("read", "write", "admin")}
+
+
+def _intern_permissions(permissions) -> List[str]:
+    """Remplace les permissions connues par leur version internée."""
+    return [_PERM_INTERN.get(p, p) for p in permissions]
+
 
 class TokenManager:
     """
@@ -44,6 +74,11 @@ class TokenManager:
         """
         self._graph_service = graph_service
         self._settings = get_settings()
+        # Cache LRU : digest SHA256 brut (32 bytes) → (échéance monotonic, TokenInfo)
+        # L'échéance intègre déjà expires_at (min(TTL, expiration du token))
+        self._token_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+        # Cache négatif : digest SHA256 brut → échéance monotonic
+        self._negative_cache: "OrderedDict[bytes, float]" = OrderedDict()
     
     @property
     def graph(self):
@@ -58,6 +93,24 @@ class TokenManager:
         """Hash un token avec SHA256."""
         return hashlib.sha256(token.encode()).hexdigest()
     
+    @staticmethod
+    def _hash_token_bytes(token: str) -> bytes:
+        """Hash SHA256 brut d'un token (clé du cache en mémoire)."""
+        return hashlib.sha256(token.encode()).digest()
+    
+    def _remember_invalid(self, key: bytes):
+        """Mémorise un digest de token invalide pendant NEGATIVE_CACHE_TTL_SECONDS."""
+        self._negative_cache[key] = time.monotonic() + NEGATIVE_CACHE_TTL_SECONDS
+        if len(self._negative_cache) > NEGATIVE_CACHE_MAX_SIZE:
+            self._negative_cache.popitem(last=False)
+    
+    def _invalidate_cached_token(self, token_hash: str):
+        """Retire un token du cache (après révocation ou modification)."""
+        try:
+            self._token_cache.pop(bytes.fromhex(token_hash), None)
+        except ValueError:
+            pass
+    
     @staticmethod
     def _generate_token() -> str:
         """Génère un token sécurisé."""
@@ -121,7 +174,7 @@ class TokenManager:
                 expires_at=expires_at.isoformat() if expires_at else None
             )
         
-        print(f"🔑 [Auth] Token créé pour client '{client_name}'", file=sys.stderr)
+        logger.info("🔑 [Auth] Token créé pour client '%s'", client_name)
         
         # Retourner le token en clair (seule fois où il est accessible)
         return token
@@ -130,13 +183,36 @@ class TokenManager:
         """
         Valide un token et retourne ses informations.
         
+        Les tokens valides sont gardés en cache (clé = digest SHA256 brut)
+        pendant TOKEN_CACHE_TTL_SECONDS pour éviter un aller-retour Neo4j.
+        
         Args:
             token: Le token en clair
             
         Returns:
             TokenInfo si valide, None sinon
         """
-        token_hash = self._hash_token(token)
+        # Pré-filtrage : un token de longueur aberrante ne peut pas être valide
+        if not TOKEN_MIN_LENGTH <= len(token) <= TOKEN_MAX_LENGTH:
+            return None
+        
+        key = self._hash_token_bytes(token)
+        
+        cached = self._token_cache.get(key)
+        if cached is not None:
+            deadline, token_info = cached
+            if deadline > time.monotonic():
+                self._token_cache.move_to_end(key)
+                return token_info
+            del self._token_cache[key]
+        
+        negative_deadline = self._negative_cache.get(key)
+        if negative_deadline is not None:
+            if negative_deadline > time.monotonic():
+                return None
+            del self._negative_cache[key]
+        
+        token_hash = key.hex()
         
         async with self.graph.session() as session:
             result = await session.run(
@@ -150,6 +226,7 @@ class TokenManager:
             record = await result.single()
             
             if not record:
+                self._remember_invalid(key)
                 return None
             
             node = record["t"]
@@ -160,21 +237,34 @@ class TokenManager:
                 try:
                     expires_at = datetime.fromisoformat(node["expires_at"])
                     if expires_at < datetime.utcnow():
-                        print(f"⚠️ [Auth] Token expiré pour '{node['client_name']}'", file=sys.stderr)
+                        logger.info("⚠️ [Auth] Token expiré pour '%s'", node['client_name'])
+                        self._remember_invalid(key)
                         return None
                 except:
                     pass
             
-            return TokenInfo(
+            token_info = TokenInfo(
                 token_hash=node["hash"],
                 client_name=node["client_name"],
                 email=node.get("email"),
-                permissions=node.get("permissions", []),
+                permissions=_intern_permissions(node.get("permissions", [])),
                 memory_ids=node.get("memory_ids", []),
                 created_at=node["created_at"].to_native() if node.get("created_at") else datetime.utcnow(),
                 expires_at=expires_at,
                 is_active=node.get("is_active", True)
             )
+        
+        # Échéance du cache bornée par l'expiration du token : un hit ne demande
+        # qu'une comparaison de flottants (pas de datetime ni de fromisoformat)
+        now = time.monotonic()
+        deadline = now + TOKEN_CACHE_TTL_SECONDS
+        if expires_at is not None and expires_at.tzinfo is None:
+            deadline = min(deadline, now + (expires_at - datetime.utcnow()).total_seconds())
+        self._token_cache[key] = (deadline, token_info)
+        if len(self._token_cache) > TOKEN_CACHE_MAX_SIZE:
+            self._token_cache.popitem(last=False)
+        
+        return token_info
     
     async def revoke_token(self, token_hash: str) -> bool:
         """
@@ -198,8 +288,10 @@ class TokenManager:
             
             record = await result.single()
             
+            self._invalidate_cached_token(token_hash)
+            
             if record:
-                print(f"🚫 [Auth] Token révoqué: {token_hash[:8]}...", file=sys.stderr)
+                logger.info("🚫 [Auth] Token révoqué: %s...", token_hash[:8])
                 return True
             return False
     
@@ -236,7 +328,7 @@ class TokenManager:
                     token_hash=node["hash"],
                     client_name=node["client_name"],
                     email=node.get("email"),
-                    permissions=node.get("permissions", []),
+                    permissions=_intern_permissions(node.get("permissions", [])),
                     memory_ids=node.get("memory_ids", []),
                     created_at=node["created_at"].to_native() if node.get("created_at") else datetime.utcnow(),
                     expires_at=expires_at,
@@ -269,52 +361,46 @@ class TokenManager:
         Returns:
             Dict avec les nouvelles memory_ids, ou None si token non trouvé
         """
+        # Un seul aller-retour : la nouvelle liste est calculée côté Neo4j
+        # (mode incrémental : union avec add, retrait de remove, dédoublonnée et triée)
         async with self.graph.session() as session:
-            # Récupérer le token
             result = await session.run(
-                "MATCH (t:Token {hash: $hash, is_active: true}) RETURN t",
-                hash=token_hash
-            )
-            record = await result.single()
-            
-            if not record:
-                return None
-            
-            node = record["t"]
-            current_memories = list(node.get("memory_ids", []))
-            
-            if set_memories is not None:
-                # Mode remplacement total
-                new_memories = set_memories
-            else:
-                # Mode ajout/retrait incrémental
-                memory_set = set(current_memories)
-                
-                if add_memories:
-                    memory_set.update(add_memories)
-                if remove_memories:
-                    memory_set -= set(remove_memories)
-                
-                new_memories = sorted(memory_set)
-            
-            # Mettre à jour dans Neo4j
-            await session.run(
                 """
-                MATCH (t:Token {hash: $hash})
-                SET t.memory_ids = $memory_ids, t.updated_at = datetime()
+                MATCH (t:Token {hash: $hash, is_active: true})
+                WITH t, coalesce(t.memory_ids, []) AS previous
+                CALL {
+                    WITH previous
+                    UNWIND [x IN previous + $add_memories WHERE NOT x IN $remove_memories] AS mid
+                    WITH DISTINCT mid ORDER BY mid
+                    RETURN collect(mid) AS merged
+                }
+                SET t.memory_ids = CASE WHEN $set_memories IS NULL THEN merged ELSE $set_memories END,
+                    t.updated_at = datetime()
+                RETURN previous, t.memory_ids AS current, t.client_name AS client_name
                 """,
                 hash=token_hash,
-                memory_ids=new_memories
+                add_memories=add_memories or [],
+                remove_memories=remove_memories or [],
+                set_memories=set_memories
             )
-            
-            print(f"🔑 [Auth] Token {token_hash[:8]}... mémoires mises à jour: {new_memories}", file=sys.stderr)
-            
-            return {
-                "token_hash": token_hash,
-                "client_name": node["client_name"],
-                "previous_memories": current_memories,
-                "current_memories": new_memories
-            }
+            record = await result.single()
+        
+        if not record:
+            return None
+        
+        self._invalidate_cached_token(token_hash)
+        
+        current_memories = list(record["previous"])
+        new_memories = list(record["current"])
+        
+        logger.info("🔑 [Auth] Token %s... mémoires mises à jour: %s", token_hash[:8], new_memories)
+        
+        return {
+            "token_hash": token_hash,
+            "client_name": record["client_name"],
+            "previous_memories": current_memories,
+            "current_memories": new_memories
+        }
     
     async def update_token_permissions(
         self,
@@ -363,9 +449,10 @@ class TokenManager:
                 hash=token_hash,
                 permissions=permissions
             )
+            self._invalidate_cached_token(token_hash)
             
             action = "promu admin" if "admin" in permissions and "admin" not in previous_permissions else "mis à jour"
-            print(f"🔑 [Auth] Token {token_hash[:8]}... permissions {action}: {permissions}", file=sys.stderr)
+            logger.info("🔑 [Auth] Token %s... permissions %s: %s", token_hash[:8], action, permissions)
             
             return {
                 "token_hash": token_hash,
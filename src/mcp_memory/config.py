@@ -2,15 +2,24 @@
 """
 Configuration centralisée du service MCP Memory.
 
-Utilise pydantic-settings pour charger et valider la configuration
-depuis les variables d'environnement ou un fichier .env.
+La classe Settings (pydantic-settings) décrit le schéma : champs, types et
+valeurs par défaut. Le singleton de get_settings() est rempli par une lecture
+directe de os.environ (+ .env), avec conversion des types faite ici.
 """
 
-from functools import lru_cache
-from typing import Optional
+import os
+from functools import cached_property, lru_cache
+from typing import Optional, Union, get_args, get_origin
+
+from dotenv import dotenv_values
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+# Fichier .env lu seulement s'il existe et si MCP_USE_DOTENV n'est pas à "0"
+# (en conteneur, la config vient de l'environnement : inutile de chercher/parser .env)
+_ENV_FILE = ".env" if os.environ.get("MCP_USE_DOTENV", "1") != "0" and os.path.exists(".env") else None
+
+
 class Settings(BaseSettings):
     """
     Configuration du service MCP Memory.
@@ -21,18 +30,19 @@ class Settings(BaseSettings):
     """
     
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=_ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
-        extra="ignore"
+        extra="ignore",
+        frozen=True  # Singleton immuable : aucune modification après chargement
     )
     
     # =========================================================================
     # S3 Cloud Temple
     # =========================================================================
     s3_endpoint_url: str = "https://takinc5acc.s3.fr1.cloud-temple.com"
-    s3_access_key_id: str
-    s3_secret_access_key: str
+    s3_access_key_id: Optional[str] = None      # Requis par StorageService
+    s3_secret_access_key: Optional[str] = None  # Requis par StorageService
     s3_bucket_name: str = "quoteflow-memory"
     s3_region_name: str = "fr1"
     
@@ -40,7 +50,7 @@ class Settings(BaseSettings):
     # LLMaaS Cloud Temple
     # =========================================================================
     llmaas_api_url: str = "https://api.ai.cloud-temple.com"
-    llmaas_api_key: str
+    llmaas_api_key: Optional[str] = None  # Requis par ExtractorService / EmbeddingService
     llmaas_model: str = "gpt-oss:120b"
     llmaas_max_tokens: int = 60000  # gpt-oss:120b fait du chain-of-thought qui consomme beaucoup de tokens
     llmaas_temperature: float = 1.0  # gpt-oss:120b fonctionne mieux à température 1.0
@@ -52,12 +62,17 @@ class Settings(BaseSettings):
     # =========================================================================
     llmaas_embedding_model: str = "bge-m3:567m"
     llmaas_embedding_dimensions: int = 1024  # Dimension des vecteurs BGE-M3
+    llmaas_embedding_batch_size: int = 5     # Textes par appel /v1/embeddings
+    llmaas_embedding_concurrency: int = 4    # Appels /v1/embeddings simultanés
     
     # =========================================================================
     # Qdrant (base vectorielle)
     # =========================================================================
     qdrant_url: str = "http://qdrant:6333"
     qdrant_collection_prefix: str = "memory_"  # Préfixe pour les collections Qdrant
+    qdrant_vector_datatype: str = "float16"  # Stockage des vecteurs des nouvelles collections (float16 ou float32)
+    qdrant_import_batch_size: int = 512  # Points par upsert lors d'une restauration de backup
+    qdrant_import_concurrency: int = 4   # Upserts simultanés lors d'une restauration de backup
     
     # =========================================================================
     # Chunking sémantique
@@ -76,7 +91,7 @@ class Settings(BaseSettings):
     # =========================================================================
     neo4j_uri: str = "bolt://neo4j:7687"
     neo4j_user: str = "neo4j"
-    neo4j_password: str
+    neo4j_password: Optional[str] = None  # Requis par GraphService
     neo4j_database: str = "neo4j"  # Base par défaut
     
     # =========================================================================
@@ -97,6 +112,7 @@ class Settings(BaseSettings):
     # =========================================================================
     s3_backup_prefix: str = "_backups"  # Préfixe S3 pour les backups
     backup_retention_count: int = 5     # Nombre max de backups conservés par mémoire (0 = illimité)
+    backup_s3_checksums: bool = False   # Envoyer le SHA-256 déjà calculé (ChecksumSHA256) — non supporté par Dell ECS
     
     # =========================================================================
     # Limites et timeouts
@@ -106,33 +122,106 @@ class Settings(BaseSettings):
     s3_upload_timeout_seconds: int = 60
     neo4j_query_timeout_seconds: int = 30
     
-    @property
+    def require(self, *fields: str) -> None:
+        """
+        Vérifie que des secrets sont renseignés, au moment où un service en a besoin.
+        
+        Les identifiants (S3, LLMaaS, Neo4j) sont optionnels au chargement pour
+        que les outils n'utilisant pas ces sous-systèmes (tests, CLI) n'aient
+        pas à les fournir.
+        
+        Raises:
+            ValueError: Si un des champs est absent ou vide
+        """
+        missing = [name.upper() for name in fields if not getattr(self, name)]
+        if missing:
+            raise ValueError(f"Configuration manquante: {', '.join(missing)}")
+    
+    # Valeurs dérivées : calculées au premier accès puis mémorisées sur l'instance
+    # (cached_property — le singleton ne change pas après chargement)
+    
+    @cached_property
     def llmaas_base_url(self) -> str:
         """URL complète pour le client OpenAI (compatible OpenAI)."""
         # L'URL doit pointer vers le endpoint compatible OpenAI
         # Cloud Temple: https://api.ai.cloud-temple.com (déjà avec /v1 intégré)
         return self.llmaas_api_url
     
-    @property
+    @cached_property
     def max_document_size_bytes(self) -> int:
         """Taille max en bytes."""
         return self.max_document_size_mb * 1024 * 1024
 
 
-@lru_cache()
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on", "t", "y"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "off", "f", "n"})
+
+
+def _coerce_env_value(name: str, raw: str, annotation):
+    """Convertit une valeur brute d'environnement vers le type du champ."""
+    if get_origin(annotation) is Union:
+        # Optional[X] → X
+        annotation = next(a for a in get_args(annotation) if a is not type(None))
+    
+    if annotation is bool:
+        value = raw.strip().lower()
+        if value in _TRUE_VALUES:
+            return True
+        if value in _FALSE_VALUES:
+            return False
+        raise ValueError(f"{name.upper()}: booléen invalide ({raw!r})")
+    if annotation in (int, float):
+        try:
+            return annotation(raw.strip())
+        except ValueError:
+            raise ValueError(f"{name.upper()}: valeur {annotation.__name__} invalide ({raw!r})") from None
+    return raw
+
+
+def _load_settings() -> Settings:
+    """
+    Construit Settings sans passer par le pipeline de sources de pydantic-settings.
+    
+    Les variables d'environnement priment sur le fichier .env (noms insensibles
+    à la casse, variables inconnues ignorées) ; les champs absents gardent leur
+    valeur par défaut.
+    """
+    env = {}
+    if _ENV_FILE:
+        env.update((k.lower(), v) for k, v in dotenv_values(_ENV_FILE).items() if v is not None)
+    env.update((k.lower(), v) for k, v in os.environ.items())
+    
+    values = {}
+    for name, field in Settings.model_fields.items():
+        raw = env.get(name)
+        if raw is not None:
+            values[name] = _coerce_env_value(name, raw, field.annotation)
+    
+    return Settings.model_construct(**values)
+
+
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
     """
     Retourne l'instance de configuration (singleton).
     
-    Utilise lru_cache pour ne charger la config qu'une seule fois.
+    Utilise lru_cache (sans limite, donc sans gestion LRU) pour ne charger
+    la config qu'une seule fois, au premier appel.
     
     Usage:
         from src.mcp_memory.config import get_settings
         settings = get_settings()
         print(settings.neo4j_uri)
     """
-    return Settings()
+    return _load_settings()
 
 
-# Pour usage direct: from config import settings
-settings = get_settings()
+def __getattr__(name: str):
+    """
+    Accès paresseux à `settings` (PEP 562) pour les anciens appels
+    `from config import settings` : la configuration n'est construite
+    qu'au premier accès, via le singleton de get_settings().
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,10 +5,27 @@ Core Services pour MCP Memory.
 - GraphService : Client Neo4j + requêtes Cypher
 - StorageService : Client S3 (boto3)
 - ExtractorService : Extraction via LLMaaS
+
+Les services sont importés à la demande (PEP 562) : importer un sous-module
+léger (ex: core.models) ne charge pas neo4j, boto3 ni openai.
 """
 
-from .graph import GraphService
-from .storage import StorageService
-from .extractor import ExtractorService
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    "GraphService": ".graph",
+    "StorageService": ".storage",
+    "ExtractorService": ".extractor",
+}
 
 __all__ = ["GraphService", "StorageService", "ExtractorService"]
+
+
+def __getattr__(name: str):
+    """Importe le module du service au premier accès et mémorise l'attribut."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -10,7 +10,7 @@ Coordonne l'export/import des 3 couches de données :
 Format de backup sur S3 :
     _backups/{memory_id}/{timestamp}/
     ├── manifest.json          # Métadonnées, version, checksums, stats
-    ├── graph_data.json        # Export complet Neo4j (nœuds + relations)
+    ├── graph_data.json[.zst]  # Export complet Neo4j (nœuds + relations), zstd si disponible
     ├── qdrant_vectors.jsonl   # Points Qdrant (embedding + payload), 1 par ligne
     └── document_keys.json     # Références S3 des documents originaux
 
@@ -18,15 +18,41 @@ Politique de rétention : configurable via BACKUP_RETENTION_COUNT (.env)
 """
 
 import io
+import os
+import re
+import base64
+import gc
+import gzip
 import json
 import sys
+import asyncio
 import tarfile
 import hashlib
+import struct
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Iterator
 
 from ..config import get_settings
 
+try:
+    import orjson
+except ImportError:  # Repli sur json (stdlib) si orjson n'est pas installé
+    orjson = None
+
+try:
+    from isal import igzip, igzip_threaded
+except ImportError:  # Repli sur gzip (stdlib) si python-isal n'est pas installé
+    igzip = igzip_threaded = None
+
+try:
+    import zstandard
+except ImportError:  # graph_data.json non compressé si zstandard n'est pas installé
+    zstandard = None
+
 
 # Version du format de backup (pour compatibilité future)
 BACKUP_FORMAT_VERSION = "1.0"
@@ -34,9 +60,344 @@ BACKUP_FORMAT_VERSION = "1.0"
 # Taille max d'une archive tar.gz en bytes (100 MB)
 MAX_ARCHIVE_SIZE_BYTES = 100 * 1024 * 1024
 
-# Regex pour valider les composants d'un backup_id (pas de path traversal)
-import re
-_SAFE_ID_RE = re.compile(r'^[A-Za-z0-9_-]+$')
+# Limites sur le contenu décompressé d'une archive (anti bombe de décompression) :
+# taille déclarée par membre, et total de tous les membres
+MAX_ARCHIVE_MEMBER_SIZE_BYTES = 512 * 1024 * 1024
+MAX_ARCHIVE_UNCOMPRESSED_BYTES = 10 * MAX_ARCHIVE_SIZE_BYTES
+
+# Sections de graph_data.json après le nœud Memory (ordre d'export_memory_data)
+GRAPH_SECTIONS = ("documents", "entities", "relations", "mentions")
+
+# Export du graphe : compressé en zstd si disponible (le checksum porte sur le
+# fichier stocké) ; les backups non compressés restent restaurables
+GRAPH_DATA_FILE = "graph_data.json"
+GRAPH_DATA_ZSTD_FILE = "graph_data.json.zst"
+ZSTD_LEVEL = 3
+
+# Fichiers du backup attendus dans une archive, hors documents/
+ARCHIVE_BACKUP_FILES = frozenset({
+    "manifest.json", GRAPH_DATA_FILE, GRAPH_DATA_ZSTD_FILE,
+    "qdrant_vectors.jsonl", "document_keys.json",
+})
+
+# Upload multipart des gros fichiers de backup (S3 impose >= 5 MB par part, sauf la dernière)
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+MULTIPART_CONCURRENCY = 8  # Parts envoyées en parallèle (pool de threads boto3)
+
+# Téléchargements S3 simultanés lors de la construction d'une archive
+DOWNLOAD_CONCURRENCY = 16
+
+# Taille des blocs produits par la sérialisation JSONL (avant hash + buffer d'upload)
+SERIALIZE_BLOCK_SIZE = 64 * 1024
+
+# Re-uploads S3 simultanés des documents lors d'une restauration d'archive
+RESTORE_UPLOAD_CONCURRENCY = 16
+
+# Lectures de manifests simultanées dans list_backups
+MANIFEST_FETCH_CONCURRENCY = 32
+
+# Cache des petits objets de backup (manifests, document_keys.json), revalidé
+# par GET conditionnel (If-None-Match) : un 304 évite de retransférer le contenu
+OBJECT_CACHE_MAX_ENTRIES = 256
+OBJECT_CACHE_MAX_OBJECT_SIZE = 1024 * 1024
+
+# Taille des blocs lus sur les réponses S3 (hash incrémental au fil du transfert)
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Restauration d'archive : décompression sur un thread dédié, en avance sur les
+# uploads S3, par blocs de ARCHIVE_READ_CHUNK_SIZE (au plus ARCHIVE_READAHEAD_ITEMS
+# en attente, en-têtes de membres compris)
+ARCHIVE_READ_CHUNK_SIZE = 1024 * 1024
+ARCHIVE_READAHEAD_ITEMS = 32
+
+# Tampons tarfile des archives : bloc du flux tar (défaut 10 KiB) et copie
+# des membres (défaut 16 KiB) → moins d'allers-retours vers le compresseur ;
+# aussi taille des sauts de données dans _TarStreamReader
+TAR_BUFFER_SIZE = 2 * 1024 * 1024
+
+# Compression gzip des archives : ISA-L multi-thread si installé (pigz-like),
+# sinon zlib (stdlib, un seul cœur)
+GZIP_THREADS = min(4, os.cpu_count() or 1)
+GZIP_FALLBACK_LEVEL = 6
+
+# Lecture des archives (_TarStreamReader) : blocs tar de 512 octets, en-tête
+# ustar réduit aux champs utiles (nom, taille, checksum, type, magic, préfixe)
+_TAR_BLOCK_SIZE = 512
+_TAR_HEADER = struct.Struct("100s24x12s12x8sc100x6s2x32x32x16x155s")
+_TAR_SIGNED_BYTES = struct.Struct("148b8x356b")
+# Taille max des en-têtes étendus (pax 'x'/'g', nom long GNU 'L'/'K'), lus en mémoire
+_TAR_MAX_EXTENDED_HEADER = 1024 * 1024
+
+# Unités de _human_size (puissances de 1024)
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Regex pour valider un backup_id et ses composants (pas de path traversal)
+_BACKUP_ID_RE = re.compile(r'([A-Za-z0-9_-]+)/([A-Za-z0-9_-]+)')
+_SAFE_ID_RE = re.compile(r'[A-Za-z0-9_-]+')
+
+
+# Encodeur de repli créé une seule fois : json.dumps() avec des options en
+# reconstruit un à chaque appel (un appel par point Qdrant)
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _encode_json(data) -> bytes:
+    """Sérialise en JSON UTF-8 compact (orjson si disponible, sinon json)."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return _COMPACT_ENCODER.encode(data).encode("utf-8")
+
+
+# Désérialisation des données graphe/vecteurs (accepte str ou bytes)
+_decode_json = orjson.loads if orjson is not None else json.loads
+
+
+def _graph_data_file(manifest: dict) -> str:
+    """Nom du fichier graphe d'un backup (compressé ou non, d'après le manifest)."""
+    if GRAPH_DATA_ZSTD_FILE in manifest.get("files", ()):
+        return GRAPH_DATA_ZSTD_FILE
+    return GRAPH_DATA_FILE
+
+
+def _decode_graph_data(filename: str, raw) -> dict:
+    """Décompresse si besoin (zstd) puis parse le fichier graphe d'un backup."""
+    if filename == GRAPH_DATA_ZSTD_FILE:
+        if zstandard is None:
+            raise ValueError(
+                f"{filename} nécessite le paquet 'zstandard' (pip install zstandard)"
+            )
+        # decompressobj : la taille décompressée n'est pas dans l'en-tête (flux)
+        raw = zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+    # Un gros graphe crée énormément d'objets d'un coup : le GC cyclique se
+    # déclencherait à répétition pendant le parsing (un arbre JSON n'a pas de cycles)
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _decode_json(raw)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+async def _iter_slices(data: bytes, size: int) -> AsyncIterator[memoryview]:
+    """Découpe un contenu en mémoire en blocs de size octets (sans copie)."""
+    view = memoryview(data)
+    for offset in range(0, len(view), size):
+        yield view[offset:offset + size]
+
+
+def _open_gzip_writer(fileobj):
+    """
+    Ouvre un flux gzip en écriture sur fileobj.
+    
+    Avec python-isal, la compression est répartie sur GZIP_THREADS threads
+    (instructions SIMD ISA-L, hors GIL) ; sinon gzip de la stdlib.
+    La sortie reste un gzip standard, lisible par tarfile / tar -xz.
+    """
+    if igzip_threaded is not None and GZIP_THREADS > 1:
+        return igzip_threaded.open(fileobj, "wb", threads=GZIP_THREADS)
+    return gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=GZIP_FALLBACK_LEVEL)
+
+
+def _open_gzip_reader(archive_bytes: bytes):
+    """
+    Ouvre une archive tar.gz reçue en mémoire comme flux décompressé.
+    
+    L'archive n'est jamais écrite sur disque : le coût de lecture est celui
+    de l'inflate. Avec python-isal, il passe par ISA-L (SIMD, 2 à 3× moins de
+    CPU que zlib) ; sinon gzip de la stdlib. Lu ensuite par _TarStreamReader.
+    """
+    if igzip is not None:
+        return igzip.IGzipFile(fileobj=io.BytesIO(archive_bytes), mode="rb")
+    return gzip.GzipFile(fileobj=io.BytesIO(archive_bytes), mode="rb")
+
+
+class _ChunkSink:
+    """Fichier en écriture seule qui accumule les blocs de l'archive compressée."""
+    
+    def __init__(self):
+        self._chunks = []
+    
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+    
+    def flush(self) -> None:
+        pass
+    
+    def close(self) -> None:
+        pass
+    
+    def drain(self) -> List[bytes]:
+        """Retourne et oublie les blocs écrits depuis le dernier appel."""
+        chunks, self._chunks = self._chunks, []
+        return chunks
+
+
+def _tar_number(field: bytes) -> int:
+    """Décode un champ numérique d'en-tête tar (octal ASCII, ou base 256 GNU)."""
+    if field[0] & 0x80:
+        value = int.from_bytes(field[1:], "big")
+        return value - (1 << (8 * len(field) - 8)) if field[0] == 0xff else value
+    digits = field.split(b"\0", 1)[0].strip()
+    try:
+        return int(digits, 8) if digits else 0
+    except ValueError:
+        raise tarfile.ReadError(f"Champ numérique tar invalide: {field!r}") from None
+
+
+class _TarStreamReader:
+    """
+    Lecteur tar en flux, spécialisé pour la restauration d'archives.
+    
+    Remplace tarfile.open(mode='r|') : les en-têtes de 512 octets sont décodés
+    directement (struct, seulement nom / taille / checksum / type) au lieu de
+    passer par le décodage générique de tarfile, coûteux sur les archives à
+    nombreux petits documents. Gère ce que produisent download_backup et
+    tar -czf : ustar, en-têtes pax (path, size) et noms longs GNU. Les
+    membres sont rendus en TarInfo (nom, taille, type) pour
+    _validate_archive_members, qui refuse liens et fichiers spéciaux.
+    
+    Lecture strictement vers l'avant : extractfile() ne vaut que pour le
+    membre courant, les données non lues sont sautées au membre suivant.
+    """
+    
+    __slots__ = ("_fileobj", "_data_left", "_padding", "_first")
+    
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self._data_left = 0   # Données du membre courant pas encore lues
+        self._padding = 0     # Bourrage jusqu'au bloc suivant
+        # Premier en-tête lu dès l'ouverture (comme tarfile) : une archive
+        # illisible échoue ici
+        self._first = self._next_member()
+    
+    def __iter__(self) -> Iterator[tarfile.TarInfo]:
+        member, self._first = self._first, None
+        while member is not None:
+            yield member
+            member = self._next_member()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        self._data_left = self._padding = 0
+    
+    def extractfile(self, member: tarfile.TarInfo) -> "_TarStreamReader":
+        """Fichier en lecture sur les données du membre courant (celui que l'itération vient de rendre)."""
+        return self
+    
+    def read(self, size: int = -1) -> bytes:
+        """Lit les données du membre courant (tout le reste si size < 0)."""
+        if size < 0 or size > self._data_left:
+            size = self._data_left
+        data = self._read_exact(size)
+        self._data_left -= size
+        return data
+    
+    def _read_exact(self, size: int) -> bytes:
+        data = self._fileobj.read(size)
+        if len(data) < size:
+            parts = [data]
+            missing = size - len(data)
+            while missing:
+                chunk = self._fileobj.read(missing)
+                if not chunk:
+                    raise tarfile.ReadError("Archive tar tronquée")
+                parts.append(chunk)
+                missing -= len(chunk)
+            data = b"".join(parts)
+        return data
+    
+    def _skip(self, size: int) -> None:
+        while size:
+            chunk = self._fileobj.read(min(size, TAR_BUFFER_SIZE))
+            if not chunk:
+                raise tarfile.ReadError("Archive tar tronquée")
+            size -= len(chunk)
+    
+    def _read_extended(self, size: int) -> bytes:
+        """Lit le contenu d'un en-tête étendu (pax ou nom long GNU) et son bourrage."""
+        if size > _TAR_MAX_EXTENDED_HEADER:
+            raise ValueError(f"En-tête tar étendu trop volumineux ({BackupService._human_size(size)})")
+        data = self._read_exact(size)
+        self._skip(-size % _TAR_BLOCK_SIZE)
+        return data
+    
+    def _next_member(self) -> Optional[tarfile.TarInfo]:
+        """Lit l'en-tête suivant (en sautant les données non lues), None en fin d'archive."""
+        self._skip(self._data_left + self._padding)
+        self._data_left = self._padding = 0
+        
+        pax_path = pax_size = long_name = None
+        while True:
+            block = self._fileobj.read(_TAR_BLOCK_SIZE)
+            if not block or block.count(0) == _TAR_BLOCK_SIZE:
+                return None  # Fin d'archive (bloc nul ou fin du flux)
+            if len(block) < _TAR_BLOCK_SIZE:
+                block += self._read_exact(_TAR_BLOCK_SIZE - len(block))
+            
+            name, size_field, chksum, typeflag, magic, prefix = _TAR_HEADER.unpack(block[:500])
+            expected = _tar_number(chksum)
+            unsigned = sum(block) - sum(block[148:156]) + 8 * 32
+            if expected != unsigned and expected != sum(_TAR_SIGNED_BYTES.unpack(block)) + 8 * 32:
+                raise tarfile.ReadError("Checksum d'en-tête tar invalide")
+            size = _tar_number(size_field)
+            
+            if typeflag == b"x":
+                # En-tête pax du membre suivant : enregistrements "<longueur> <clé>=<valeur>\n"
+                records = self._read_extended(size)
+                pos = 0
+                while pos < len(records):
+                    # Chaque enregistrement doit avancer : longueur décimale,
+                    # espace, et fin dans les données lues (sinon boucle infinie)
+                    space = records.find(b" ", pos)
+                    length = records[pos:space] if space >= 0 else b""
+                    if not length.isdigit():
+                        raise tarfile.ReadError("En-tête pax invalide")
+                    end = pos + int(length)
+                    if end <= space + 1 or end > len(records):
+                        raise tarfile.ReadError("En-tête pax invalide")
+                    key, _, value = records[space + 1:end - 1].partition(b"=")
+                    if key == b"path":
+                        pax_path = value.decode("utf-8", "surrogateescape")
+                    elif key == b"size":
+                        if not value.isdigit():
+                            raise tarfile.ReadError("Taille pax invalide")
+                        pax_size = int(value)
+                    pos = end
+                continue
+            if typeflag in (b"g", b"K"):
+                # En-tête pax global, lien long GNU : sans effet sur les noms et tailles
+                self._skip(size + (-size % _TAR_BLOCK_SIZE))
+                continue
+            if typeflag == b"L":
+                long_name = self._read_extended(size).split(b"\0", 1)[0].decode("utf-8", "surrogateescape")
+                continue
+            if typeflag == b"S":
+                raise ValueError("Membre d'archive refusé (fichier sparse)")
+            
+            if pax_path is not None:
+                member_name = pax_path
+            elif long_name is not None:
+                member_name = long_name
+            else:
+                member_name = name.split(b"\0", 1)[0].decode("utf-8", "surrogateescape")
+                if magic == b"ustar\0" and prefix[0]:
+                    member_name = prefix.split(b"\0", 1)[0].decode("utf-8", "surrogateescape") + "/" + member_name
+            if pax_size is not None:
+                size = pax_size
+            
+            member = tarfile.TarInfo(member_name.rstrip("/") if typeflag == b"5" else member_name)
+            member.type = tarfile.REGTYPE if typeflag in (b"\0", b"7") else typeflag
+            member.size = size if member.isreg() else 0
+            self._data_left = member.size
+            self._padding = -member.size % _TAR_BLOCK_SIZE
+            return member
 
 
 class BackupService:
@@ -47,6 +408,12 @@ class BackupService:
     StorageService) pour exporter et importer les données.
     """
     
+    __slots__ = (
+        "_graph", "_vectors", "_storage", "_settings",
+        "_prefix", "_retention", "_send_checksums",
+        "_object_cache", "_object_cache_lock",
+    )
+    
     def __init__(self, graph_service, vector_store, storage_service):
         """
         Args:
@@ -60,6 +427,10 @@ class BackupService:
         self._settings = get_settings()
         self._prefix = self._settings.s3_backup_prefix
         self._retention = self._settings.backup_retention_count
+        self._send_checksums = self._settings.backup_s3_checksums
+        # Clé S3 → (ETag, contenu), du moins au plus récemment utilisé
+        self._object_cache = OrderedDict()
+        self._object_cache_lock = threading.Lock()  # _read_object tourne dans des threads
     
     @staticmethod
     def _validate_backup_id(backup_id: str) -> tuple:
@@ -75,6 +446,12 @@ class BackupService:
         if not backup_id or not isinstance(backup_id, str):
             raise ValueError("backup_id requis")
         
+        # Cas nominal : une seule correspondance ancrée (fullmatch)
+        match = _BACKUP_ID_RE.fullmatch(backup_id)
+        if match:
+            return match.group(1), match.group(2)
+        
+        # Sinon, identifier la partie fautive pour le message d'erreur
         parts = backup_id.split("/", 1)
         if len(parts) != 2:
             raise ValueError(
@@ -85,18 +462,18 @@ class BackupService:
         memory_id, timestamp = parts
         
         # Valider chaque composant (alphanumérique + tirets + underscores uniquement)
-        if not _SAFE_ID_RE.match(memory_id):
+        if not _SAFE_ID_RE.fullmatch(memory_id):
             raise ValueError(
                 f"memory_id invalide dans backup_id: '{memory_id}'. "
                 f"Caractères autorisés: A-Z, a-z, 0-9, -, _"
             )
-        if not _SAFE_ID_RE.match(timestamp):
+        if not _SAFE_ID_RE.fullmatch(timestamp):
             raise ValueError(
                 f"timestamp invalide dans backup_id: '{timestamp}'. "
                 f"Caractères autorisés: A-Z, a-z, 0-9, -, _"
             )
         
-        return memory_id, timestamp
+        raise ValueError(f"backup_id invalide: '{backup_id}'")
     
     def _backup_s3_prefix(self, memory_id: str, timestamp: str) -> str:
         """Construit le préfixe S3 pour un backup."""
@@ -116,7 +493,7 @@ class BackupService:
         Crée un backup complet d'une mémoire sur S3.
         
         Exporte :
-        1. Données Neo4j (graphe complet) → graph_data.json
+        1. Données Neo4j (graphe complet) → graph_data.json (.zst si zstandard)
         2. Vecteurs Qdrant (embeddings + payloads) → qdrant_vectors.jsonl
         3. Références documents S3 → document_keys.json
         4. Manifest avec checksums et statistiques → manifest.json
@@ -154,39 +531,61 @@ class BackupService:
         
         await _log(f"Démarrage backup: {backup_id}")
         
-        # === 1. Export Neo4j ===
-        await _log("📊 Export graphe Neo4j...")
-        graph_data = await self._graph.export_memory_data(memory_id)
-        graph_json = json.dumps(graph_data, ensure_ascii=False, indent=2)
-        graph_hash = hashlib.sha256(graph_json.encode()).hexdigest()
-        
-        graph_stats = {
-            "documents": len(graph_data.get("documents", [])),
-            "entities": len(graph_data.get("entities", [])),
-            "relations": len(graph_data.get("relations", [])),
-            "mentions": len(graph_data.get("mentions", []))
+        s3_metadata = {"backup_id": backup_id, "memory_id": memory_id}
+        
+        # === 1+2. Export Neo4j et Qdrant (en parallèle) ===
+        # - graph_data.json : JSON compact sérialisé en flux (compressé zstd si possible)
+        # - qdrant_vectors.jsonl : une ligne JSON par point
+        # Chacun est envoyé en flux vers S3 : le fichier complet n'est jamais en mémoire
+        await _log("📊 Export graphe Neo4j + 🔢 vecteurs Qdrant...")
+        graph_stats = {"documents": 0, "entities": 0, "relations": 0, "mentions": 0}
+        documents = []  # Gardés pour les références S3 (étape 3)
+        qdrant_stats = {"qdrant_vectors": 0}
+        graph_chunks = self._iter_graph_json(memory_id, graph_stats, documents)
+        if zstandard is not None:
+            graph_file, graph_type = GRAPH_DATA_ZSTD_FILE, "application/zstd"
+            graph_chunks = self._iter_zstd(graph_chunks)
+        else:
+            graph_file, graph_type = GRAPH_DATA_FILE, "application/json"
+        graph_key = f"{backup_prefix}/{graph_file}"
+        qdrant_key = f"{backup_prefix}/qdrant_vectors.jsonl"
+        uploads = {
+            graph_key: asyncio.ensure_future(self._upload_stream(
+                graph_key,
+                graph_chunks,
+                graph_type,
+                s3_metadata
+            )),
+            qdrant_key: asyncio.ensure_future(self._upload_stream(
+                qdrant_key,
+                self._iter_jsonl(self._vectors.export_collection(memory_id),
+                                 qdrant_stats, "qdrant_vectors"),
+                "application/x-ndjson",
+                s3_metadata
+            )),
         }
+        try:
+            done, _ = await asyncio.wait(uploads.values(), return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()  # Relance l'erreur du premier upload en échec
+        except BaseException:
+            # Pas d'objet orphelin sous un préfixe qui n'aura jamais de manifest
+            await self._discard_uploads(uploads)
+            raise
+        graph_hash, graph_size = uploads[graph_key].result()
+        qdrant_hash, qdrant_size = uploads[qdrant_key].result()
+        
         await _log(f"✅ Graphe: {graph_stats['entities']} entités, "
                     f"{graph_stats['relations']} relations, "
-                    f"{graph_stats['documents']} docs")
-        
-        # === 2. Export Qdrant ===
-        await _log("🔢 Export vecteurs Qdrant...")
-        qdrant_points = await self._vectors.export_collection(memory_id)
-        
-        # Format JSONL (une ligne JSON par point, économise de la mémoire)
-        qdrant_lines = []
-        for point in qdrant_points:
-            qdrant_lines.append(json.dumps(point, ensure_ascii=False))
-        qdrant_jsonl = "\n".join(qdrant_lines)
-        qdrant_hash = hashlib.sha256(qdrant_jsonl.encode()).hexdigest()
-        
-        await _log(f"✅ Qdrant: {len(qdrant_points)} vecteurs exportés")
+                    f"{graph_stats['documents']} docs "
+                    f"({self._human_size(graph_size)})")
+        await _log(f"✅ Qdrant: {qdrant_stats['qdrant_vectors']} vecteurs exportés "
+                    f"({self._human_size(qdrant_size)})")
         
         # === 3. Références documents S3 ===
         await _log("📄 Collecte des références documents S3...")
         document_keys = []
-        for doc in graph_data.get("documents", []):
+        for doc in documents:
             uri = doc.get("uri", "")
             if uri:
                 try:
@@ -202,8 +601,8 @@ class BackupService:
                 except ValueError:
                     pass
         
-        doc_keys_json = json.dumps(document_keys, ensure_ascii=False, indent=2)
-        doc_keys_hash = hashlib.sha256(doc_keys_json.encode()).hexdigest()
+        doc_keys_json = _encode_json(document_keys)  # Compact, comme graph_data.json
+        doc_keys_hash = hashlib.sha256(doc_keys_json).hexdigest()
         
         total_doc_size = sum(d.get("size_bytes", 0) for d in document_keys)
         await _log(f"✅ Documents: {len(document_keys)} références "
@@ -222,7 +621,7 @@ class BackupService:
             "elapsed_seconds": elapsed,
             "stats": {
                 **graph_stats,
-                "qdrant_vectors": len(qdrant_points),
+                "qdrant_vectors": qdrant_stats["qdrant_vectors"],
                 "document_files": len(document_keys),
                 "total_document_size_bytes": total_doc_size,
             },
@@ -233,34 +632,37 @@ class BackupService:
             },
             "files": [
                 "manifest.json",
-                "graph_data.json",
+                graph_file,
                 "qdrant_vectors.jsonl",
                 "document_keys.json",
             ]
         }
-        manifest_json = json.dumps(manifest, ensure_ascii=False, indent=2)
+        # Seul fichier indenté : petit, et destiné à être lu tel quel (inspection S3)
+        manifest_json = json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8")
         
         # === 5. Upload sur S3 ===
         await _log("📤 Upload sur S3...")
         
+        # (le graphe et qdrant_vectors.jsonl sont déjà uploadés en flux ;
+        # le manifest part en dernier : un backup sans manifest n'est pas listé)
         files_to_upload = [
-            ("manifest.json", manifest_json.encode("utf-8"), "application/json"),
-            ("graph_data.json", graph_json.encode("utf-8"), "application/json"),
-            ("qdrant_vectors.jsonl", qdrant_jsonl.encode("utf-8"), "application/x-ndjson"),
-            ("document_keys.json", doc_keys_json.encode("utf-8"), "application/json"),
+            ("document_keys.json", doc_keys_json, "application/json", doc_keys_hash),
+            ("manifest.json", manifest_json, "application/json",
+             hashlib.sha256(manifest_json).hexdigest()),
         ]
         
-        for filename, content, content_type in files_to_upload:
+        client = self._storage._client
+        bucket = self._storage._bucket
+        for filename, content, content_type, sha256_hex in files_to_upload:
             key = f"{backup_prefix}/{filename}"
-            self._storage._client.put_object(
-                Bucket=self._storage._bucket,
+            await asyncio.to_thread(
+                client.put_object,
+                Bucket=bucket,
                 Key=key,
                 Body=content,
                 ContentType=content_type,
-                Metadata={
-                    "backup_id": backup_id,
-                    "memory_id": memory_id,
-                }
+                Metadata=s3_metadata,
+                **self._checksum_args(sha256_hex)
             )
             await _log(f"  📁 {filename} ({self._human_size(len(content))})")
         
@@ -289,13 +691,19 @@ class BackupService:
     # List backups
     # =========================================================================
     
-    async def list_backups(self, memory_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def list_backups(
+        self,
+        memory_id: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Liste les backups disponibles sur S3.
         
         Args:
             memory_id: Si fourni, liste uniquement les backups de cette mémoire.
                        Sinon, liste tous les backups.
+            limit: Si fourni, seuls les `limit` backups les plus récents sont lus
+                   (un GET de manifest par backup retourné)
             
         Returns:
             Liste de manifests (triés par date décroissante)
@@ -306,25 +714,59 @@ class BackupService:
         
         # Lister tous les objets sous le préfixe
         all_objects = await self._storage.list_all_objects(prefix=prefix)
+        return await self._read_manifests(all_objects, limit)
+    
+    @staticmethod
+    def _manifest_objects(all_objects: List[dict]) -> List[dict]:
+        """
+        manifest.json d'un listing S3, du backup le plus récent au plus ancien.
         
-        # Trouver les manifest.json
-        manifests = []
-        for obj in all_objects:
-            if obj["key"].endswith("/manifest.json"):
+        Tri sur le timestamp de la clé ({prefix}/{memory_id}/{timestamp}/manifest.json,
+        format %Y-%m-%dT%H-%M-%S : ordre lexicographique = ordre chronologique),
+        sans lire les manifests.
+        """
+        manifest_objects = [obj for obj in all_objects if obj["key"].endswith("/manifest.json")]
+        manifest_objects.sort(key=lambda obj: obj["key"].rsplit("/", 2)[-2], reverse=True)
+        return manifest_objects
+    
+    async def _read_manifests(
+        self,
+        all_objects: List[dict],
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Lit les manifests présents dans un listing S3.
+        
+        Args:
+            all_objects: Objets retournés par list_all_objects()
+            limit: Nombre max de manifests lus (les plus récents)
+            
+        Returns:
+            Liste de manifests (triés par date décroissante)
+        """
+        # Trouver les manifest.json et les lire en parallèle (GET S3 dans des threads)
+        manifest_objects = self._manifest_objects(all_objects)
+        if limit is not None:
+            manifest_objects = manifest_objects[:limit]
+        semaphore = asyncio.Semaphore(MANIFEST_FETCH_CONCURRENCY)
+        
+        async def _read_manifest(obj: dict) -> Optional[dict]:
+            async with semaphore:
                 try:
                     # Télécharger et parser le manifest
-                    response = self._storage._client.get_object(
-                        Bucket=self._storage._bucket,
-                        Key=obj["key"]
-                    )
-                    content = response["Body"].read()
-                    manifest = json.loads(content.decode("utf-8"))
-                    manifest["s3_key"] = obj["key"]
-                    manifest["s3_size"] = obj["size"]
-                    manifests.append(manifest)
+                    manifest = _decode_json(await asyncio.to_thread(self._read_object, obj["key"]))
                 except Exception as e:
                     print(f"⚠️ [Backup] Erreur lecture manifest {obj['key']}: {e}",
                           file=sys.stderr)
+                    return None
+            manifest["s3_key"] = obj["key"]
+            manifest["s3_size"] = obj["size"]
+            return manifest
+        
+        manifests = [
+            m for m in await asyncio.gather(*(_read_manifest(obj) for obj in manifest_objects))
+            if m is not None
+        ]
         
         # Trier par date décroissante
         manifests.sort(key=lambda m: m.get("created_at", ""), reverse=True)
@@ -388,11 +830,10 @@ class BackupService:
         
         # === 2. Télécharger les données du graphe ===
         await _log("📊 Chargement des données graphe...")
-        graph_data = await self._download_json(f"{backup_prefix}/graph_data.json")
+        graph_file = _graph_data_file(manifest)
+        graph_json, actual_hash = await self._download_hashed(f"{backup_prefix}/{graph_file}")
         
-        # Vérifier le checksum
-        graph_json = json.dumps(graph_data, ensure_ascii=False, indent=2)
-        actual_hash = hashlib.sha256(graph_json.encode()).hexdigest()
+        # Vérifier le checksum (sur le contenu tel que stocké : compact, indenté ou zstd)
         expected_hash = manifest.get("checksums", {}).get("graph_data")
         if expected_hash and actual_hash != expected_hash:
             raise ValueError(
@@ -400,39 +841,40 @@ class BackupService:
                 f"Obtenu: {actual_hash[:16]}... Le backup est peut-être corrompu."
             )
         
+        graph_data = _decode_graph_data(graph_file, graph_json)
+        del graph_json
         await _log("✅ Données graphe vérifiées (checksum OK)")
         
-        # === 3. Télécharger les vecteurs Qdrant ===
-        await _log("🔢 Chargement des vecteurs Qdrant...")
-        qdrant_jsonl = await self._download_text(f"{backup_prefix}/qdrant_vectors.jsonl")
-        
-        qdrant_points = []
-        if qdrant_jsonl.strip():
-            for line in qdrant_jsonl.strip().split("\n"):
-                if line.strip():
-                    qdrant_points.append(json.loads(line))
-        
-        # Vérifier le checksum
-        actual_hash = hashlib.sha256(qdrant_jsonl.encode()).hexdigest()
-        expected_hash = manifest.get("checksums", {}).get("qdrant_vectors")
-        if expected_hash and actual_hash != expected_hash:
-            raise ValueError(
-                f"Checksum vecteurs invalide ! Le backup est peut-être corrompu."
-            )
-        
-        await _log(f"✅ {len(qdrant_points)} vecteurs chargés (checksum OK)")
-        
-        # === 4. Restaurer le graphe Neo4j ===
+        # === 3. Restaurer le graphe Neo4j ===
         await _log("📊 Restauration du graphe Neo4j...")
         graph_counters = await self._graph.import_memory_data(graph_data)
+        del graph_data
         await _log(f"✅ Graphe restauré: {graph_counters}")
         
-        # === 5. Restaurer les vecteurs Qdrant ===
+        # === 4. Restaurer les vecteurs Qdrant (en flux depuis S3) ===
+        # Les lignes JSONL sont parsées et upsertées par batch au fil du
+        # téléchargement ; le checksum, calculé au passage, est vérifié à la fin
+        # (en cas d'échec, la restauration est annulée).
         await _log("🔢 Restauration des vecteurs Qdrant...")
-        vectors_imported = await self._vectors.import_collection(memory_id, qdrant_points)
-        await _log(f"✅ Qdrant: {vectors_imported} vecteurs restaurés")
+        qdrant_digest = hashlib.sha256()
+        try:
+            vectors_imported = await self._vectors.import_collection(
+                memory_id,
+                (_decode_json(line) async for line in self._iter_s3_lines(
+                    f"{backup_prefix}/qdrant_vectors.jsonl", qdrant_digest
+                ))
+            )
+            expected_hash = manifest.get("checksums", {}).get("qdrant_vectors")
+            if expected_hash and qdrant_digest.hexdigest() != expected_hash:
+                raise ValueError(
+                    f"Checksum vecteurs invalide ! Le backup est peut-être corrompu."
+                )
+        except Exception:
+            await self._rollback_restore(memory_id)
+            raise
+        await _log(f"✅ Qdrant: {vectors_imported} vecteurs restaurés (checksum OK)")
         
-        # === 6. Vérifier les documents S3 ===
+        # === 5. Vérifier les documents S3 ===
         await _log("📄 Vérification des documents S3...")
         doc_keys = await self._download_json(f"{backup_prefix}/document_keys.json")
         
@@ -473,20 +915,24 @@ class BackupService:
         backup_id: str,
         include_documents: bool = False,
         progress_callback=None
-    ) -> bytes:
+    ) -> AsyncIterator[bytes]:
         """
-        Télécharge un backup sous forme d'archive tar.gz.
+        Télécharge un backup sous forme d'archive tar.gz, produite en flux.
         
         Par défaut (light) : uniquement les fichiers JSON du backup.
         Avec include_documents=True : inclut aussi les fichiers originaux.
         
+        L'archive est compressée au fil de l'eau (tarfile en mode flux) : seuls
+        les fichiers en cours de téléchargement (DOWNLOAD_CONCURRENCY au plus)
+        et le dernier bloc compressé sont en mémoire, jamais l'archive entière.
+        
         Args:
             backup_id: ID du backup
             include_documents: Si True, inclut les documents originaux
             progress_callback: Callback async(msg: str)
             
-        Returns:
-            Contenu de l'archive tar.gz en bytes
+        Yields:
+            Blocs successifs de l'archive tar.gz
         """
         async def _log(msg):
             print(f"📦 [Download] {msg}", file=sys.stderr)
@@ -502,74 +948,141 @@ class BackupService:
         
         await _log(f"Préparation archive: {backup_id}")
         
-        # Créer l'archive tar.gz en mémoire
-        buf = io.BytesIO()
+        sink = _ChunkSink()
+        archive_size = 0
         
-        with tarfile.open(fileobj=buf, mode='w:gz') as tar:
+        # tar non compressé (mode flux) → gzip multi-thread si disponible → sink
+        with _open_gzip_writer(sink) as gz, tarfile.open(
+            fileobj=gz, mode='w|', bufsize=TAR_BUFFER_SIZE, copybufsize=TAR_BUFFER_SIZE
+        ) as tar:
             archive_dir = f"backup-{memory_id}-{timestamp}"
             
-            # Ajouter les fichiers JSON du backup
+            # Le manifest d'abord : il donne le nom du fichier graphe (.json ou .json.zst)
+            try:
+                manifest_content = await self._download_bytes(f"{backup_prefix}/manifest.json")
+                graph_file = _graph_data_file(_decode_json(manifest_content))
+            except Exception as e:
+                manifest_content, graph_file = e, GRAPH_DATA_FILE
+            
+            # Puis les autres fichiers du backup (téléchargés en parallèle)
             json_files = [
-                "manifest.json",
-                "graph_data.json",
+                graph_file,
                 "qdrant_vectors.jsonl",
                 "document_keys.json",
             ]
             
-            for filename in json_files:
-                key = f"{backup_prefix}/{filename}"
-                try:
-                    response = self._storage._client.get_object(
-                        Bucket=self._storage._bucket,
-                        Key=key
-                    )
-                    content = response["Body"].read()
-                    
-                    # Ajouter au tar
-                    info = tarfile.TarInfo(name=f"{archive_dir}/{filename}")
-                    info.size = len(content)
-                    tar.addfile(info, io.BytesIO(content))
-                    
-                    await _log(f"  📁 {filename} ({self._human_size(len(content))})")
-                except Exception as e:
-                    await _log(f"  ⚠️ {filename} manquant: {e}")
+            async def _backup_files():
+                yield "manifest.json", manifest_content
+                async for item in self._fetch_objects(
+                    (f"{backup_prefix}/{filename}", filename) for filename in json_files
+                ):
+                    yield item
+            
+            async for filename, content in _backup_files():
+                if isinstance(content, Exception):
+                    await _log(f"  ⚠️ {filename} manquant: {content}")
+                    continue
+                
+                # Ajouter au tar (compression hors de la boucle d'événements)
+                size = len(content)
+                await asyncio.to_thread(
+                    self._add_tar_member, tar, gz, f"{archive_dir}/{filename}", content
+                )
+                del content
+                
+                for chunk in sink.drain():
+                    archive_size += len(chunk)
+                    yield chunk
+                await _log(f"  📁 {filename} ({self._human_size(size)})")
             
             # Optionnel : inclure les documents originaux
             if include_documents:
                 await _log("📄 Ajout des documents originaux...")
                 
-                doc_keys_text = await self._download_text(
+                # Octets parsés tels quels (orjson), sans passer par une str
+                doc_keys_raw = await self._download_bytes(
                     f"{backup_prefix}/document_keys.json"
                 )
-                doc_keys = json.loads(doc_keys_text) if doc_keys_text.strip() else []
+                doc_keys = _decode_json(doc_keys_raw) if doc_keys_raw.strip() else []
                 
-                for i, doc in enumerate(doc_keys):
-                    key = doc.get("key", "")
-                    filename_orig = doc.get("filename", f"doc_{i}")
-                    if not key:
+                docs = [
+                    (doc["key"], doc.get("filename", f"doc_{i}"))
+                    for i, doc in enumerate(doc_keys) if doc.get("key")
+                ]
+                async for filename_orig, content in self._fetch_objects(docs):
+                    if isinstance(content, Exception):
+                        await _log(f"  ⚠️ {filename_orig}: {content}")
                         continue
                     
-                    try:
-                        response = self._storage._client.get_object(
-                            Bucket=self._storage._bucket,
-                            Key=key
-                        )
-                        content = response["Body"].read()
-                        
-                        info = tarfile.TarInfo(
-                            name=f"{archive_dir}/documents/{filename_orig}"
-                        )
-                        info.size = len(content)
-                        tar.addfile(info, io.BytesIO(content))
-                        
-                        await _log(f"  📄 {filename_orig} ({self._human_size(len(content))})")
-                    except Exception as e:
-                        await _log(f"  ⚠️ {filename_orig}: {e}")
+                    size = len(content)
+                    await asyncio.to_thread(
+                        self._add_tar_member, tar, gz,
+                        f"{archive_dir}/documents/{filename_orig}", content
+                    )
+                    del content
+                    
+                    for chunk in sink.drain():
+                        archive_size += len(chunk)
+                        yield chunk
+                    await _log(f"  📄 {filename_orig} ({self._human_size(size)})")
+        
+        # Fin du flux gzip (blocs de fin tar + trailer gzip)
+        for chunk in sink.drain():
+            archive_size += len(chunk)
+            yield chunk
+        await _log(f"✅ Archive: {self._human_size(archive_size)}")
+    
+    @staticmethod
+    def _add_tar_member(tar, gz, name: str, content: bytes) -> None:
+        """
+        Ajoute un fichier à l'archive puis vide le compresseur gzip.
+        
+        Après le flush, tout ce qui a été compressé est dans le sink (les
+        threads de compression sont au repos) : il peut être vidé sans risque.
+        """
+        info = tarfile.TarInfo(name=name)
+        info.size = len(content)
+        tar.addfile(info, io.BytesIO(content))
+        gz.flush()
+    
+    async def _fetch_objects(self, items) -> AsyncIterator[tuple]:
+        """
+        Télécharge des objets S3 en parallèle et les restitue dans l'ordre.
+        
+        Fenêtre glissante de DOWNLOAD_CONCURRENCY GET (dans des threads) :
+        la mémoire reste bornée quel que soit le nombre d'objets. Un GET en
+        échec produit l'exception au lieu du contenu.
+        
+        Args:
+            items: Itérable de (clé S3, libellé)
+            
+        Yields:
+            (libellé, contenu en bytes ou exception)
+        """
+        client = self._storage._client
+        bucket = self._storage._bucket
+        
+        def _get_object_bytes(key: str) -> bytes:
+            return client.get_object(Bucket=bucket, Key=key)["Body"].read()
         
-        archive_bytes = buf.getvalue()
-        await _log(f"✅ Archive: {self._human_size(len(archive_bytes))}")
+        def _start(item):
+            key, label = item
+            return label, asyncio.ensure_future(asyncio.to_thread(_get_object_bytes, key))
         
-        return archive_bytes
+        items = iter(items)
+        pending = deque(_start(item) for item in islice(items, DOWNLOAD_CONCURRENCY))
+        try:
+            while pending:
+                label, task = pending.popleft()
+                try:
+                    content = await task
+                except Exception as e:
+                    content = e
+                pending.extend(_start(item) for item in islice(items, 1))
+                yield label, content
+        finally:
+            for _, task in pending:
+                task.cancel()
     
     # =========================================================================
     # Restore from archive (tar.gz)
@@ -585,7 +1098,7 @@ class BackupService:
         
         L'archive doit contenir :
         - manifest.json (obligatoire)
-        - graph_data.json (obligatoire)
+        - graph_data.json ou graph_data.json.zst (obligatoire, selon le manifest)
         - qdrant_vectors.jsonl (obligatoire)
         - documents/ (optionnel : fichiers originaux à re-uploader sur S3)
         
@@ -620,200 +1133,370 @@ class BackupService:
         
         await _log(f"Archive reçue: {self._human_size(archive_size)}")
         
-        # === 1. Extraire l'archive en mémoire ===
-        buf = io.BytesIO(archive_bytes)
+        # === 1. Lire l'archive en un seul passage (tar en flux, sans index) ===
+        # download_backup écrit les fichiers JSON du backup avant les documents :
+        # ils sont vérifiés au premier document, puis chaque document est
+        # re-uploadé dès sa lecture (aucun retour en arrière dans l'archive).
+        gz = _open_gzip_reader(archive_bytes)
         try:
-            tar = tarfile.open(fileobj=buf, mode='r:gz')
+            tar = _TarStreamReader(gz)
         except Exception as e:
+            gz.close()
             raise ValueError(f"Archive tar.gz invalide: {e}")
         
-        # Trouver les fichiers dans l'archive (peut être dans un sous-dossier)
-        members = tar.getnames()
-        
-        def _find_member(filename: str) -> Optional[str]:
-            """Trouve un fichier dans l'archive (avec ou sans préfixe dossier)."""
-            for m in members:
-                if m == filename or m.endswith(f"/{filename}"):
-                    return m
-            return None
-        
-        def _read_member(member_name: str) -> bytes:
-            """Lit le contenu d'un membre de l'archive."""
-            f = tar.extractfile(member_name)
-            if f is None:
-                raise ValueError(f"Impossible de lire '{member_name}' dans l'archive")
-            return f.read()
-        
-        # === 2. Lire et vérifier le manifest ===
-        manifest_path = _find_member("manifest.json")
-        if not manifest_path:
-            tar.close()
-            raise ValueError("manifest.json introuvable dans l'archive")
-        
-        manifest = json.loads(_read_member(manifest_path).decode("utf-8"))
-        
-        if manifest.get("version") != BACKUP_FORMAT_VERSION:
-            tar.close()
-            raise ValueError(
-                f"Version de backup incompatible: {manifest.get('version')} "
-                f"(attendue: {BACKUP_FORMAT_VERSION})"
-            )
-        
-        memory_id = manifest.get("memory_id")
-        if not memory_id:
-            tar.close()
-            raise ValueError("memory_id manquant dans le manifest")
-        
-        await _log(f"✅ Manifest OK: mémoire '{memory_id}' "
-                    f"({manifest['stats']['entities']} entités, "
-                    f"{manifest['stats']['qdrant_vectors']} vecteurs)")
-        
-        # Vérifier que la mémoire n'existe pas
-        existing = await self._graph.get_memory(memory_id)
-        if existing:
-            tar.close()
-            raise ValueError(
-                f"La mémoire '{memory_id}' existe déjà. "
-                f"Supprimez-la d'abord avec memory_delete."
+        # Décompression + lecture tar sur un thread (hors boucle asyncio), qui
+        # transmet dans l'ordre : chaque membre validé, les blocs de ses données,
+        # puis None en fin d'archive (ou l'exception levée)
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        slots = threading.Semaphore(ARCHIVE_READAHEAD_ITEMS)  # Borne la mémoire en attente
+        stop = threading.Event()
+        
+        def _put(item) -> None:
+            while not slots.acquire(timeout=0.1):
+                if stop.is_set():
+                    raise asyncio.CancelledError()
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        
+        def _read_archive() -> None:
+            try:
+                # Membres validés au fil de la lecture (tailles, liens, chemins)
+                for member in self._validate_archive_members(tar):
+                    _put(member)
+                    if member.isfile():
+                        while chunk := tar.read(ARCHIVE_READ_CHUNK_SIZE):
+                            _put(chunk)
+                _put(None)
+            except BaseException as e:
+                if not stop.is_set():
+                    _put(e)
+            finally:
+                tar.close()
+                gz.close()
+        
+        pending = 0  # Octets du membre courant pas encore reçus
+        
+        async def _next_item():
+            item = await queue.get()
+            slots.release()
+            if isinstance(item, BaseException):
+                raise item
+            return item
+        
+        async def _members():
+            """Membres de l'archive, en sautant les données non lues du précédent."""
+            nonlocal pending
+            while True:
+                while pending:
+                    pending -= len(await _next_item())
+                member = await _next_item()
+                if member is None:
+                    return
+                pending = member.size if member.isfile() else 0
+                yield member
+        
+        async def _member_chunks():
+            """Blocs de données du membre courant."""
+            nonlocal pending
+            while pending:
+                chunk = await _next_item()
+                pending -= len(chunk)
+                yield chunk
+        
+        async def _read_member() -> bytes:
+            return b"".join([chunk async for chunk in _member_chunks()])
+        
+        backup_files = {}  # manifest.json, graphe, vecteurs, document_keys.json → contenu
+        
+        def _backup_files_ready() -> bool:
+            """Vrai quand tous les fichiers JSON attendus par le manifest sont lus."""
+            if "manifest.json" not in backup_files:
+                return False
+            manifest = _decode_json(backup_files["manifest.json"])
+            expected = [_graph_data_file(manifest), "qdrant_vectors.jsonl"]
+            if "document_keys.json" in manifest.get("files", ()):
+                expected.append("document_keys.json")
+            return all(name in backup_files for name in expected)
+        
+        async def _prepare() -> tuple:
+            """
+            Vérifie manifest, graphe et vecteurs (avant tout upload S3), puis
+            lance leur import en tâche de fond.
+            
+            Returns:
+                (memory_id, filename_to_key, tâche d'import graphe + vecteurs)
+            """
+            # === 2. Lire et vérifier le manifest ===
+            if "manifest.json" not in backup_files:
+                raise ValueError("manifest.json introuvable dans l'archive")
+            
+            manifest = _decode_json(backup_files.pop("manifest.json"))
+            
+            if manifest.get("version") != BACKUP_FORMAT_VERSION:
+                raise ValueError(
+                    f"Version de backup incompatible: {manifest.get('version')} "
+                    f"(attendue: {BACKUP_FORMAT_VERSION})"
+                )
+            
+            memory_id = manifest.get("memory_id")
+            if not memory_id:
+                raise ValueError("memory_id manquant dans le manifest")
+            
+            await _log(f"✅ Manifest OK: mémoire '{memory_id}' "
+                        f"({manifest['stats']['entities']} entités, "
+                        f"{manifest['stats']['qdrant_vectors']} vecteurs)")
+            
+            # Vérifier que la mémoire n'existe pas
+            existing = await self._graph.get_memory(memory_id)
+            if existing:
+                raise ValueError(
+                    f"La mémoire '{memory_id}' existe déjà. "
+                    f"Supprimez-la d'abord avec memory_delete."
+                )
+            
+            # === 3. Lire les données du graphe ===
+            graph_file = _graph_data_file(manifest)
+            graph_raw = backup_files.pop(graph_file, None)
+            if graph_raw is None:
+                raise ValueError(f"{graph_file} introuvable dans l'archive")
+            
+            # Vérifier le checksum (sur le contenu tel que stocké : compact, indenté ou zstd)
+            actual_hash = hashlib.sha256(graph_raw).hexdigest()
+            expected_hash = manifest.get("checksums", {}).get("graph_data")
+            if expected_hash and actual_hash != expected_hash:
+                raise ValueError("Checksum graphe invalide ! Archive corrompue ?")
+            
+            graph_data = _decode_graph_data(graph_file, graph_raw)
+            del graph_raw
+            await _log("✅ Données graphe vérifiées (checksum OK)")
+            
+            # === 4. Lire les vecteurs Qdrant ===
+            qdrant_jsonl = backup_files.pop("qdrant_vectors.jsonl", None)
+            if qdrant_jsonl is None:
+                raise ValueError("qdrant_vectors.jsonl introuvable dans l'archive")
+            
+            # Vérifier le checksum (sur les octets bruts, avant tout parsing)
+            actual_hash = hashlib.sha256(qdrant_jsonl).hexdigest()
+            expected_hash = manifest.get("checksums", {}).get("qdrant_vectors")
+            if expected_hash and actual_hash != expected_hash:
+                raise ValueError("Checksum vecteurs invalide ! Archive corrompue ?")
+            
+            # Points parsés à la demande, pendant l'import (pas de liste intermédiaire)
+            qdrant_points = (
+                _decode_json(line) for line in io.BytesIO(qdrant_jsonl) if not line.isspace()
             )
-        
-        # === 3. Lire les données du graphe ===
-        graph_path = _find_member("graph_data.json")
-        if not graph_path:
-            tar.close()
-            raise ValueError("graph_data.json introuvable dans l'archive")
-        
-        graph_data = json.loads(_read_member(graph_path).decode("utf-8"))
-        
-        # Vérifier le checksum
-        graph_json = json.dumps(graph_data, ensure_ascii=False, indent=2)
-        actual_hash = hashlib.sha256(graph_json.encode()).hexdigest()
-        expected_hash = manifest.get("checksums", {}).get("graph_data")
-        if expected_hash and actual_hash != expected_hash:
-            tar.close()
-            raise ValueError("Checksum graphe invalide ! Archive corrompue ?")
-        
-        await _log("✅ Données graphe vérifiées (checksum OK)")
-        
-        # === 4. Lire les vecteurs Qdrant ===
-        qdrant_path = _find_member("qdrant_vectors.jsonl")
-        if not qdrant_path:
-            tar.close()
-            raise ValueError("qdrant_vectors.jsonl introuvable dans l'archive")
-        
-        qdrant_jsonl = _read_member(qdrant_path).decode("utf-8")
-        qdrant_points = []
-        if qdrant_jsonl.strip():
-            for line in qdrant_jsonl.strip().split("\n"):
-                if line.strip():
-                    qdrant_points.append(json.loads(line))
-        
-        # Vérifier le checksum
-        actual_hash = hashlib.sha256(qdrant_jsonl.encode()).hexdigest()
-        expected_hash = manifest.get("checksums", {}).get("qdrant_vectors")
-        if expected_hash and actual_hash != expected_hash:
-            tar.close()
-            raise ValueError("Checksum vecteurs invalide ! Archive corrompue ?")
-        
-        await _log(f"✅ {len(qdrant_points)} vecteurs chargés (checksum OK)")
-        
-        # === 5. Re-uploader les documents S3 ===
-        await _log("📄 Re-upload des documents sur S3...")
-        
-        # Trouver les fichiers documents/ dans l'archive
-        doc_members = [m for m in members if "/documents/" in m and not m.endswith("/")]
-        
-        # Lire aussi document_keys.json pour les métadonnées (clé S3 originale)
-        doc_keys_path = _find_member("document_keys.json")
-        doc_keys_list = []
-        if doc_keys_path:
-            doc_keys_list = json.loads(_read_member(doc_keys_path).decode("utf-8"))
-        
-        # Construire un mapping filename → key S3 original
-        filename_to_key = {}
-        for dk in doc_keys_list:
-            fn = dk.get("filename", "")
-            key = dk.get("key", "")
-            if fn and key:
-                filename_to_key[fn] = key
-        
-        docs_uploaded = 0
-        docs_skipped = 0
-        
-        for doc_member in doc_members:
-            # Extraire le nom de fichier
-            doc_filename = doc_member.split("/documents/", 1)[-1]
-            if not doc_filename:
-                continue
             
-            # === SÉCURITÉ : anti path-traversal ===
-            # Rejeter les noms contenant ../ ou commençant par /
-            if ".." in doc_filename or doc_filename.startswith("/"):
-                print(f"🔒 [RestoreArchive] Nom de fichier rejeté (path traversal): "
-                      f"'{doc_filename}'", file=sys.stderr)
-                docs_skipped += 1
-                continue
-            # Ne garder que le basename (pas de sous-dossiers inattendus)
-            import os.path as _osp
-            safe_filename = _osp.basename(doc_filename)
-            if safe_filename != doc_filename:
-                print(f"🔒 [RestoreArchive] Nom normalisé: '{doc_filename}' → "
-                      f"'{safe_filename}'", file=sys.stderr)
-                doc_filename = safe_filename
+            await _log("✅ Vecteurs vérifiés (checksum OK)")
+            
+            # Lire aussi document_keys.json pour les métadonnées (clé S3 originale)
+            doc_keys_list = []
+            if "document_keys.json" in backup_files:
+                doc_keys_list = _decode_json(backup_files.pop("document_keys.json"))
+            
+            # Construire un mapping filename → key S3 original
+            filename_to_key = {}
+            for dk in doc_keys_list:
+                fn = dk.get("filename", "")
+                key = dk.get("key", "")
+                if fn and key:
+                    filename_to_key[fn] = key
             
-            # Lire le contenu
-            doc_content = _read_member(doc_member)
+            # === 6+7. Graphe Neo4j et vecteurs Qdrant, en tâche de fond ===
+            # Indépendants des documents : importés pendant leur re-upload
+            await _log("📊 Restauration du graphe Neo4j + 🔢 vecteurs Qdrant (en fond)...")
+            imports = asyncio.ensure_future(
+                self._import_graph_and_vectors(memory_id, graph_data, qdrant_points)
+            )
             
+            await _log("📄 Re-upload des documents sur S3...")
+            return memory_id, filename_to_key, imports
+        
+        storage = self._storage
+        client = storage._client
+        bucket = storage._bucket
+        
+        def _document_metadata(doc_filename: str) -> dict:
+            return {
+                "memory_id": memory_id,
+                "original_filename": storage._sanitize_metadata_value(doc_filename),
+                "restored_from": "archive",
+            }
+        
+        async def _upload_document(doc_filename: str, doc_content: bytes) -> bool:
+            """Re-uploade un document sur S3 (clé d'origine si connue)."""
             # Trouver la clé S3 originale
             s3_key = filename_to_key.get(doc_filename)
             
             if s3_key:
                 # Upload directement avec la clé originale
                 try:
-                    content_type = self._storage._guess_content_type(doc_filename)
-                    self._storage._client.put_object(
-                        Bucket=self._storage._bucket,
-                        Key=s3_key,
-                        Body=doc_content,
-                        ContentType=content_type,
-                        Metadata={
-                            "memory_id": memory_id,
-                            "original_filename": self._storage._sanitize_metadata_value(doc_filename),
-                            "restored_from": "archive",
-                        }
-                    )
-                    docs_uploaded += 1
+                    content_type = storage._guess_content_type(doc_filename)
+                    metadata = _document_metadata(doc_filename)
+                    if len(doc_content) > MULTIPART_PART_SIZE:
+                        # Gros document : multipart, parts envoyées en parallèle
+                        await self._upload_stream(
+                            s3_key, _iter_slices(doc_content, MULTIPART_PART_SIZE),
+                            content_type, metadata
+                        )
+                    else:
+                        await asyncio.to_thread(
+                            client.put_object,
+                            Bucket=bucket,
+                            Key=s3_key,
+                            Body=doc_content,
+                            ContentType=content_type,
+                            Metadata=metadata
+                        )
                     await _log(f"  📄 {doc_filename} ({self._human_size(len(doc_content))})")
+                    return True
                 except Exception as e:
                     await _log(f"  ⚠️ {doc_filename}: {e}")
             else:
                 # Pas de clé S3 connue, upload avec upload_document
                 try:
-                    await self._storage.upload_document(
+                    await storage.upload_document(
                         memory_id=memory_id,
                         filename=doc_filename,
                         content=doc_content
                     )
-                    docs_uploaded += 1
                     await _log(f"  📄 {doc_filename} (nouvelle clé S3)")
+                    return True
                 except Exception as e:
                     await _log(f"  ⚠️ {doc_filename}: {e}")
+            return False
+        
+        async def _stream_document(doc_filename: str, s3_key: str, member: tarfile.TarInfo) -> bool:
+            """
+            Re-uploade un gros document en flux, de l'archive vers S3.
+            
+            Les blocs sont envoyés au fil de leur décompression (regroupés en
+            parts de MULTIPART_PART_SIZE) : le document n'est jamais entièrement
+            en mémoire.
+            """
+            try:
+                await self._upload_stream(
+                    s3_key, _member_chunks(),
+                    storage._guess_content_type(doc_filename), _document_metadata(doc_filename)
+                )
+                await _log(f"  📄 {doc_filename} ({self._human_size(member.size)})")
+                return True
+            except Exception as e:
+                await _log(f"  ⚠️ {doc_filename}: {e}")
+            return False
         
-        if not doc_members:
+        uploads = set()  # Uploads en cours (au plus RESTORE_UPLOAD_CONCURRENCY)
+        
+        async def _submit(doc_filename: str, doc_content: bytes) -> int:
+            """
+            Lance l'upload d'un document en tâche de fond.
+            
+            Si la fenêtre est pleine, attend qu'un upload se termine.
+            
+            Returns:
+                Nombre d'uploads terminés avec succès pendant l'attente
+            """
+            nonlocal uploads
+            uploads.add(asyncio.ensure_future(_upload_document(doc_filename, doc_content)))
+            if len(uploads) < RESTORE_UPLOAD_CONCURRENCY:
+                return 0
+            done, uploads = await asyncio.wait(uploads, return_when=asyncio.FIRST_COMPLETED)
+            return sum(task.result() for task in done)
+        
+        imports = None  # Tâche d'import graphe + vecteurs, lancée par _prepare()
+        deferred = []  # Documents lus avant les fichiers JSON (archive non produite par download_backup)
+        doc_count = 0
+        docs_uploaded = 0
+        docs_skipped = 0
+        
+        reader = loop.run_in_executor(None, _read_archive)
+        try:
+            async for member in _members():
+                if not member.isfile():
+                    continue
+                name = member.name
+                
+                if "/documents/" not in name:
+                    filename = name.rsplit("/", 1)[-1]
+                    if filename in ARCHIVE_BACKUP_FILES and filename not in backup_files:
+                        backup_files[filename] = await _read_member()
+                    continue
+                
+                # === 5. Re-uploader les documents S3 ===
+                doc_count += 1
+                
+                # Extraire le nom de fichier
+                doc_filename = name.split("/documents/", 1)[-1]
+                if not doc_filename:
+                    continue
+                
+                # === SÉCURITÉ : anti path-traversal ===
+                # Rejeter les noms contenant ../ ou commençant par /
+                if ".." in doc_filename or doc_filename.startswith("/"):
+                    print(f"🔒 [RestoreArchive] Nom de fichier rejeté (path traversal): "
+                          f"'{doc_filename}'", file=sys.stderr)
+                    docs_skipped += 1
+                    continue
+                # Ne garder que le basename (pas de sous-dossiers inattendus)
+                if "/" in doc_filename:
+                    safe_filename = os.path.basename(doc_filename)
+                    print(f"🔒 [RestoreArchive] Nom normalisé: '{doc_filename}' → "
+                          f"'{safe_filename}'", file=sys.stderr)
+                    doc_filename = safe_filename
+                
+                # Gros document à clé connue : envoyé en flux (les données non
+                # lues en cas d'échec sont sautées par _members)
+                if imports is None and _backup_files_ready():
+                    memory_id, filename_to_key, imports = await _prepare()
+                if (imports is not None and member.size > MULTIPART_PART_SIZE
+                        and doc_filename in filename_to_key):
+                    docs_uploaded += await _stream_document(
+                        doc_filename, filename_to_key[doc_filename], member
+                    )
+                    continue
+                
+                # Lire le contenu (membre courant du flux)
+                doc_content = await _read_member()
+                
+                if imports is None:
+                    deferred.append((doc_filename, doc_content))
+                    continue
+                
+                docs_uploaded += await _submit(doc_filename, doc_content)
+                del doc_content
+            
+            if imports is None:
+                memory_id, filename_to_key, imports = await _prepare()
+            for doc_filename, doc_content in deferred:
+                docs_uploaded += await _submit(doc_filename, doc_content)
+            del deferred
+            
+            # Attendre les derniers uploads
+            docs_uploaded += sum(await asyncio.gather(*uploads))
+        except BaseException:
+            # Échec pendant la lecture : annuler l'import (qui défait ce qu'il a écrit),
+            # ou défaire la restauration s'il s'était déjà terminé
+            if imports is not None:
+                finished = imports.done() and not imports.cancelled() and imports.exception() is None
+                imports.cancel()
+                await asyncio.gather(imports, return_exceptions=True)
+                if finished:
+                    await self._rollback_restore(memory_id)
+            raise
+        finally:
+            for task in uploads:
+                task.cancel()
+            # Arrêter le thread de lecture (s'il n'a pas fini) et attendre qu'il ferme l'archive
+            stop.set()
+            await asyncio.gather(reader, return_exceptions=True)
+        
+        if not doc_count:
             await _log("⚠️ Aucun document dans l'archive (backup léger)")
         else:
             await _log(f"✅ {docs_uploaded} documents uploadés sur S3")
         
-        tar.close()
-        
-        # === 6. Restaurer le graphe Neo4j ===
-        await _log("📊 Restauration du graphe Neo4j...")
-        graph_counters = await self._graph.import_memory_data(graph_data)
+        # Fin de l'import graphe + vecteurs (lancé avant le re-upload des documents)
+        graph_counters, vectors_imported = await imports
         await _log(f"✅ Graphe restauré: {graph_counters}")
-        
-        # === 7. Restaurer les vecteurs Qdrant ===
-        await _log("🔢 Restauration des vecteurs Qdrant...")
-        vectors_imported = await self._vectors.import_collection(memory_id, qdrant_points)
         await _log(f"✅ Qdrant: {vectors_imported} vecteurs restaurés")
         
         total_elapsed = round(_time.monotonic() - _t0, 1)
@@ -830,6 +1513,67 @@ class BackupService:
             "elapsed_seconds": total_elapsed,
         }
     
+    @staticmethod
+    def read_archive_manifest(archive_bytes: bytes) -> Optional[dict]:
+        """
+        Lit le manifest.json d'une archive tar.gz sans la décompresser en entier.
+        
+        Lecture en flux (_TarStreamReader sur le gzip) arrêtée au premier manifest.json hors documents/ :
+        download_backup l'écrit en tête d'archive, seuls les premiers blocs
+        sont donc décompressés.
+        
+        Returns:
+            Le manifest, ou None si absent ou illisible
+        """
+        try:
+            with _open_gzip_reader(archive_bytes) as gz, _TarStreamReader(gz) as tar:
+                for member in BackupService._validate_archive_members(tar):
+                    name = member.name
+                    if (member.isfile() and "/documents/" not in name
+                            and name.rsplit("/", 1)[-1] == "manifest.json"):
+                        return _decode_json(tar.extractfile(member).read())
+        except (tarfile.TarError, OSError, EOFError, ValueError):
+            pass
+        return None
+    
+    @staticmethod
+    def _validate_archive_members(tar_members) -> Iterator[tarfile.TarInfo]:
+        """
+        Vérifie les membres d'une archive au fil de la lecture, avant extraction.
+        
+        Les tailles déclarées dans les en-têtes tar bornent ce que
+        extractfile().read() peut produire : elles sont plafonnées par membre
+        (MAX_ARCHIVE_MEMBER_SIZE_BYTES) et au total (MAX_ARCHIVE_UNCOMPRESSED_BYTES).
+        Seuls les fichiers et dossiers sont acceptés (pas de liens ni de
+        périphériques), avec des chemins relatifs sans "..".
+        
+        Yields:
+            Membres validés, dans l'ordre de l'archive
+            
+        Raises:
+            ValueError: Si un membre est refusé
+        """
+        total_size = 0
+        for member in tar_members:
+            name = member.name
+            if not (member.isfile() or member.isdir()):
+                raise ValueError(f"Membre d'archive refusé (lien ou fichier spécial): '{name}'")
+            if name.startswith("/") or ".." in name.split("/"):
+                raise ValueError(f"Membre d'archive refusé (path traversal): '{name}'")
+            if member.size > MAX_ARCHIVE_MEMBER_SIZE_BYTES:
+                raise ValueError(
+                    f"Membre d'archive trop volumineux: '{name}' "
+                    f"({BackupService._human_size(member.size)}, "
+                    f"max: {BackupService._human_size(MAX_ARCHIVE_MEMBER_SIZE_BYTES)})"
+                )
+            total_size += member.size
+            if total_size > MAX_ARCHIVE_UNCOMPRESSED_BYTES:
+                raise ValueError(
+                    f"Archive trop volumineuse une fois décompressée "
+                    f"(max: {BackupService._human_size(MAX_ARCHIVE_UNCOMPRESSED_BYTES)})"
+                )
+            yield member
+    
     # =========================================================================
     # Delete backup
     # =========================================================================
@@ -879,56 +1623,459 @@ class BackupService:
         if self._retention <= 0:
             return []
         
-        backups = await self.list_backups(memory_id=memory_id)
+        # Un seul listing : sert à trouver les backups et les clés à supprimer.
+        # Les backups sont datés par leur clé : aucun manifest à télécharger.
+        all_objects = await self._storage.list_all_objects(
+            prefix=f"{self._prefix}/{memory_id}/"
+        )
+        manifest_objects = self._manifest_objects(all_objects)
         
-        if len(backups) <= self._retention:
+        if len(manifest_objects) <= self._retention:
             return []
         
-        # Les backups sont triés par date décroissante, supprimer les plus anciens
-        to_delete = backups[self._retention:]
-        deleted_ids = []
+        # Triés du plus récent au plus ancien, supprimer les plus anciens
+        prefixes = {}
+        for obj in manifest_objects[self._retention:]:
+            bid = f"{memory_id}/{obj['key'].rsplit('/', 2)[-2]}"
+            try:
+                prefixes[f"{self._backup_s3_prefix(*self._validate_backup_id(bid))}/"] = bid
+            except ValueError as e:
+                print(f"⚠️ [Retention] {e}", file=sys.stderr)
+        if not prefixes:
+            return []
         
-        for backup in to_delete:
-            bid = backup.get("backup_id", "")
-            if bid:
-                try:
-                    await self.delete_backup(bid)
-                    deleted_ids.append(bid)
-                except Exception as e:
-                    print(f"⚠️ [Retention] Erreur suppression {bid}: {e}",
-                          file=sys.stderr)
+        keys = [
+            obj["key"] for obj in all_objects
+            if obj["key"][:obj["key"].rfind("/") + 1] in prefixes
+        ]
         
+        # Toutes les clés en quelques requêtes DeleteObjects (1000 clés par lot)
+        try:
+            result = await self._storage.bulk_delete_keys(keys)
+        except Exception as e:
+            print(f"⚠️ [Retention] Erreur suppression: {e}", file=sys.stderr)
+            return []
+        if result["error_count"]:
+            print(f"⚠️ [Retention] {result['error_count']} fichier(s) non supprimé(s)",
+                  file=sys.stderr)
+        
+        deleted_ids = list(prefixes.values())
+        print(f"🗑️ [Backup] Rétention: {', '.join(deleted_ids)} "
+              f"({result['deleted_count']} fichiers)", file=sys.stderr)
         return deleted_ids
     
     # =========================================================================
     # Helpers
     # =========================================================================
     
+    @staticmethod
+    async def _iter_jsonl(
+        records: AsyncIterator[dict],
+        counters: Dict[str, int],
+        counter_key: str
+    ) -> AsyncIterator[bytes]:
+        """
+        Sérialise des enregistrements en JSONL, par blocs d'environ SERIALIZE_BLOCK_SIZE.
+        
+        Les lignes sont écrites directement dans un bloc (pas de liste de lignes
+        ni de join) : le hash et le buffer d'upload sont mis à jour une fois par
+        bloc au lieu d'une fois par point.
+        Lignes séparées par un saut de ligne, sans saut de ligne final : même
+        contenu (et donc même checksum) qu'un join des lignes.
+        counters[counter_key] compte les lignes produites.
+        """
+        block = bytearray()
+        count = 0
+        async for record in records:
+            if count:
+                block += b"\n"
+            block += _encode_json(record)
+            count += 1
+            if len(block) >= SERIALIZE_BLOCK_SIZE:
+                counters[counter_key] = count
+                yield bytes(block)
+                block.clear()
+        counters[counter_key] = count
+        if block:
+            yield bytes(block)
+    
+    async def _iter_graph_json(
+        self,
+        memory_id: str,
+        counters: Dict[str, int],
+        documents: List[dict]
+    ) -> AsyncIterator[bytes]:
+        """
+        Sérialise l'export Neo4j en un document JSON compact, au fil de l'eau.
+        
+        Produit {"memory": {...}, "documents": [...], "entities": [...],
+        "relations": [...], "mentions": [...]} à partir du flux de
+        export_memory_data() ; une section vide donne une liste vide.
+        counters compte les enregistrements par section et documents
+        reçoit les nœuds Document.
+        """
+        pending = list(GRAPH_SECTIONS)  # Sections pas encore ouvertes
+        current = None
+        first = True
+        
+        yield b"{"
+        async for section, record in self._graph.export_memory_data(memory_id):
+            if section == "memory":
+                yield b'"memory":' + _encode_json(record)
+                continue
+            if section != current:
+                # Fermer la section courante et émettre les sections sautées (vides)
+                head = b"]" if current else b""
+                while pending[0] != section:
+                    head += b',"' + pending.pop(0).encode() + b'":[]'
+                pending.pop(0)
+                yield head + b',"' + section.encode() + b'":['
+                current = section
+                first = True
+            if section == "documents":
+                documents.append(record)
+            counters[section] += 1
+            line = _encode_json(record)
+            yield line if first else b"," + line
+            first = False
+        
+        tail = b"]" if current else b""
+        for section in pending:
+            tail += b',"' + section.encode() + b'":[]'
+        yield tail + b"}"
+    
+    @staticmethod
+    async def _iter_zstd(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        """
+        Compresse un flux de blocs en une trame zstd (niveau ZSTD_LEVEL).
+        
+        Le compresseur garde ses propres tampons : seuls les blocs compressés
+        non vides sont produits, puis la fin de trame.
+        """
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1).compressobj()
+        async for chunk in chunks:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
+    
+    def _checksum_args(self, sha256_hex: str) -> Dict[str, str]:
+        """
+        Arguments put_object transmettant un SHA-256 déjà calculé (BACKUP_S3_CHECKSUMS).
+        
+        S3 vérifie alors l'intégrité à la réception sans que le SDK ne re-hashe
+        le corps. Désactivé par défaut : Dell ECS ne gère pas les checksums
+        "flexibles" (d'où AWS_REQUEST_CHECKSUM_CALCULATION=when_required).
+        """
+        if not self._send_checksums:
+            return {}
+        return {"ChecksumSHA256": base64.b64encode(bytes.fromhex(sha256_hex)).decode("ascii")}
+    
+    async def _upload_stream(
+        self,
+        key: str,
+        chunks: AsyncIterator[bytes],
+        content_type: str,
+        metadata: Dict[str, str]
+    ) -> tuple:
+        """
+        Upload un flux de bytes sur S3 sans le matérialiser, en calculant son SHA-256.
+        
+        Les chunks sont regroupés en parts de MULTIPART_PART_SIZE envoyées en
+        multipart upload (MULTIPART_CONCURRENCY parts en vol au maximum). Un flux
+        plus petit qu'une part est envoyé en un seul put_object.
+        
+        Returns:
+            (sha256 hexadécimal, taille en bytes)
+        """
+        client = self._storage._client
+        bucket = self._storage._bucket
+        digest = hashlib.sha256()
+        size = 0
+        buf = bytearray()
+        upload_id = None
+        executor = None
+        parts = []      # Futures des parts, dans l'ordre des PartNumber
+        completed = 0   # Nombre de parts déjà attendues
+        
+        def _upload_part(part_number: int, body: bytes) -> dict:
+            response = client.upload_part(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body
+            )
+            return {"PartNumber": part_number, "ETag": response["ETag"]}
+        
+        def _abort_upload() -> None:
+            # Attend les parts en vol (plusieurs MB chacune) puis abandonne
+            # l'upload : appels bloquants, exécutés hors de la boucle d'événements
+            executor.shutdown(wait=True, cancel_futures=True)
+            try:
+                client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+            except Exception as e:
+                print(f"⚠️ [Backup] Abandon multipart impossible ({key}): {e}",
+                      file=sys.stderr)
+        
+        try:
+            async for chunk in chunks:
+                digest.update(chunk)
+                size += len(chunk)
+                buf += chunk
+                if len(buf) < MULTIPART_PART_SIZE:
+                    continue
+                
+                if upload_id is None:
+                    upload_id = (await asyncio.to_thread(
+                        client.create_multipart_upload,
+                        Bucket=bucket,
+                        Key=key,
+                        ContentType=content_type,
+                        Metadata=metadata
+                    ))["UploadId"]
+                    executor = ThreadPoolExecutor(max_workers=MULTIPART_CONCURRENCY)
+                
+                # Borner les parts en vol (donc la mémoire) avant d'en lancer une nouvelle
+                if len(parts) - completed >= MULTIPART_CONCURRENCY:
+                    await parts[completed]
+                    completed += 1
+                parts.append(asyncio.wrap_future(
+                    executor.submit(_upload_part, len(parts) + 1, bytes(buf))
+                ))
+                buf.clear()
+            
+            if upload_id is None:
+                await asyncio.to_thread(
+                    client.put_object,
+                    Bucket=bucket,
+                    Key=key,
+                    Body=bytes(buf),
+                    ContentType=content_type,
+                    Metadata=metadata,
+                    **self._checksum_args(digest.hexdigest())
+                )
+                return digest.hexdigest(), size
+            
+            if buf:
+                parts.append(asyncio.wrap_future(
+                    executor.submit(_upload_part, len(parts) + 1, bytes(buf))
+                ))
+            completed_parts = list(await asyncio.gather(*parts))
+            await asyncio.to_thread(
+                client.complete_multipart_upload,
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": completed_parts}
+            )
+            return digest.hexdigest(), size
+        except BaseException:
+            if upload_id is not None:
+                try:
+                    await asyncio.to_thread(_abort_upload)
+                except BaseException:
+                    # Nouvelle annulation pendant l'attente : le thread termine
+                    # l'abandon seul, l'exception d'origine est relancée
+                    pass
+            raise
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+    
+    async def _discard_uploads(self, uploads: Dict[str, asyncio.Future]) -> None:
+        """
+        Abandonne des uploads _upload_stream lancés en parallèle, après un échec.
+        
+        Les uploads encore en cours sont annulés (leur multipart est abandonné
+        par _upload_stream) ; les objets déjà complets sont supprimés.
+        
+        Args:
+            uploads: Clé S3 → tâche d'upload
+        """
+        for task in uploads.values():
+            task.cancel()
+        # Attendre la fin des annulations (et récupérer les exceptions)
+        await asyncio.gather(*uploads.values(), return_exceptions=True)
+        
+        client = self._storage._client
+        bucket = self._storage._bucket
+        for key, task in uploads.items():
+            if task.cancelled() or task.exception() is not None:
+                continue
+            try:
+                await asyncio.to_thread(client.delete_object, Bucket=bucket, Key=key)
+                print(f"🗑️ [Backup] Fichier incomplet supprimé: {key}", file=sys.stderr)
+            except Exception as e:
+                print(f"⚠️ [Backup] Suppression impossible ({key}): {e}", file=sys.stderr)
+    
+    async def _download_hashed(self, key: str) -> tuple:
+        """
+        Télécharge un fichier S3 et calcule son SHA-256 au fil des blocs reçus.
+        
+        Le hash porte sur les octets tels que stockés (pas de décodage ni de
+        ré-encodage) et se fait pendant le transfert, sans second passage.
+        
+        Returns:
+            (contenu en bytearray, sha256 hexadécimal)
+        """
+        client = self._storage._client
+        bucket = self._storage._bucket
+        
+        def _read() -> tuple:
+            digest = hashlib.sha256()
+            buf = bytearray()
+            body = client.get_object(Bucket=bucket, Key=key)["Body"]
+            for chunk in body.iter_chunks(DOWNLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                buf += chunk
+            return buf, digest.hexdigest()
+        
+        try:
+            return await asyncio.to_thread(_read)
+        except Exception as e:
+            raise FileNotFoundError(f"Fichier S3 non trouvé: {key} ({e})")
+    
+    async def _iter_s3_lines(self, key: str, digest) -> AsyncIterator[bytes]:
+        """
+        Lit un fichier JSONL S3 ligne par ligne, sans le charger en entier.
+        
+        Le corps de la réponse est lu par blocs de DOWNLOAD_CHUNK_SIZE (dans un
+        thread) ; chaque bloc met à jour digest (hashlib) avant découpage.
+        Les lignes vides sont ignorées.
+        """
+        client = self._storage._client
+        try:
+            response = await asyncio.to_thread(
+                client.get_object, Bucket=self._storage._bucket, Key=key
+            )
+        except Exception as e:
+            raise FileNotFoundError(f"Fichier S3 non trouvé: {key} ({e})")
+        
+        body = response["Body"]
+        pending = b""
+        try:
+            while True:
+                chunk = await asyncio.to_thread(body.read, DOWNLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                # Découpage par find() sur le bloc : ni concaténation du bloc
+                # entier avec le reste précédent, ni liste de toutes ses lignes
+                end = chunk.find(b"\n")
+                if end < 0:
+                    pending += chunk
+                    continue
+                line = pending + chunk[:end]
+                if line and not line.isspace():
+                    yield line
+                start = end + 1
+                while True:
+                    end = chunk.find(b"\n", start)
+                    if end < 0:
+                        break
+                    if end > start:
+                        line = chunk[start:end]
+                        if not line.isspace():
+                            yield line
+                    start = end + 1
+                pending = chunk[start:]
+            if pending and not pending.isspace():
+                yield pending
+        finally:
+            body.close()
+    
+    async def _import_graph_and_vectors(self, memory_id: str, graph_data: dict, points) -> tuple:
+        """
+        Importe le graphe (Neo4j) et les vecteurs (Qdrant) en parallèle.
+        
+        Les deux bases sont indépendantes : les imports se recouvrent au lieu
+        de s'enchaîner. Si l'un échoue, l'autre est annulé et la restauration
+        est défaite — sauf si le graphe a refusé l'import (ValueError : la
+        mémoire existe déjà), pour ne pas toucher à une mémoire existante.
+        
+        Returns:
+            (compteurs du graphe, nombre de vecteurs importés)
+        """
+        graph_task = asyncio.ensure_future(self._graph.import_memory_data(graph_data))
+        vectors_task = asyncio.ensure_future(self._vectors.import_collection(memory_id, points))
+        try:
+            return tuple(await asyncio.gather(graph_task, vectors_task))
+        except BaseException:
+            for task in (graph_task, vectors_task):
+                task.cancel()
+            await asyncio.gather(graph_task, vectors_task, return_exceptions=True)
+            if not (graph_task.done() and not graph_task.cancelled()
+                    and isinstance(graph_task.exception(), ValueError)):
+                await self._rollback_restore(memory_id)
+            raise
+    
+    async def _rollback_restore(self, memory_id: str) -> None:
+        """Annule une restauration partielle (graphe + collection Qdrant)."""
+        print(f"↩️ [Restore] Annulation de la restauration de '{memory_id}'", file=sys.stderr)
+        try:
+            await self._vectors.delete_collection(memory_id)
+        except Exception as e:
+            print(f"⚠️ [Restore] Suppression collection Qdrant impossible: {e}", file=sys.stderr)
+        try:
+            await self._graph.delete_memory(memory_id)
+        except Exception as e:
+            print(f"⚠️ [Restore] Suppression du graphe impossible: {e}", file=sys.stderr)
+    
     async def _download_json(self, key: str) -> dict:
-        """Télécharge et parse un fichier JSON depuis S3."""
-        text = await self._download_text(key)
-        return json.loads(text)
+        """Télécharge et parse un fichier JSON depuis S3 (orjson sur les octets, sans décodage)."""
+        return _decode_json(await self._download_bytes(key))
     
-    async def _download_text(self, key: str) -> str:
-        """Télécharge un fichier texte depuis S3."""
+    async def _download_bytes(self, key: str) -> bytes:
+        """Télécharge un fichier depuis S3, tel que stocké."""
+        try:
+            return await asyncio.to_thread(self._read_object, key)
+        except Exception as e:
+            raise FileNotFoundError(f"Fichier S3 non trouvé: {key} ({e})")
+    
+    def _read_object(self, key: str) -> bytes:
+        """
+        GET S3 synchrone du contenu complet d'un objet (utilisable via asyncio.to_thread).
+        
+        Les petits objets sont gardés en cache avec leur ETag : les lectures
+        suivantes passent If-None-Match et réutilisent le contenu sur un 304.
+        """
+        with self._object_cache_lock:
+            cached = self._object_cache.get(key)
+        params = {"IfNoneMatch": cached[0]} if cached else {}
         try:
             response = self._storage._client.get_object(
                 Bucket=self._storage._bucket,
-                Key=key
+                Key=key,
+                **params
             )
-            return response["Body"].read().decode("utf-8")
         except Exception as e:
-            raise FileNotFoundError(f"Fichier S3 non trouvé: {key} ({e})")
+            code = getattr(e, "response", {}).get("Error", {}).get("Code")
+            if cached and code in ("304", "NotModified"):
+                with self._object_cache_lock:
+                    if key in self._object_cache:
+                        self._object_cache.move_to_end(key)
+                return cached[1]
+            raise
+        
+        content = response["Body"].read()
+        etag = response.get("ETag")
+        with self._object_cache_lock:
+            if etag and len(content) <= OBJECT_CACHE_MAX_OBJECT_SIZE:
+                self._object_cache[key] = (etag, content)
+                self._object_cache.move_to_end(key)
+                while len(self._object_cache) > OBJECT_CACHE_MAX_ENTRIES:
+                    self._object_cache.popitem(last=False)
+            else:
+                self._object_cache.pop(key, None)
+        return content
     
     @staticmethod
     def _human_size(size_bytes: int) -> str:
         """Convertit des bytes en taille lisible."""
-        size = float(size_bytes)
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
+        # Unité choisie par le nombre de bits (tranches de 10 bits = 1024), sans boucle
+        exponent = min((max(int(size_bytes), 1).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (10 * exponent)):.1f} {_SIZE_UNITS[exponent]}"
 
 
 # Singleton
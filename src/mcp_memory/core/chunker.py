@@ -17,8 +17,11 @@ Best practices implémentées :
 - Overlap at sentence boundaries : l'overlap ne coupe pas les phrases
 """
 
+import logging
 import re
 import sys
+from bisect import bisect_right
+from itertools import accumulate, chain, islice
 from typing import Optional, List, Tuple
 from dataclasses import dataclass, field
 
@@ -26,6 +29,8 @@ from ..config import get_settings
 from .models import Chunk
 
 
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # Patterns de détection de structure
 # =============================================================================
@@ -54,13 +59,72 @@ UPPERCASE_TITLE_PATTERN = re.compile(
     re.MULTILINE
 )
 
+# Les quatre motifs de structure, dans l'ordre de priorité de _detect_sections
+_STRUCTURE_PATTERNS = (
+    ("articles", ARTICLE_PATTERN),
+    ("markdown", MARKDOWN_HEADER_PATTERN),
+    ("numbered", NUMBERED_SECTION_PATTERN),
+    ("uppercase", UPPERCASE_TITLE_PATTERN),
+)
+
+
+def _compile_structure_re(patterns) -> re.Pattern:
+    """
+    Balayage unique du texte pour plusieurs motifs de structure.
+    
+    À chaque début de ligne, chaque motif est essayé dans un lookahead
+    optionnel (capture indépendante des autres) ; la position n'est retenue
+    que si au moins un motif a reconnu.
+    """
+    return re.compile(
+        "^"
+        + "".join(f"(?=(?P<{name}>{pattern.pattern[1:]}))?" for name, pattern in patterns)
+        + "".join(f"(?({name})|" for name, _ in patterns)
+        + "(?!)" + ")" * len(patterns),
+        re.MULTILINE
+    )
+
+
+_STRUCTURE_RE = _compile_structure_re(_STRUCTURE_PATTERNS)
+
+# Variante sans les headers Markdown, pour les textes sans aucun '#' (test
+# quasi gratuit, alors que le lookahead est tenté à chaque début de ligne)
+_STRUCTURE_PATTERNS_NO_MARKDOWN = tuple(
+    (name, pattern) for name, pattern in _STRUCTURE_PATTERNS if name != "markdown"
+)
+_STRUCTURE_RE_NO_MARKDOWN = _compile_structure_re(_STRUCTURE_PATTERNS_NO_MARKDOWN)
+
 # Séparateurs de phrases (pour le split au niveau phrase)
 SENTENCE_ENDINGS = re.compile(
     r'(?<=[.!?])\s+(?=[A-ZÀÂÄÉÈÊËÏÎÔÙÛÜŸ])'
 )
 
+# Éléments de liste en début de ligne : puce, numéro ("1." / "1)"), lettre ("a." / "a)"),
+# en une seule alternation (un seul appel par ligne)
+_LIST_ITEM_RE = re.compile(r'^(?:[-•●▪]|\d+[.)]|[a-z][.)])\s+')
+
+# Ligne terminée par une ponctuation de fin de phrase
+_LINE_TERMINATOR_RE = re.compile(r'[.!?]\s*$')
 
-@dataclass
+# Séparateur de paragraphes (ligne vide, éventuellement avec des espaces)
+_BLANK_LINE_RE = re.compile(r'\n\s*\n')
+
+
+def _trim_span(text: str, start: int, end: int) -> str:
+    """
+    Équivalent de text[start:end].strip(), sans la copie intermédiaire.
+    
+    Les bornes sont resserrées sur les blancs avant de découper : une seule
+    chaîne allouée au lieu de deux.
+    """
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return text[start:end]
+
+
+@dataclass(slots=True)
 class TextSection:
     """Section détectée dans le document."""
     title: str
@@ -70,13 +134,13 @@ class TextSection:
     start_pos: int = 0
 
 
-@dataclass 
+@dataclass(slots=True)
 class SentenceGroup:
     """Groupe de phrases formant un chunk potentiel."""
     sentences: List[str] = field(default_factory=list)
     section_title: Optional[str] = None
     article_number: Optional[str] = None
-    heading_hierarchy: List[str] = field(default_factory=list)
+    heading_hierarchy: Tuple[str, ...] = ()
     
     @property
     def text(self) -> str:
@@ -85,7 +149,24 @@ class SentenceGroup:
     @property
     def token_estimate(self) -> int:
         """Estimation grossière : ~1 token = ~4 caractères en français."""
-        return len(self.text) // 4
+        # Longueur de self.text calculée sans construire le texte joint
+        sentences = self.sentences
+        if not sentences:
+            return 0
+        return (sum(map(len, sentences)) + len(sentences) - 1) // 4
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkMetadata:
+    """
+    Métadonnées de section d'un chunk.
+    
+    Construites une fois par groupe de phrases et partagées par tous les
+    chunks issus de ce groupe.
+    """
+    section_title: Optional[str] = None
+    article_number: Optional[str] = None
+    heading_hierarchy: Tuple[str, ...] = ()
 
 
 class SemanticChunker:
@@ -118,49 +199,50 @@ class SemanticChunker:
         if not text or not text.strip():
             return []
         
-        # Normaliser les fins de ligne
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
+        # Normaliser les fins de ligne (aucune copie si le texte n'a pas de \r)
+        if '\r' in text:
+            text = text.replace('\r\n', '\n')
+            if '\r' in text:
+                text = text.replace('\r', '\n')
         
         # === PASSE 1 : Détecter la structure ===
         sections = self._detect_sections(text)
         
         total_chars = sum(len(s.content) for s in sections)
         print(f"📐 [Chunker] PASSE 1/3 — {len(sections)} sections détectées dans '{filename}' ({total_chars} chars)", file=sys.stderr)
-        sys.stderr.flush()
-        for i, s in enumerate(sections):
-            art = f" (Art. {s.article_number})" if s.article_number else ""
-            print(f"   📄 [{i+1}/{len(sections)}] {s.title[:70]}{art} — {len(s.content)} chars, level={s.level}", file=sys.stderr)
-        sys.stderr.flush()
+        # Détail par section : une ligne par section, uniquement en debug
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[Chunker] Sections de '%s' :\n%s", filename, "\n".join(
+                f"   📄 [{i+1}/{len(sections)}] {s.title[:70]}"
+                f"{f' (Art. {s.article_number})' if s.article_number else ''}"
+                f" — {len(s.content)} chars, level={s.level}"
+                for i, s in enumerate(sections)
+            ))
         
         # === PASSE 2 : Découper chaque section en phrases ===
-        print(f"📐 [Chunker] PASSE 2/3 — Découpage en phrases...", file=sys.stderr)
-        sys.stderr.flush()
         sentence_groups = self._sections_to_sentence_groups(sections)
         total_sentences = sum(len(g.sentences) for g in sentence_groups)
         print(f"📐 [Chunker] PASSE 2/3 — {total_sentences} phrases dans {len(sentence_groups)} groupes", file=sys.stderr)
-        sys.stderr.flush()
         
         # === PASSE 3 : Regrouper les phrases en chunks avec overlap ===
-        print(f"📐 [Chunker] PASSE 3/3 — Fusion en chunks (cible: {self._chunk_size} tokens, overlap: {self._chunk_overlap})...", file=sys.stderr)
-        sys.stderr.flush()
         raw_chunks = self._merge_into_chunks(sentence_groups)
         print(f"📐 [Chunker] PASSE 3/3 — {len(raw_chunks)} chunks bruts générés", file=sys.stderr)
-        sys.stderr.flush()
         
         # === Finaliser les Chunk avec métadonnées ===
         total = len(raw_chunks)
         chunks = []
-        for i, (group, chunk_text) in enumerate(raw_chunks):
+        for i, (metadata, chunk_text) in enumerate(raw_chunks):
+            chunk_text = chunk_text.strip()
             chunk = Chunk(
-                text=chunk_text.strip(),
+                text=chunk_text,
                 index=i,
                 total_chunks=total,
                 filename=filename,
-                section_title=group.section_title,
-                article_number=group.article_number,
-                heading_hierarchy=group.heading_hierarchy,
-                char_count=len(chunk_text.strip()),
-                token_estimate=len(chunk_text.strip()) // 4
+                section_title=metadata.section_title,
+                article_number=metadata.article_number,
+                heading_hierarchy=metadata.heading_hierarchy,
+                char_count=len(chunk_text),
+                token_estimate=len(chunk_text) // 4
             )
             chunks.append(chunk)
         
@@ -186,41 +268,76 @@ class SemanticChunker:
         
         Si aucune structure détectée, retourne le texte entier comme section unique.
         """
-        # Essayer de détecter des articles numérotés (documents juridiques)
-        sections = self._detect_articles(text)
-        if sections and len(sections) > 1:
-            return sections
-        
-        # Essayer les headers Markdown
-        sections = self._detect_markdown_headers(text)
-        if sections and len(sections) > 1:
-            return sections
-        
-        # Essayer la numérotation hiérarchique
-        sections = self._detect_numbered_sections(text)
-        if sections and len(sections) > 1:
-            return sections
-        
-        # Essayer les titres en majuscules
-        sections = self._detect_uppercase_titles(text)
-        if sections and len(sections) > 1:
-            return sections
+        # Les correspondances des quatre motifs sont relevées en un seul passage
+        matches = self._scan_structure(text)
+        
+        for name, detect in (
+            ("articles", self._detect_articles),            # Articles numérotés (juridique)
+            ("markdown", self._detect_markdown_headers),    # Headers Markdown
+            ("numbered", self._detect_numbered_sections),   # Numérotation hiérarchique
+            ("uppercase", self._detect_uppercase_titles),   # Titres en majuscules
+        ):
+            sections = detect(text, matches[name])
+            if sections and len(sections) > 1:
+                return sections
         
         # Fallback : découper par double saut de ligne (paragraphes)
         sections = self._detect_paragraphs(text)
         return sections
     
-    def _detect_articles(self, text: str) -> List[TextSection]:
+    @staticmethod
+    def _scan_structure(text: str) -> dict:
+        """
+        Relève en un passage les correspondances de chaque motif de structure.
+        
+        Résultat identique à un finditer par motif : une correspondance n'est
+        gardée que si elle commence après la fin de la précédente du même motif.
+        
+        Seules les positions sont gardées : les re.Match sont recréés un par
+        un par _iter_sections, et seulement pour le motif finalement utilisé.
+        
+        Un texte sans '#' ne peut pas contenir de header Markdown : ce motif
+        est alors retiré du balayage.
+        
+        Returns:
+            Dict nom du motif → positions de début des correspondances
+        """
+        found = {name: [] for name, _ in _STRUCTURE_PATTERNS}
+        ends = dict.fromkeys(found, 0)
+        if "#" in text:
+            patterns, structure_re = _STRUCTURE_PATTERNS, _STRUCTURE_RE
+        else:
+            patterns, structure_re = _STRUCTURE_PATTERNS_NO_MARKDOWN, _STRUCTURE_RE_NO_MARKDOWN
+        for structure_match in structure_re.finditer(text):
+            start = structure_match.start()
+            for name, _ in patterns:
+                if structure_match.group(name) is not None and start >= ends[name]:
+                    found[name].append(start)
+                    ends[name] = structure_match.end(name)
+        return found
+    
+    @staticmethod
+    def _iter_sections(pattern: re.Pattern, text: str, starts: List[int]):
+        """
+        (correspondance, fin de section) pour chaque début de section.
+        
+        La section s'arrête au début de la suivante (ou à la fin du texte) ;
+        une seule correspondance est en vie à la fois.
+        """
+        next_starts = chain(islice(starts, 1, None), (len(text),))
+        for start, end in zip(starts, next_starts):
+            yield pattern.match(text, start), end
+    
+    def _detect_articles(self, text: str, starts: List[int]) -> List[TextSection]:
         """Détecte les articles numérotés (documents juridiques)."""
-        matches = list(ARTICLE_PATTERN.finditer(text))
-        if not matches:
+        if not starts:
             return []
         
         sections = []
         
         # Texte avant le premier article (préambule)
-        if matches[0].start() > 0:
-            preamble = text[:matches[0].start()].strip()
+        if starts[0] > 0:
+            preamble = _trim_span(text, 0, starts[0])
             if preamble:
                 sections.append(TextSection(
                     title="Préambule",
@@ -230,18 +347,17 @@ class SemanticChunker:
                 ))
         
         # Chaque article
-        for i, match in enumerate(matches):
+        for match, end in self._iter_sections(ARTICLE_PATTERN, text, starts):
             article_num = match.group(1).strip()
             start = match.start()
-            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
             
             # Le titre de l'article = la première ligne
             first_line_end = text.find('\n', start)
             if first_line_end == -1:
                 first_line_end = end
-            title = text[start:first_line_end].strip()
+            title = _trim_span(text, start, first_line_end)
             
-            content = text[start:end].strip()
+            content = _trim_span(text, start, end)
             
             sections.append(TextSection(
                 title=title,
@@ -253,17 +369,16 @@ class SemanticChunker:
         
         return sections
     
-    def _detect_markdown_headers(self, text: str) -> List[TextSection]:
+    def _detect_markdown_headers(self, text: str, starts: List[int]) -> List[TextSection]:
         """Détecte les headers Markdown (## Titre)."""
-        matches = list(MARKDOWN_HEADER_PATTERN.finditer(text))
-        if not matches:
+        if not starts:
             return []
         
         sections = []
         
         # Texte avant le premier header
-        if matches[0].start() > 0:
-            preamble = text[:matches[0].start()].strip()
+        if starts[0] > 0:
+            preamble = _trim_span(text, 0, starts[0])
             if preamble:
                 sections.append(TextSection(
                     title="Introduction",
@@ -272,12 +387,11 @@ class SemanticChunker:
                     start_pos=0
                 ))
         
-        for i, match in enumerate(matches):
+        for match, end in self._iter_sections(MARKDOWN_HEADER_PATTERN, text, starts):
             level = len(match.group(1))  # Nombre de #
             title = match.group(2).strip()
             start = match.start()
-            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-            content = text[start:end].strip()
+            content = _trim_span(text, start, end)
             
             sections.append(TextSection(
                 title=title,
@@ -288,17 +402,16 @@ class SemanticChunker:
         
         return sections
     
-    def _detect_numbered_sections(self, text: str) -> List[TextSection]:
+    def _detect_numbered_sections(self, text: str, starts: List[int]) -> List[TextSection]:
         """Détecte les sections numérotées (1.1, 1.1.1, etc.)."""
-        matches = list(NUMBERED_SECTION_PATTERN.finditer(text))
-        if not matches:
+        if not starts:
             return []
         
         sections = []
         
         # Texte avant la première section
-        if matches[0].start() > 0:
-            preamble = text[:matches[0].start()].strip()
+        if starts[0] > 0:
+            preamble = _trim_span(text, 0, starts[0])
             if preamble:
                 sections.append(TextSection(
                     title="Introduction",
@@ -307,19 +420,18 @@ class SemanticChunker:
                     start_pos=0
                 ))
         
-        for i, match in enumerate(matches):
+        for match, end in self._iter_sections(NUMBERED_SECTION_PATTERN, text, starts):
             num = match.group(1)
             level = num.count('.')  # 1.1 = level 1, 1.1.1 = level 2
             start = match.start()
-            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
             
             # Titre = première ligne
             first_line_end = text.find('\n', start)
             if first_line_end == -1 or first_line_end > end:
                 first_line_end = end
-            title = text[start:first_line_end].strip()
+            title = _trim_span(text, start, first_line_end)
             
-            content = text[start:end].strip()
+            content = _trim_span(text, start, end)
             
             sections.append(TextSection(
                 title=title,
@@ -331,17 +443,16 @@ class SemanticChunker:
         
         return sections
     
-    def _detect_uppercase_titles(self, text: str) -> List[TextSection]:
+    def _detect_uppercase_titles(self, text: str, starts: List[int]) -> List[TextSection]:
         """Détecte les titres en majuscules."""
-        matches = list(UPPERCASE_TITLE_PATTERN.finditer(text))
-        if not matches:
+        if not starts:
             return []
         
         sections = []
         
         # Texte avant le premier titre
-        if matches[0].start() > 0:
-            preamble = text[:matches[0].start()].strip()
+        if starts[0] > 0:
+            preamble = _trim_span(text, 0, starts[0])
             if preamble:
                 sections.append(TextSection(
                     title="Introduction",
@@ -350,11 +461,10 @@ class SemanticChunker:
                     start_pos=0
                 ))
         
-        for i, match in enumerate(matches):
+        for match, end in self._iter_sections(UPPERCASE_TITLE_PATTERN, text, starts):
             title = match.group(1).strip()
             start = match.start()
-            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-            content = text[start:end].strip()
+            content = _trim_span(text, start, end)
             
             sections.append(TextSection(
                 title=title,
@@ -367,7 +477,7 @@ class SemanticChunker:
     
     def _detect_paragraphs(self, text: str) -> List[TextSection]:
         """Fallback : découpe par double saut de ligne."""
-        paragraphs = re.split(r'\n\s*\n', text)
+        paragraphs = _BLANK_LINE_RE.split(text)
         sections = []
         
         for i, para in enumerate(paragraphs):
@@ -399,14 +509,14 @@ class SemanticChunker:
         Les phrases sont regroupées avec les métadonnées de leur section.
         """
         groups = []
-        heading_stack: List[str] = []  # Pile de titres pour la hiérarchie
+        # Pile de titres pour la hiérarchie. Tuple immuable : chaque groupe
+        # garde une référence à la pile courante, sans copie
+        heading_stack: Tuple[str, ...] = ()
         
         for section in sections:
             # Maintenir la hiérarchie des titres
             # On enlève les titres de même niveau ou supérieur
-            while len(heading_stack) > section.level:
-                heading_stack.pop()
-            heading_stack.append(section.title)
+            heading_stack = heading_stack[:section.level] + (section.title,)
             
             # Découper le contenu en phrases
             sentences = self._split_into_sentences(section.content)
@@ -416,7 +526,7 @@ class SemanticChunker:
                     sentences=sentences,
                     section_title=section.title,
                     article_number=section.article_number,
-                    heading_hierarchy=list(heading_stack)
+                    heading_hierarchy=heading_stack
                 ))
         
         return groups
@@ -449,9 +559,7 @@ class SemanticChunker:
                 continue
             
             # Détecter les éléments de liste (tiret, puce, numéro suivi de point/parenthèse)
-            is_list_item = bool(re.match(r'^[-•●▪]\s+', line)) or \
-                           bool(re.match(r'^\d+[.)]\s+', line)) or \
-                           bool(re.match(r'^[a-z][.)]\s+', line))
+            is_list_item = _LIST_ITEM_RE.match(line) is not None
             
             if is_list_item:
                 # Sauver la phrase en cours
@@ -465,7 +573,7 @@ class SemanticChunker:
                 current_sentence.append(line)
                 
                 # Si la ligne se termine par un point/!/?
-                if re.search(r'[.!?]\s*$', line):
+                if _LINE_TERMINATOR_RE.search(line):
                     sentences.append(' '.join(current_sentence))
                     current_sentence = []
         
@@ -484,7 +592,7 @@ class SemanticChunker:
                 final_sentences.append(sent)
         
         # Filtrer les phrases vides
-        return [s.strip() for s in final_sentences if s.strip()]
+        return [s for s in map(str.strip, final_sentences) if s]
     
     # =========================================================================
     # PASSE 3 : Groupes de phrases → Chunks avec overlap
@@ -493,7 +601,7 @@ class SemanticChunker:
     def _merge_into_chunks(
         self, 
         groups: List[SentenceGroup]
-    ) -> List[Tuple[SentenceGroup, str]]:
+    ) -> List[Tuple[ChunkMetadata, str]]:
         """
         Regroupe les phrases en chunks de taille cible avec overlap.
         
@@ -504,38 +612,56 @@ class SemanticChunker:
         4. Si une section entière tient dans un chunk, on la garde intacte
         
         Returns:
-            Liste de (SentenceGroup metadata, texte du chunk)
+            Liste de (métadonnées de section, texte du chunk)
         """
         if not groups:
             return []
         
-        chunks: List[Tuple[SentenceGroup, str]] = []
+        chunks: List[Tuple[ChunkMetadata, str]] = []
+        chunk_size = self._chunk_size
         
         for group in groups:
-            # Si le groupe entier tient dans un chunk, on le garde tel quel
-            group_tokens = group.token_estimate
+            # Longueurs des phrases mesurées une seule fois par groupe : elles
+            # servent au test de taille et, si besoin, au sous-découpage
+            char_lens = list(map(len, group.sentences))
+            group_tokens = (sum(char_lens) + len(char_lens) - 1) // 4 if char_lens else 0
+            metadata = ChunkMetadata(
+                section_title=group.section_title,
+                article_number=group.article_number,
+                heading_hierarchy=group.heading_hierarchy
+            )
             
-            if group_tokens <= self._chunk_size:
+            # Si le groupe entier tient dans un chunk, on le garde tel quel
+            if group_tokens <= chunk_size:
                 # Section entière = un chunk (préserve l'unité sémantique)
                 # Ajouter le titre comme contexte
                 chunk_text = self._format_chunk_with_context(group)
-                chunks.append((group, chunk_text))
+                chunks.append((metadata, chunk_text))
             else:
                 # Section trop longue → sous-découper avec overlap
-                sub_chunks = self._split_group_with_overlap(group)
+                sub_chunks = self._split_group_with_overlap(
+                    group, metadata, [n // 4 for n in char_lens]
+                )
                 chunks.extend(sub_chunks)
         
         return chunks
     
     def _split_group_with_overlap(
         self, 
-        group: SentenceGroup
-    ) -> List[Tuple[SentenceGroup, str]]:
+        group: SentenceGroup,
+        metadata: ChunkMetadata,
+        token_lens: List[int]
+    ) -> List[Tuple[ChunkMetadata, str]]:
         """
         Sous-découpe un groupe de phrases trop long en chunks avec overlap.
         
         L'overlap se fait au niveau des phrases : on reprend les dernières
         phrases du chunk précédent comme début du chunk suivant.
+        
+        Args:
+            group: Groupe de phrases à découper
+            metadata: Métadonnées du groupe, partagées par tous ses chunks
+            token_lens: Tokens estimés de chaque phrase du groupe (même ordre)
         """
         chunks = []
         sentences = group.sentences
@@ -544,6 +670,7 @@ class SemanticChunker:
             return []
         
         current_sentences: List[str] = []
+        current_token_lens: List[int] = []  # Tokens de chaque phrase de current_sentences
         current_tokens = 0
         
         # Préfixe contextuel (titre de section/article)
@@ -554,92 +681,88 @@ class SemanticChunker:
             context_prefix = f"[{group.section_title[:60]}] "
         prefix_tokens = len(context_prefix) // 4
         
+        # Place disponible pour les phrases une fois le préfixe compté
+        # (invariants de la boucle, liés en variables locales)
+        budget = self._chunk_size - prefix_tokens
+        n_sentences = len(sentences)
+        compute_overlap = self._compute_overlap
+        
         i = 0
-        while i < len(sentences):
+        while i < n_sentences:
             sent = sentences[i]
-            sent_tokens = len(sent) // 4
+            sent_tokens = token_lens[i]
             
             # Si une phrase unique dépasse chunk_size, on la prend quand même
-            if not current_sentences and sent_tokens > self._chunk_size - prefix_tokens:
-                sub_group = SentenceGroup(
-                    sentences=[sent],
-                    section_title=group.section_title,
-                    article_number=group.article_number,
-                    heading_hierarchy=group.heading_hierarchy
-                )
+            if not current_sentences and sent_tokens > budget:
                 chunk_text = context_prefix + sent
-                chunks.append((sub_group, chunk_text))
+                chunks.append((metadata, chunk_text))
                 i += 1
                 continue
             
             # Ajouter la phrase si elle tient
-            if current_tokens + sent_tokens + prefix_tokens <= self._chunk_size:
+            if current_tokens + sent_tokens <= budget:
                 current_sentences.append(sent)
+                current_token_lens.append(sent_tokens)
                 current_tokens += sent_tokens
                 i += 1
             else:
                 # Finaliser le chunk courant
                 if current_sentences:
-                    sub_group = SentenceGroup(
-                        sentences=list(current_sentences),
-                        section_title=group.section_title,
-                        article_number=group.article_number,
-                        heading_hierarchy=group.heading_hierarchy
-                    )
                     chunk_text = context_prefix + " ".join(current_sentences)
-                    chunks.append((sub_group, chunk_text))
+                    chunks.append((metadata, chunk_text))
                     
                     # Overlap : reprendre les dernières phrases
-                    overlap_sentences = self._compute_overlap(current_sentences)
-                    overlap_tokens = sum(len(s) // 4 for s in overlap_sentences)
+                    overlap_sentences, overlap_lens = compute_overlap(
+                        current_sentences, current_token_lens
+                    )
+                    overlap_tokens = sum(overlap_lens)
                     
                     # PROTECTION BOUCLE INFINIE : si l'overlap + prochaine phrase
                     # dépasse la taille cible, on FORCE l'avancement en vidant l'overlap
-                    if overlap_tokens + sent_tokens + prefix_tokens > self._chunk_size:
+                    if overlap_tokens + sent_tokens > budget:
                         # La phrase est trop grosse même avec juste l'overlap → on prend
                         # la phrase seule dans le prochain chunk (sans overlap)
                         current_sentences = []
+                        current_token_lens = []
                         current_tokens = 0
                     else:
                         current_sentences = overlap_sentences
+                        current_token_lens = overlap_lens
                         current_tokens = overlap_tokens
                 else:
                     i += 1  # Éviter boucle infinie
         
         # Dernier chunk
         if current_sentences:
-            sub_group = SentenceGroup(
-                sentences=list(current_sentences),
-                section_title=group.section_title,
-                article_number=group.article_number,
-                heading_hierarchy=group.heading_hierarchy
-            )
             chunk_text = context_prefix + " ".join(current_sentences)
-            chunks.append((sub_group, chunk_text))
+            chunks.append((metadata, chunk_text))
         
         return chunks
     
-    def _compute_overlap(self, sentences: List[str]) -> List[str]:
+    def _compute_overlap(
+        self,
+        sentences: List[str],
+        token_lens: List[int]
+    ) -> Tuple[List[str], List[int]]:
         """
         Calcule les phrases d'overlap (dernières phrases du chunk précédent).
         
         Prend les dernières phrases jusqu'à atteindre chunk_overlap tokens.
-        Ne coupe jamais une phrase.
-        """
-        if not sentences or self._chunk_overlap <= 0:
-            return []
+        Ne coupe jamais une phrase. Le point de coupe est cherché par
+        dichotomie dans les cumuls de tokens depuis la fin.
         
-        overlap = []
-        overlap_tokens = 0
-        
-        for sent in reversed(sentences):
-            sent_tokens = len(sent) // 4
-            if overlap_tokens + sent_tokens > self._chunk_overlap:
-                break
-            overlap.insert(0, sent)
-            overlap_tokens += sent_tokens
-        
-        return overlap
+        Returns:
+            (phrases d'overlap, tokens de chacune)
+        """
+        chunk_overlap = self._chunk_overlap
+        if not sentences or chunk_overlap <= 0:
+            return [], []
+        
+        # Cumuls croissants (tokens >= 0) : nombre de phrases qui tiennent
+        count = bisect_right(list(accumulate(reversed(token_lens))), chunk_overlap)
+        if not count:
+            return [], []
+        return sentences[-count:], token_lens[-count:]
     
     def _format_chunk_with_context(self, group: SentenceGroup) -> str:
         """
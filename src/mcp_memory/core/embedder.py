@@ -11,6 +11,8 @@ Utilisé pour :
 """
 
 import sys
+import asyncio
+from collections import OrderedDict
 from typing import Optional, List
 
 from openai import AsyncOpenAI
@@ -20,6 +22,11 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 from ..config import get_settings
 
 
+# Embeddings de requêtes gardés en mémoire (LRU) : une même question n'est
+# vectorisée qu'une fois tant qu'elle reste dans le cache
+QUERY_CACHE_MAX_ENTRIES = 512
+
+
 class EmbeddingService:
     """
     Service d'embedding via LLMaaS Cloud Temple.
@@ -31,6 +38,7 @@ class EmbeddingService:
     def __init__(self):
         """Initialise le client OpenAI pour les embeddings."""
         settings = get_settings()
+        settings.require("llmaas_api_key")
         
         # Utilise le même client OpenAI que l'extracteur
         # L'API LLMaaS Cloud Temple est compatible OpenAI
@@ -41,29 +49,30 @@ class EmbeddingService:
         )
         self._model = settings.llmaas_embedding_model
         self._dimensions = settings.llmaas_embedding_dimensions
+        self._batch_size = max(1, settings.llmaas_embedding_batch_size)
+        self._concurrency = max(1, settings.llmaas_embedding_concurrency)
+        # (modèle, requête) → tâche de vectorisation (terminée ou en cours)
+        self._query_cache: OrderedDict = OrderedDict()
     
     @property
     def dimensions(self) -> int:
         """Dimension des vecteurs produits."""
         return self._dimensions
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True
-    )
     async def embed_texts(self, texts: List[str]) -> List[List[float]]:
         """
-        Génère les embeddings pour une liste de textes (batch).
+        Génère les embeddings pour une liste de textes.
         
         Utilisé principalement à l'ingestion pour vectoriser tous les
-        chunks d'un document en une seule passe.
+        chunks d'un document. Les textes sont envoyés par batches de
+        LLMAAS_EMBEDDING_BATCH_SIZE, jusqu'à LLMAAS_EMBEDDING_CONCURRENCY
+        appels simultanés (chaque batch est retenté indépendamment).
         
         Args:
             texts: Liste de textes à vectoriser
             
         Returns:
-            Liste de vecteurs (chacun de dimension self._dimensions)
+            Liste de vecteurs (chacun de dimension self._dimensions), dans l'ordre des textes
             
         Raises:
             APIError: Si l'API LLMaaS retourne une erreur
@@ -72,20 +81,42 @@ class EmbeddingService:
         if not texts:
             return []
         
+        batches = [
+            texts[start:start + self._batch_size]
+            for start in range(0, len(texts), self._batch_size)
+        ]
+        print(f"🔢 [Embedder] Vectorisation de {len(texts)} textes ({self._model}, "
+              f"{len(batches)} batches)...", file=sys.stderr)
+        
+        semaphore = asyncio.Semaphore(self._concurrency)
+        
+        async def _embed(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self._embed_batch(batch)
+        
+        # gather conserve l'ordre des batches
+        results = await asyncio.gather(*(_embed(batch) for batch in batches))
+        embeddings = [vector for batch_vectors in results for vector in batch_vectors]
+        
+        print(f"✅ [Embedder] {len(embeddings)} embeddings générés (dim={len(embeddings[0])})", file=sys.stderr)
+        
+        return embeddings
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        reraise=True
+    )
+    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Un appel /v1/embeddings pour un batch de textes (vecteurs dans l'ordre)."""
         try:
-            print(f"🔢 [Embedder] Vectorisation de {len(texts)} textes ({self._model})...", file=sys.stderr)
-            
             response = await self._client.embeddings.create(
                 model=self._model,
                 input=texts
             )
             
             # Extraire les vecteurs dans l'ordre
-            embeddings = [item.embedding for item in response.data]
-            
-            print(f"✅ [Embedder] {len(embeddings)} embeddings générés (dim={len(embeddings[0])})", file=sys.stderr)
-            
-            return embeddings
+            return [item.embedding for item in response.data]
             
         except APITimeoutError:
             print(f"⏰ [Embedder] Timeout — trop de textes ou textes trop longs", file=sys.stderr)
@@ -94,11 +125,6 @@ class EmbeddingService:
             print(f"❌ [Embedder] Erreur API: {e}", file=sys.stderr)
             raise
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True
-    )
     async def embed_query(self, query: str) -> List[float]:
         """
         Génère l'embedding pour une requête utilisateur.
@@ -106,12 +132,44 @@ class EmbeddingService:
         Utilisé à la recherche pour vectoriser la question avant
         de la comparer aux chunks dans Qdrant.
         
+        Les résultats sont gardés dans un cache LRU (QUERY_CACHE_MAX_ENTRIES
+        requêtes) : le modèle est déterministe, une requête répétée ne refait
+        pas d'appel API. Le cache stocke la tâche de vectorisation, donc des
+        appels simultanés pour la même requête partagent un seul appel.
+        Les échecs ne sont pas mis en cache.
+        
         Args:
             query: Texte de la requête
             
         Returns:
             Vecteur de dimension self._dimensions
         """
+        key = (self._model, query)
+        cache = self._query_cache
+        task = cache.get(key)
+        if task is not None:
+            cache.move_to_end(key)
+        else:
+            task = asyncio.ensure_future(self._embed_query(query))
+            cache[key] = task
+            if len(cache) > QUERY_CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
+        
+        try:
+            # shield : l'annulation d'un appelant n'annule pas l'appel partagé
+            return await asyncio.shield(task)
+        except BaseException:
+            if task.done() and cache.get(key) is task:
+                cache.pop(key)
+            raise
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        reraise=True
+    )
+    async def _embed_query(self, query: str) -> List[float]:
+        """Un appel /v1/embeddings pour une requête."""
         try:
             response = await self._client.embeddings.create(
                 model=self._model,
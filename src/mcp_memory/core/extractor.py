@@ -8,11 +8,13 @@ les entités, relations et concepts à partir de texte.
 
 import sys
 import json
-from typing import Optional, List
+import asyncio
+from typing import Optional, List, Union
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+import httpx
 from openai import AsyncOpenAI
-from openai import APIError, APITimeoutError
+from openai import APIError, APIStatusError, APITimeoutError
 
 from ..config import get_settings
 from .models import (
@@ -21,6 +23,23 @@ from .models import (
 )
 from .ontology import Ontology, get_ontology_manager
 
+try:
+    import orjson
+except ImportError:  # Repli sur json (stdlib) si orjson n'est pas installé
+    orjson = None
+
+
+# Pool de connexions HTTP vers LLMaaS. Les connexions inactives restent
+# ouvertes 30 s (5 s par défaut dans httpx) : entre deux chunks d'extraction
+# ou deux documents, l'appel suivant réutilise une connexion TLS déjà établie
+LLMAAS_MAX_CONNECTIONS = 200
+LLMAAS_MAX_KEEPALIVE_CONNECTIONS = 100
+LLMAAS_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+# Décodage des réponses JSON du LLM. orjson.JSONDecodeError hérite de
+# json.JSONDecodeError : le même except couvre les deux
+_decode_json = orjson.loads if orjson is not None else json.loads
+
 
 # Prompt d'extraction MINIMAL (fallback sans ontologie).
 # Toute la logique métier (types d'entités, relations, règles) vient de l'ontologie.
@@ -68,16 +87,58 @@ class ExtractorService:
     def __init__(self):
         """Initialise le client OpenAI compatible."""
         settings = get_settings()
-        
+        settings.require("llmaas_api_key")
+        
+        # Client HTTP explicite pour régler le keep-alive du pool (voir
+        # LLMAAS_KEEPALIVE_EXPIRY_SECONDS) ; fermé par close()
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=LLMAAS_MAX_CONNECTIONS,
+                max_keepalive_connections=LLMAAS_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=LLMAAS_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            timeout=settings.extraction_timeout_seconds,
+            follow_redirects=True,
+        )
         self._client = AsyncOpenAI(
             base_url=settings.llmaas_base_url,
             api_key=settings.llmaas_api_key,
-            timeout=settings.extraction_timeout_seconds
+            timeout=settings.extraction_timeout_seconds,
+            http_client=self._http_client
         )
         self._model = settings.llmaas_model
         self._max_tokens = settings.llmaas_max_tokens
         self._temperature = settings.llmaas_temperature
         self._max_text_length = settings.extraction_max_text_length
+        self._warm_up_task: Optional[asyncio.Task] = None
+    
+    def warm_up(self) -> None:
+        """
+        Ouvre en tâche de fond une connexion vers LLMaaS, avant le premier appel.
+        
+        Une requête légère (GET /models) suffit à établir la connexion TLS,
+        qui reste ensuite dans le pool : l'appel d'extraction qui suit (dans
+        la limite de LLMAAS_KEEPALIVE_EXPIRY_SECONDS) n'a plus de handshake.
+        À appeler dès qu'une extraction est prévisible (début d'ingestion), pour
+        que le handshake se fasse pendant l'upload S3 et l'extraction du texte.
+        Best effort : une erreur est ignorée, l'appel réel la reverra.
+        """
+        if self._warm_up_task is not None and not self._warm_up_task.done():
+            return
+        self._warm_up_task = asyncio.get_running_loop().create_task(self._warm_up())
+    
+    async def _warm_up(self) -> None:
+        """Requête de préchauffage du pool (réponse ignorée)."""
+        try:
+            await self._client.models.list()
+        except APIStatusError:
+            pass  # Réponse reçue (même un 404) : la connexion est dans le pool
+        except Exception as e:
+            print(f"⚠️ [Extractor] Préchauffage LLMaaS: {e}", file=sys.stderr)
+    
+    async def close(self):
+        """Ferme le pool de connexions HTTP vers LLMaaS."""
+        await self._http_client.aclose()
     
     @retry(
         stop=stop_after_attempt(3),
@@ -171,14 +232,15 @@ class ExtractorService:
                 end = content.rfind("}") + 1
                 content = content[start:end]
             
-            data = json.loads(content)
+            data = _decode_json(content)
             
-            # Parser les entités
+            # Parser les entités (types de l'ontologie indexés une fois par réponse)
+            entity_type_lookup = self._entity_type_lookup(known_entity_types)
             entities = []
             for e in data.get("entities", []):
                 entity_type = self._normalize_entity_type(
                     e.get("type", "Other"),
-                    known_types=known_entity_types,
+                    type_lookup=entity_type_lookup,
                 )
                 entities.append(ExtractedEntity(
                     name=e.get("name", "").strip(),
@@ -187,12 +249,18 @@ class ExtractorService:
                 ))
             
             # Parser les relations — avec les types connus de l'ontologie
+            # (quelques types reviennent sur toutes les relations : chaque type
+            # brut n'est normalisé qu'une fois)
+            relation_types = {}  # type brut → type normalisé
             relations = []
             for r in data.get("relations", []):
-                rel_type = self._parse_relation_type(
-                    r.get("type", "RELATED_TO"),
-                    known_types=known_relation_types
-                )
+                raw_type = r.get("type", "RELATED_TO")
+                rel_type = relation_types.get(raw_type)
+                if rel_type is None:
+                    rel_type = relation_types[raw_type] = self._parse_relation_type(
+                        raw_type,
+                        known_types=known_relation_types
+                    )
                 relations.append(ExtractedRelation(
                     from_entity=r.get("from_entity", "").strip(),
                     to_entity=r.get("to_entity", "").strip(),
@@ -214,7 +282,22 @@ class ExtractorService:
             return ExtractionResult(summary=None)
     
     @staticmethod
-    def _normalize_entity_type(type_str: str, known_types: Optional[set] = None) -> str:
+    def _entity_type_lookup(known_types: Optional[set] = None) -> dict:
+        """
+        Index des types d'entités de l'ontologie : minuscules → casse exacte.
+        
+        Construit une fois par réponse, pour que la normalisation de chaque
+        entité soit une recherche dans un dict (au lieu d'un parcours des types).
+        
+        Args:
+            known_types: Set des types définis par l'ontologie (ex: {"Differentiator", "KPI", "Organization"})
+        """
+        if not known_types:
+            return {}
+        return {kt.lower(): kt for kt in known_types}
+    
+    @staticmethod
+    def _normalize_entity_type(type_str: str, type_lookup: Optional[dict] = None) -> str:
         """
         Normalise un type d'entité selon l'ontologie active.
         
@@ -222,22 +305,21 @@ class ExtractorService:
         - Si le type retourné par le LLM est dans l'ontologie → retourner avec la casse exacte de l'ontologie
         - Sinon → "Other"
         
-        Si aucune ontologie n'est chargée (known_types=None), tout est "Other".
+        Si aucune ontologie n'est chargée (type_lookup vide ou None), tout est "Other".
         
         Args:
             type_str: Type brut retourné par le LLM (ex: "Differentiator", "KPI", "Person")
-            known_types: Set des types définis par l'ontologie (ex: {"Differentiator", "KPI", "Organization"})
+            type_lookup: Index des types de l'ontologie (voir _entity_type_lookup)
         """
-        if not type_str or not known_types:
+        if not type_str or not type_lookup:
             return "Other"
         
-        type_lower = type_str.strip().lower()
-        for kt in known_types:
-            if kt.lower() == type_lower:
-                return kt  # Casse exacte de l'ontologie
+        known_type = type_lookup.get(type_str.strip().lower())
+        if known_type is not None:
+            return known_type  # Casse exacte de l'ontologie
         
         # LOG: capturer les types LLM rejetés pour analyse
-        print(f"⚠️ [Normalize] Type LLM rejeté: '{type_str}' → Other (known: {len(known_types)} types)", file=sys.stderr)
+        print(f"⚠️ [Normalize] Type LLM rejeté: '{type_str}' → Other (known: {len(type_lookup)} types)", file=sys.stderr)
         return "Other"
     
     # Types de base (utilisés quand aucune ontologie n'est chargée)
@@ -535,6 +617,38 @@ class ExtractorService:
         
         return merged
 
+    async def extract_many(
+        self,
+        texts: List[str],
+        ontology_name: str = "default",
+        concurrency: int = 8,
+    ) -> List[Union[ExtractionResult, BaseException]]:
+        """
+        Extrait plusieurs textes indépendants en parallèle.
+        
+        Chaque texte passe par extract_with_ontology_chunked (découpage et
+        retries inclus), avec au plus `concurrency` extractions simultanées.
+        
+        Args:
+            texts: Textes à analyser (documents distincts)
+            ontology_name: Nom de l'ontologie à utiliser
+            concurrency: Nombre max d'extractions en cours
+            
+        Returns:
+            Un résultat par texte, dans l'ordre des textes ; l'exception levée
+            à la place du résultat pour un texte en échec (les autres continuent)
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def _extract(text: str) -> ExtractionResult:
+            async with semaphore:
+                return await self.extract_with_ontology_chunked(text, ontology_name)
+        
+        # gather conserve l'ordre des textes
+        return await asyncio.gather(
+            *(_extract(text) for text in texts), return_exceptions=True
+        )
+
     def _split_text_for_extraction(self, text: str, chunk_size: int) -> List[str]:
         """
         Découpe un texte long en chunks pour l'extraction graph.
@@ -9,7 +9,8 @@ Gère toutes les opérations sur le graphe de connaissances :
 """
 
 import sys
-from typing import Optional, List, Dict, Any
+from itertools import islice
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple
 from datetime import datetime
 from contextlib import asynccontextmanager
 
@@ -38,9 +39,13 @@ class GraphService:
     # Nom de l'index fulltext dans Neo4j
     FULLTEXT_INDEX_NAME = "entity_fulltext"
     
+    # Lignes par requête UNWIND lors de l'import d'un backup
+    IMPORT_BATCH_SIZE = 1000
+    
     def __init__(self):
         """Initialise la connexion Neo4j."""
         settings = get_settings()
+        settings.require("neo4j_password")
         
         self._driver: AsyncDriver = AsyncGraphDatabase.driver(
             settings.neo4j_uri,
@@ -51,6 +56,9 @@ class GraphService:
         )
         self._database = settings.neo4j_database
         self._fulltext_index_ready = False  # Lazy init de l'index fulltext
+        # Compteur incrémenté à chaque création/suppression/restauration de mémoire
+        # (permet aux consommateurs de mettre en cache la liste des mémoires)
+        self.memories_version = 0
     
     async def close(self):
         """Ferme la connexion Neo4j."""
@@ -174,6 +182,7 @@ class GraphService:
             
             record = await result.single()
             node = record["m"]
+            self.memories_version += 1
             
             print(f"🧠 [Graph] Mémoire créée: {memory_id} (ns: {ns}, ontology: {ontology}, uri: {ontology_uri})", file=sys.stderr)
             
@@ -243,6 +252,7 @@ class GraphService:
             deleted = record["deleted"] > 0 if record else False
             
             if deleted:
+                self.memories_version += 1
                 print(f"🗑️ [Graph] Mémoire supprimée: {memory_id}", file=sys.stderr)
             
             return deleted
@@ -1101,23 +1111,28 @@ class GraphService:
     # Export / Import (Backup)
     # =========================================================================
     
-    async def export_memory_data(self, memory_id: str) -> Dict[str, Any]:
+    async def export_memory_data(self, memory_id: str) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
         """
-        Exporte toutes les données d'une mémoire pour backup.
+        Exporte toutes les données d'une mémoire pour backup, en flux.
+        
+        Générateur asynchrone de tuples (section, enregistrement), dans l'ordre :
+        - "memory": propriétés du nœud Memory (une seule fois, en premier)
+        - "documents": nœuds Document (propriétés)
+        - "entities": nœuds Entity (propriétés)
+        - "relations": relations RELATED_TO (from, to, propriétés)
+        - "mentions": relations MENTIONS (doc_id, entity_name, count)
         
-        Retourne un dict contenant :
-        - memory: propriétés du nœud Memory
-        - documents: liste des nœuds Document (propriétés)
-        - entities: liste des nœuds Entity (propriétés)
-        - relations: liste des relations RELATED_TO (from, to, propriétés)
-        - mentions: liste des relations MENTIONS (doc_id, entity_name, count)
+        Les enregistrements sont produits au fil de la lecture des résultats
+        Neo4j : la mémoire utilisée ne dépend pas de la taille du graphe.
         
         Args:
             memory_id: ID de la mémoire à exporter
             
-        Returns:
-            Dictionnaire complet des données de la mémoire
+        Yields:
+            (nom de section, dictionnaire sérialisable)
         """
+        counts = {"documents": 0, "entities": 0, "relations": 0, "mentions": 0}
+        
         async with self.session() as session:
             # 1. Exporter le nœud Memory
             mem_result = await session.run(
@@ -1133,6 +1148,7 @@ class GraphService:
             for k, v in memory_props.items():
                 if hasattr(v, 'to_native'):
                     memory_props[k] = v.to_native().isoformat()
+            yield "memory", memory_props
             
             # 2. Exporter les Documents
             docs_result = await session.run(
@@ -1143,13 +1159,13 @@ class GraphService:
                 """,
                 memory_id=memory_id
             )
-            documents = []
             async for record in docs_result:
                 props = dict(record["d"])
                 for k, v in props.items():
                     if hasattr(v, 'to_native'):
                         props[k] = v.to_native().isoformat()
-                documents.append(props)
+                counts["documents"] += 1
+                yield "documents", props
             
             # 3. Exporter les Entities
             ents_result = await session.run(
@@ -1160,7 +1176,6 @@ class GraphService:
                 """,
                 memory_id=memory_id
             )
-            entities = []
             async for record in ents_result:
                 props = dict(record["e"])
                 for k, v in props.items():
@@ -1168,7 +1183,8 @@ class GraphService:
                         props[k] = v.to_native().isoformat()
                     elif isinstance(v, list):
                         props[k] = list(v)  # Convertir les listes Neo4j
-                entities.append(props)
+                counts["entities"] += 1
+                yield "entities", props
             
             # 4. Exporter les relations RELATED_TO
             rels_result = await session.run(
@@ -1181,7 +1197,6 @@ class GraphService:
                 """,
                 memory_id=memory_id
             )
-            relations = []
             async for record in rels_result:
                 rel = {
                     "from_name": record["from_name"],
@@ -1193,7 +1208,8 @@ class GraphService:
                 }
                 if record["created_at"] and hasattr(record["created_at"], 'to_native'):
                     rel["created_at"] = record["created_at"].to_native().isoformat()
-                relations.append(rel)
+                counts["relations"] += 1
+                yield "relations", rel
             
             # 5. Exporter les relations MENTIONS
             ments_result = await session.run(
@@ -1203,25 +1219,17 @@ class GraphService:
                 """,
                 memory_id=memory_id
             )
-            mentions = []
             async for record in ments_result:
-                mentions.append({
+                counts["mentions"] += 1
+                yield "mentions", {
                     "doc_id": record["doc_id"],
                     "entity_name": record["entity_name"],
                     "count": record["count"]
-                })
-            
-            print(f"📦 [Graph Export] {memory_id}: {len(documents)} docs, "
-                  f"{len(entities)} entités, {len(relations)} relations, "
-                  f"{len(mentions)} mentions", file=sys.stderr)
-            
-            return {
-                "memory": memory_props,
-                "documents": documents,
-                "entities": entities,
-                "relations": relations,
-                "mentions": mentions
-            }
+                }
+        
+        print(f"📦 [Graph Export] {memory_id}: {counts['documents']} docs, "
+              f"{counts['entities']} entités, {counts['relations']} relations, "
+              f"{counts['mentions']} mentions", file=sys.stderr)
     
     async def import_memory_data(self, data: Dict[str, Any]) -> Dict[str, int]:
         """
@@ -1231,7 +1239,8 @@ class GraphService:
         La mémoire NE DOIT PAS exister (erreur sinon).
         
         Args:
-            data: Dictionnaire issu de export_memory_data()
+            data: Dictionnaire {memory, documents, entities, relations, mentions}
+                  (sections produites par export_memory_data())
             
         Returns:
             Compteurs : memory, documents, entities, relations, mentions créés
@@ -1280,108 +1289,138 @@ class GraphService:
                 created_at=memory_props.get("created_at", datetime.utcnow().isoformat())
             )
             counters["memory"] = 1
+            self.memories_version += 1
+            
+            now = datetime.utcnow().isoformat()
             
             # 2. Recréer les Documents
-            for doc in data.get("documents", []):
-                await session.run(
-                    """
-                    CREATE (d:Document {
-                        id: $id,
-                        memory_id: $memory_id,
-                        uri: $uri,
-                        filename: $filename,
-                        hash: $hash,
-                        ingested_at: datetime($ingested_at),
-                        metadata_json: $metadata_json,
-                        source_path: $source_path,
-                        source_modified_at: $source_modified_at,
-                        size_bytes: $size_bytes,
-                        text_length: $text_length,
-                        content_type: $content_type
-                    })
-                    """,
-                    id=doc["id"],
-                    memory_id=doc.get("memory_id", memory_id),
-                    uri=doc.get("uri", ""),
-                    filename=doc.get("filename", ""),
-                    hash=doc.get("hash", ""),
-                    ingested_at=doc.get("ingested_at", datetime.utcnow().isoformat()),
-                    metadata_json=doc.get("metadata_json", "{}"),
-                    source_path=doc.get("source_path", ""),
-                    source_modified_at=doc.get("source_modified_at", ""),
-                    size_bytes=doc.get("size_bytes", 0),
-                    text_length=doc.get("text_length", 0),
-                    content_type=doc.get("content_type", "")
-                )
-                counters["documents"] += 1
+            counters["documents"] = await self._run_batched(
+                session,
+                """
+                UNWIND $rows AS row
+                CREATE (d:Document {
+                    id: row.id,
+                    memory_id: row.memory_id,
+                    uri: row.uri,
+                    filename: row.filename,
+                    hash: row.hash,
+                    ingested_at: datetime(row.ingested_at),
+                    metadata_json: row.metadata_json,
+                    source_path: row.source_path,
+                    source_modified_at: row.source_modified_at,
+                    size_bytes: row.size_bytes,
+                    text_length: row.text_length,
+                    content_type: row.content_type
+                })
+                """,
+                ({
+                    "id": doc["id"],
+                    "memory_id": doc.get("memory_id", memory_id),
+                    "uri": doc.get("uri", ""),
+                    "filename": doc.get("filename", ""),
+                    "hash": doc.get("hash", ""),
+                    "ingested_at": doc.get("ingested_at", now),
+                    "metadata_json": doc.get("metadata_json", "{}"),
+                    "source_path": doc.get("source_path", ""),
+                    "source_modified_at": doc.get("source_modified_at", ""),
+                    "size_bytes": doc.get("size_bytes", 0),
+                    "text_length": doc.get("text_length", 0),
+                    "content_type": doc.get("content_type", ""),
+                } for doc in data.get("documents", []))
+            )
             
             # 3. Recréer les Entities
-            for entity in data.get("entities", []):
-                await session.run(
-                    """
-                    CREATE (e:Entity {
-                        name: $name,
-                        memory_id: $memory_id,
-                        type: $type,
-                        description: $description,
-                        source_docs: $source_docs,
-                        mention_count: $mention_count,
-                        created_at: datetime($created_at),
-                        updated_at: datetime($updated_at)
-                    })
-                    """,
-                    name=entity["name"],
-                    memory_id=entity.get("memory_id", memory_id),
-                    type=entity.get("type", "Other"),
-                    description=entity.get("description"),
-                    source_docs=entity.get("source_docs", []),
-                    mention_count=entity.get("mention_count", 1),
-                    created_at=entity.get("created_at", datetime.utcnow().isoformat()),
-                    updated_at=entity.get("updated_at", datetime.utcnow().isoformat())
-                )
-                counters["entities"] += 1
+            counters["entities"] = await self._run_batched(
+                session,
+                """
+                UNWIND $rows AS row
+                CREATE (e:Entity {
+                    name: row.name,
+                    memory_id: row.memory_id,
+                    type: row.type,
+                    description: row.description,
+                    source_docs: row.source_docs,
+                    mention_count: row.mention_count,
+                    created_at: datetime(row.created_at),
+                    updated_at: datetime(row.updated_at)
+                })
+                """,
+                ({
+                    "name": entity["name"],
+                    "memory_id": entity.get("memory_id", memory_id),
+                    "type": entity.get("type", "Other"),
+                    "description": entity.get("description"),
+                    "source_docs": entity.get("source_docs", []),
+                    "mention_count": entity.get("mention_count", 1),
+                    "created_at": entity.get("created_at", now),
+                    "updated_at": entity.get("updated_at", now),
+                } for entity in data.get("entities", []))
+            )
             
             # 4. Recréer les relations RELATED_TO
-            for rel in data.get("relations", []):
-                await session.run(
-                    """
-                    MATCH (from:Entity {name: $from_name, memory_id: $memory_id})
-                    MATCH (to:Entity {name: $to_name, memory_id: $memory_id})
-                    CREATE (from)-[r:RELATED_TO {
-                        type: $rel_type,
-                        description: $description,
-                        weight: $weight,
-                        source_doc: $source_doc
-                    }]->(to)
-                    """,
-                    from_name=rel["from_name"],
-                    to_name=rel["to_name"],
-                    memory_id=memory_id,
-                    rel_type=rel.get("type", "RELATED_TO"),
-                    description=rel.get("description"),
-                    weight=rel.get("weight", 1.0),
-                    source_doc=rel.get("source_doc")
-                )
-                counters["relations"] += 1
+            counters["relations"] = await self._run_batched(
+                session,
+                """
+                UNWIND $rows AS row
+                MATCH (from:Entity {name: row.from_name, memory_id: $memory_id})
+                MATCH (to:Entity {name: row.to_name, memory_id: $memory_id})
+                CREATE (from)-[r:RELATED_TO {
+                    type: row.rel_type,
+                    description: row.description,
+                    weight: row.weight,
+                    source_doc: row.source_doc
+                }]->(to)
+                """,
+                ({
+                    "from_name": rel["from_name"],
+                    "to_name": rel["to_name"],
+                    "rel_type": rel.get("type", "RELATED_TO"),
+                    "description": rel.get("description"),
+                    "weight": rel.get("weight", 1.0),
+                    "source_doc": rel.get("source_doc"),
+                } for rel in data.get("relations", [])),
+                memory_id=memory_id
+            )
             
             # 5. Recréer les relations MENTIONS
-            for mention in data.get("mentions", []):
-                await session.run(
-                    """
-                    MATCH (d:Document {id: $doc_id, memory_id: $memory_id})
-                    MATCH (e:Entity {name: $entity_name, memory_id: $memory_id})
-                    CREATE (d)-[r:MENTIONS {count: $count}]->(e)
-                    """,
-                    doc_id=mention["doc_id"],
-                    entity_name=mention["entity_name"],
-                    memory_id=memory_id,
-                    count=mention.get("count", 1)
-                )
-                counters["mentions"] += 1
+            counters["mentions"] = await self._run_batched(
+                session,
+                """
+                UNWIND $rows AS row
+                MATCH (d:Document {id: row.doc_id, memory_id: $memory_id})
+                MATCH (e:Entity {name: row.entity_name, memory_id: $memory_id})
+                CREATE (d)-[r:MENTIONS {count: row.count}]->(e)
+                """,
+                ({
+                    "doc_id": mention["doc_id"],
+                    "entity_name": mention["entity_name"],
+                    "count": mention.get("count", 1),
+                } for mention in data.get("mentions", [])),
+                memory_id=memory_id
+            )
         
         print(f"📥 [Graph Import] {memory_id}: {counters}", file=sys.stderr)
         return counters
     
+    async def _run_batched(self, session, query: str, rows, **params) -> int:
+        """
+        Exécute une requête UNWIND $rows par lots de IMPORT_BATCH_SIZE lignes.
+        
+        Un aller-retour Neo4j par lot au lieu d'un par ligne.
+        
+        Returns:
+            Nombre de lignes envoyées
+        """
+        rows = iter(rows)
+        total = 0
+        while True:
+            batch = list(islice(rows, self.IMPORT_BATCH_SIZE))
+            if not batch:
+                return total
+            result = await session.run(query, rows=batch, **params)
+            await result.consume()
+            total += len(batch)
+    
     # =========================================================================
     # Statistiques
     # =========================================================================
@@ -5,6 +5,7 @@ StorageService - Client S3 pour le stockage des documents.
 Gère le stockage et la récupération des documents originaux sur S3 Cloud Temple.
 """
 
+import asyncio
 import os
 import hashlib
 import sys
@@ -18,6 +19,28 @@ from botocore.exceptions import ClientError, NoCredentialsError
 from ..config import get_settings
 
 
+# Nombre max de clés par requête DeleteObjects (limite S3)
+DELETE_OBJECTS_MAX_KEYS = 1000
+
+# Content-types par extension (en minuscules), construit une seule fois
+_CONTENT_TYPES = {
+    'pdf': 'application/pdf',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'doc': 'application/msword',
+    'txt': 'text/plain',
+    'md': 'text/markdown',
+    'json': 'application/json',
+    'xml': 'application/xml',
+    'html': 'text/html',
+    'csv': 'text/csv',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'xls': 'application/vnd.ms-excel',
+    'png': 'image/png',
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+}
+
+
 class StorageService:
     """
     Service de stockage S3 pour les documents.
@@ -33,6 +56,7 @@ class StorageService:
     def __init__(self):
         """Initialise les clients S3 avec signatures adaptées."""
         settings = get_settings()
+        settings.require("s3_access_key_id", "s3_secret_access_key")
         
         # Désactiver le calcul du checksum par le SDK
         os.environ["AWS_REQUEST_CHECKSUM_CALCULATION"] = "when_required"
@@ -140,7 +164,8 @@ class StorageService:
                 s3_metadata[k] = self._sanitize_metadata_value(str(v))
         
         try:
-            self._client.put_object(
+            await asyncio.to_thread(
+                self._client.put_object,
                 Bucket=self._bucket,
                 Key=key,
                 Body=content,
@@ -224,7 +249,7 @@ class StorageService:
         key = self._parse_key(key_or_uri)
         
         try:
-            self._client.head_object(Bucket=self._bucket, Key=key)
+            await asyncio.to_thread(self._client.head_object, Bucket=self._bucket, Key=key)
             return True
         except ClientError:
             return False
@@ -396,8 +421,8 @@ class StorageService:
                 if continuation_token:
                     params['ContinuationToken'] = continuation_token
                 
-                # SigV4 pour LIST (Dell ECS)
-                response = self._client_v4.list_objects_v2(**params)
+                # SigV4 pour LIST (Dell ECS), hors de la boucle d'événements
+                response = await asyncio.to_thread(self._client_v4.list_objects_v2, **params)
                 
                 for obj in response.get('Contents', []):
                     objects.append({
@@ -423,7 +448,8 @@ class StorageService:
         """
         Supprime tous les objets S3 sous un préfixe donné.
         
-        Utilisé pour nettoyer tous les fichiers d'une mémoire.
+        Utilisé pour nettoyer tous les fichiers d'une mémoire et supprimer
+        les backups. Les objets listés sont supprimés par lots (bulk_delete_keys).
         
         Args:
             prefix: Préfixe S3 (ex: "quoteflow-legal/")
@@ -432,23 +458,9 @@ class StorageService:
             dict avec deleted_count et errors
         """
         objects = await self.list_all_objects(prefix=prefix)
-        deleted_count = 0
-        error_count = 0
-        
-        for obj in objects:
-            try:
-                self._client.delete_object(Bucket=self._bucket, Key=obj['key'])
-                deleted_count += 1
-                print(f"🗑️ [S3] Supprimé: {obj['key']}", file=sys.stderr)
-            except ClientError as e:
-                error_count += 1
-                print(f"❌ [S3] Erreur suppression {obj['key']}: {e}", file=sys.stderr)
-        
-        return {
-            "deleted_count": deleted_count,
-            "error_count": error_count,
-            "total_found": len(objects)
-        }
+        result = await self.bulk_delete_keys([obj['key'] for obj in objects])
+        result["total_found"] = len(objects)
+        return result
     
     async def delete_objects(self, keys: list) -> dict:
         """
@@ -460,19 +472,69 @@ class StorageService:
         Returns:
             dict avec deleted_count et errors
         """
+        def _delete() -> dict:
+            deleted_count = 0
+            error_count = 0
+            
+            for key_or_uri in keys:
+                key = self._parse_key(key_or_uri)
+                try:
+                    self._client.delete_object(Bucket=self._bucket, Key=key)
+                    deleted_count += 1
+                    print(f"🗑️ [S3] Supprimé: {key}", file=sys.stderr)
+                except ClientError as e:
+                    error_count += 1
+                    print(f"❌ [S3] Erreur suppression {key}: {e}", file=sys.stderr)
+            
+            return {
+                "deleted_count": deleted_count,
+                "error_count": error_count
+            }
+        
+        # Un DELETE synchrone par clé : exécuté hors de la boucle d'événements
+        return await asyncio.to_thread(_delete)
+    
+    async def bulk_delete_keys(self, keys: list) -> dict:
+        """
+        Supprime des objets S3 par lots (DeleteObjects, 1000 clés par requête).
+        
+        Une requête par lot au lieu d'un DELETE par objet. Si le endpoint
+        refuse DeleteObjects, le lot est supprimé objet par objet.
+        
+        Args:
+            keys: Liste de clés S3
+            
+        Returns:
+            dict avec deleted_count et error_count
+        """
         deleted_count = 0
         error_count = 0
         
-        for key_or_uri in keys:
-            key = self._parse_key(key_or_uri)
+        for start in range(0, len(keys), DELETE_OBJECTS_MAX_KEYS):
+            batch = keys[start:start + DELETE_OBJECTS_MAX_KEYS]
             try:
-                self._client.delete_object(Bucket=self._bucket, Key=key)
-                deleted_count += 1
-                print(f"🗑️ [S3] Supprimé: {key}", file=sys.stderr)
+                response = await asyncio.to_thread(
+                    self._client.delete_objects,
+                    Bucket=self._bucket,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True}
+                )
             except ClientError as e:
-                error_count += 1
-                print(f"❌ [S3] Erreur suppression {key}: {e}", file=sys.stderr)
-        
+                print(f"⚠️ [S3] DeleteObjects refusé ({e}), suppression objet par objet",
+                      file=sys.stderr)
+                result = await self.delete_objects(batch)
+                deleted_count += result["deleted_count"]
+                error_count += result["error_count"]
+                continue
+            
+            # En mode Quiet, seules les erreurs sont retournées
+            errors = response.get("Errors", [])
+            for error in errors:
+                print(f"❌ [S3] Erreur suppression {error.get('Key')}: "
+                      f"{error.get('Message')}", file=sys.stderr)
+            error_count += len(errors)
+            deleted_count += len(batch) - len(errors)
+        
+        print(f"🗑️ [S3] {deleted_count} objets supprimés par lots", file=sys.stderr)
         return {
             "deleted_count": deleted_count,
             "error_count": error_count
@@ -553,35 +615,15 @@ class StorageService:
         URL-encode les caractères non-ASCII pour compatibilité S3/Dell ECS.
         Ex: "Conditions Générales" → "Conditions%20G%C3%A9n%C3%A9rales"
         """
-        try:
-            value.encode('ascii')
+        if value.isascii():
             return value  # Déjà ASCII, pas besoin d'encoder
-        except UnicodeEncodeError:
-            return url_quote(value, safe='')
+        return url_quote(value, safe='')
     
     @staticmethod
     def _guess_content_type(filename: str) -> str:
         """Devine le content-type à partir de l'extension."""
-        ext = filename.lower().split('.')[-1] if '.' in filename else ''
-        
-        content_types = {
-            'pdf': 'application/pdf',
-            'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            'doc': 'application/msword',
-            'txt': 'text/plain',
-            'md': 'text/markdown',
-            'json': 'application/json',
-            'xml': 'application/xml',
-            'html': 'text/html',
-            'csv': 'text/csv',
-            'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            'xls': 'application/vnd.ms-excel',
-            'png': 'image/png',
-            'jpg': 'image/jpeg',
-            'jpeg': 'image/jpeg',
-        }
-        
-        return content_types.get(ext, 'application/octet-stream')
+        ext = filename.rpartition('.')[2].lower() if '.' in filename else ''
+        return _CONTENT_TYPES.get(ext, 'application/octet-stream')
 
 
 # Singleton pour usage global
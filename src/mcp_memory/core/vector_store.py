@@ -12,7 +12,8 @@ Couplage strict avec Neo4j :
 """
 
 import sys
-from typing import Optional, List
+import asyncio
+from typing import Optional, List, AsyncIterator
 from uuid import uuid4
 
 from qdrant_client import QdrantClient
@@ -23,6 +24,16 @@ from ..config import get_settings
 from .models import Chunk, ChunkResult
 
 
+async def _aiter(items) -> AsyncIterator:
+    """Parcourt un itérable synchrone ou asynchrone de façon uniforme."""
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
 class VectorStoreService:
     """
     Service de stockage vectoriel via Qdrant.
@@ -43,6 +54,15 @@ class VectorStoreService:
         )
         self._prefix = settings.qdrant_collection_prefix
         self._dimensions = settings.llmaas_embedding_dimensions
+        # float16 : vecteurs deux fois plus compacts (disque, RAM, copies) pour
+        # une similarité cosinus quasi identique ; les collections existantes
+        # gardent le type avec lequel elles ont été créées
+        datatype = settings.qdrant_vector_datatype.lower()
+        if datatype not in ("float16", "float32"):
+            raise ValueError(f"QDRANT_VECTOR_DATATYPE invalide: {datatype!r} (float16 ou float32)")
+        self._datatype = qmodels.Datatype(datatype)
+        self._import_batch_size = settings.qdrant_import_batch_size
+        self._import_concurrency = settings.qdrant_import_concurrency
     
     def _collection_name(self, memory_id: str) -> str:
         """Retourne le nom de collection Qdrant pour une mémoire."""
@@ -78,7 +98,8 @@ class VectorStoreService:
                 collection_name=name,
                 vectors_config=qmodels.VectorParams(
                     size=self._dimensions,
-                    distance=qmodels.Distance.COSINE
+                    distance=qmodels.Distance.COSINE,
+                    datatype=self._datatype
                 )
             )
             
@@ -94,7 +115,8 @@ class VectorStoreService:
                 field_schema=qmodels.PayloadSchemaType.KEYWORD
             )
             
-            print(f"📦 [Qdrant] Collection créée: {name} ({self._dimensions}d, cosine)", file=sys.stderr)
+            print(f"📦 [Qdrant] Collection créée: {name} ({self._dimensions}d, cosine, "
+                  f"{self._datatype.value})", file=sys.stderr)
             return False
             
         except Exception as e:
@@ -355,21 +377,21 @@ class VectorStoreService:
     # Export / Import (Backup)
     # =========================================================================
     
-    async def export_collection(self, memory_id: str) -> List[dict]:
+    async def export_collection(self, memory_id: str) -> AsyncIterator[dict]:
         """
-        Exporte tous les points d'une collection Qdrant pour backup.
+        Exporte tous les points d'une collection Qdrant pour backup, en flux.
         
-        Utilise le scroll API pour paginer et éviter les problèmes de mémoire.
-        Chaque point est exporté avec son id, vector et payload.
+        Utilise le scroll API pour paginer : seule la page courante est en
+        mémoire. Chaque point est exporté avec son id, vector et payload.
         
         Args:
             memory_id: ID de la mémoire
             
-        Returns:
-            Liste de dicts {id, vector, payload} pour chaque point
+        Yields:
+            Dict {id, vector, payload} pour chaque point
         """
         name = self._collection_name(memory_id)
-        all_points = []
+        exported = 0
         
         try:
             # Vérifier que la collection existe
@@ -377,7 +399,7 @@ class VectorStoreService:
             existing_names = [c.name for c in collections]
             if name not in existing_names:
                 print(f"⚠️ [Qdrant Export] Collection {name} n'existe pas", file=sys.stderr)
-                return []
+                return
             
             # Scroll pour récupérer tous les points par pages
             offset = None
@@ -395,18 +417,18 @@ class VectorStoreService:
                 points, next_offset = scroll_result
                 
                 for point in points:
-                    all_points.append({
+                    yield {
                         "id": str(point.id),
                         "vector": list(point.vector) if point.vector else [],
                         "payload": dict(point.payload) if point.payload else {}
-                    })
+                    }
+                exported += len(points)
                 
                 if next_offset is None:
                     break
                 offset = next_offset
             
-            print(f"📦 [Qdrant Export] {name}: {len(all_points)} points exportés", file=sys.stderr)
-            return all_points
+            print(f"📦 [Qdrant Export] {name}: {exported} points exportés", file=sys.stderr)
             
         except Exception as e:
             print(f"❌ [Qdrant Export] Erreur export {name}: {e}", file=sys.stderr)
@@ -415,8 +437,8 @@ class VectorStoreService:
     async def import_collection(
         self,
         memory_id: str,
-        points_data: List[dict],
-        batch_size: int = 100
+        points_data,
+        batch_size: Optional[int] = None
     ) -> int:
         """
         Importe des points dans une collection Qdrant depuis un backup.
@@ -424,43 +446,64 @@ class VectorStoreService:
         Recrée la collection (si elle n'existe pas) et upsert tous les points.
         Les vecteurs et payloads sont restaurés tels quels.
         
+        Les points sont consommés au fil de l'eau (liste, itérable ou itérable
+        asynchrone) et envoyés par batches ; jusqu'à QDRANT_IMPORT_CONCURRENCY
+        upserts sont en vol (dans des threads) pendant la lecture des suivants.
+        
         Args:
             memory_id: ID de la mémoire
-            points_data: Liste de dicts {id, vector, payload}
-            batch_size: Taille des batches d'upsert
+            points_data: Itérable (sync ou async) de dicts {id, vector, payload}
+            batch_size: Taille des batches d'upsert (défaut: QDRANT_IMPORT_BATCH_SIZE)
             
         Returns:
             Nombre de points importés
         """
-        if not points_data:
-            return 0
-        
         name = self._collection_name(memory_id)
+        batch_size = batch_size or self._import_batch_size
         
-        # S'assurer que la collection existe
-        await self.ensure_collection(memory_id)
-        
-        # Construire et upsert par batches
         total_imported = 0
+        batch = []
+        in_flight = set()
         
-        for i in range(0, len(points_data), batch_size):
-            batch = points_data[i:i + batch_size]
-            
-            points = []
-            for p in batch:
-                points.append(qmodels.PointStruct(
+        async def _flush(points: list) -> None:
+            nonlocal total_imported
+            if total_imported == 0 and not in_flight:
+                # S'assurer que la collection existe (avant le premier batch)
+                await self.ensure_collection(memory_id)
+            # Borner les upserts en vol (donc la mémoire)
+            while len(in_flight) >= self._import_concurrency:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                in_flight.difference_update(done)
+                for task in done:
+                    task.result()  # Propage une éventuelle erreur d'upsert
+            in_flight.add(asyncio.ensure_future(asyncio.to_thread(
+                self._client.upsert,
+                collection_name=name,
+                points=points
+            )))
+            total_imported += len(points)
+        
+        try:
+            async for p in _aiter(points_data):
+                batch.append(qmodels.PointStruct(
                     id=p["id"],
                     vector=p["vector"],
                     payload=p.get("payload", {})
                 ))
-            
-            self._client.upsert(
-                collection_name=name,
-                points=points
-            )
-            total_imported += len(points)
+                if len(batch) >= batch_size:
+                    await _flush(batch)
+                    batch = []
+            if batch:
+                await _flush(batch)
+            if in_flight:
+                await asyncio.gather(*in_flight)
+        except BaseException:
+            for task in in_flight:
+                task.cancel()
+            raise
         
-        print(f"📥 [Qdrant Import] {name}: {total_imported} points importés", file=sys.stderr)
+        if total_imported:
+            print(f"📥 [Qdrant Import] {name}: {total_imported} points importés", file=sys.stderr)
         return total_imported
     
     # =========================================================================
@@ -7,7 +7,8 @@ Expose tous les outils MCP via Streamable HTTP avec FastMCP.
 
 import os
 import sys
-import json
+import asyncio
+import logging
 import uuid
 import base64
 import argparse
@@ -451,6 +452,9 @@ async def memory_ingest(
         if write_err:
             return write_err
         
+        # Ouvrir la connexion LLMaaS pendant l'upload S3 et l'extraction du texte
+        get_extractor().warm_up()
+        
         # Décoder le contenu (libérer content_base64 ensuite — peut être volumineux)
         content = base64.b64decode(content_base64)
         content_size = len(content)
@@ -573,7 +577,6 @@ async def memory_ingest(
         # === RAG Vectoriel : Chunking + Embedding + Qdrant (synchrone strict) ===
         await _log("🧩 Vectorisation RAG (chunking + embedding + Qdrant)...")
         chunks_stored = 0
-        EMBED_BATCH_SIZE = 5  # Envoyer max 5 chunks par appel API embedding
         try:
             # S'assurer que la collection Qdrant existe
             await get_vector_store().ensure_collection(memory_id)
@@ -601,29 +604,21 @@ async def memory_ingest(
                     chunk.doc_id = doc_id
                     chunk.memory_id = memory_id
                 
-                # Générer les embeddings par BATCHES (évite surcharge API)
+                # Générer les embeddings (batches envoyés en parallèle par l'embedder)
                 chunk_texts = [c.text for c in chunks]
                 total_chunks = len(chunk_texts)
-                all_embeddings = []
                 
-                for batch_start in range(0, total_chunks, EMBED_BATCH_SIZE):
-                    batch_end = min(batch_start + EMBED_BATCH_SIZE, total_chunks)
-                    batch_num = batch_start // EMBED_BATCH_SIZE + 1
-                    total_batches = (total_chunks + EMBED_BATCH_SIZE - 1) // EMBED_BATCH_SIZE
-                    batch_texts = chunk_texts[batch_start:batch_end]
-                    
-                    await _log(f"🔢 Embedding batch {batch_num}/{total_batches} ({len(batch_texts)} chunks)")
+                await _log(f"🔢 Embedding de {total_chunks} chunks...")
+                sys.stderr.flush()
+                
+                try:
+                    all_embeddings = await get_embedder().embed_texts(chunk_texts)
+                    await _log(f"✅ Embeddings OK ({len(all_embeddings)}/{total_chunks})")
                     sys.stderr.flush()
-                    
-                    try:
-                        batch_embeddings = await get_embedder().embed_texts(batch_texts)
-                        all_embeddings.extend(batch_embeddings)
-                        await _log(f"✅ Batch {batch_num}/{total_batches} OK ({len(all_embeddings)}/{total_chunks})")
-                        sys.stderr.flush()
-                    except Exception as embed_err:
-                        print(f"❌ [Ingest] Erreur embedding batch {batch_num}: {embed_err}", file=sys.stderr)
-                        sys.stderr.flush()
-                        raise
+                except Exception as embed_err:
+                    print(f"❌ [Ingest] Erreur embedding: {embed_err}", file=sys.stderr)
+                    sys.stderr.flush()
+                    raise
                 
                 # Stocker dans Qdrant
                 await _log(f"📦 Stockage Qdrant ({len(all_embeddings)} vecteurs)...")
@@ -2342,15 +2337,24 @@ async def backup_download(
                 except Exception:
                     pass
         
-        archive_bytes = await get_backup().download_backup(
+        # Encoder en base64 pour transmission via MCP, au fil de l'archive produite
+        # en flux (par blocs multiples de 3 octets : pas de padding intermédiaire)
+        b64_parts = []
+        pending = b""
+        archive_size = 0
+        async for chunk in get_backup().download_backup(
             backup_id=backup_id,
             include_documents=include_documents,
             progress_callback=_progress
-        )
-        
-        # Encoder en base64 pour transmission via MCP
-        import base64 as b64
-        archive_b64 = b64.b64encode(archive_bytes).decode("ascii")
+        ):
+            archive_size += len(chunk)
+            pending += chunk
+            cut = len(pending) - len(pending) % 3
+            b64_parts.append(base64.b64encode(pending[:cut]))
+            pending = pending[cut:]
+        b64_parts.append(base64.b64encode(pending))
+        archive_b64 = b"".join(b64_parts).decode("ascii")
+        del b64_parts
         
         # Nom de fichier suggéré
         safe_id = backup_id.replace("/", "-")
@@ -2360,7 +2364,7 @@ async def backup_download(
             "status": "ok",
             "backup_id": backup_id,
             "filename": filename,
-            "size_bytes": len(archive_bytes),
+            "size_bytes": archive_size,
             "include_documents": include_documents,
             "content_base64": archive_b64,
         }
@@ -2428,23 +2432,15 @@ async def backup_restore_archive(
         archive_bytes = base64.b64decode(archive_base64)
         
         # Extraire le memory_id du manifest pour vérifier l'accès
-        import tarfile
-        from io import BytesIO
-        try:
-            with tarfile.open(fileobj=BytesIO(archive_bytes), mode='r:gz') as tar:
-                manifest_member = tar.getmember('manifest.json')
-                manifest_file = tar.extractfile(manifest_member)
-                if manifest_file:
-                    manifest_data = json.loads(manifest_file.read())
-                else:
-                    manifest_data = {}
-                archive_memory_id = manifest_data.get("memory_id")
-                if archive_memory_id:
-                    access_err = check_memory_access(archive_memory_id)
-                    if access_err:
-                        return access_err
-        except (KeyError, json.JSONDecodeError):
-            pass  # Le backup service gérera les erreurs de format
+        # (lecture en flux, arrêtée au manifest : il est en tête d'archive ;
+        # décompression et parsing tar hors de la boucle d'événements)
+        manifest_data = await asyncio.to_thread(get_backup().read_archive_manifest, archive_bytes)
+        if manifest_data:  # Sinon, le backup service gérera les erreurs de format
+            archive_memory_id = manifest_data.get("memory_id")
+            if archive_memory_id:
+                access_err = check_memory_access(archive_memory_id)
+                if access_err:
+                    return access_err
         
         async def _progress(msg):
             if ctx:
@@ -2466,6 +2462,23 @@ async def backup_restore_archive(
 # Point d'entrée
 # =============================================================================
 
+def _configure_logging(debug: bool) -> None:
+    """
+    Logs des modules du service (logging) sur stderr, au format des print().
+    
+    Configuré ici, au lancement du serveur, et non à l'import des modules :
+    niveau INFO, DEBUG avec --debug (détails d'auth, requêtes HTTP, sections
+    du chunker).
+    """
+    package_logger = logging.getLogger(__package__)
+    if not package_logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        package_logger.addHandler(handler)
+        package_logger.propagate = False
+    package_logger.setLevel(logging.DEBUG if debug else logging.INFO)
+
+
 def main():
     """Point d'entrée principal."""
     parser = argparse.ArgumentParser(description="MCP Memory Server")
@@ -2474,6 +2487,8 @@ def main():
     parser.add_argument("--debug", action="store_true", default=settings.mcp_server_debug)
     args = parser.parse_args()
     
+    _configure_logging(args.debug)
+    
     # Récupérer l'app ASGI Streamable HTTP de FastMCP
     # Remplace l'ancien mcp.sse_app() — endpoint unique /mcp au lieu de /sse + /messages
     # Le HostNormalizerMiddleware n'est plus nécessaire (plus de validation Host par Starlette)
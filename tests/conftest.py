@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""Configuration pytest : le paquet est importé comme src.mcp_memory (comme dans le Dockerfile)."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
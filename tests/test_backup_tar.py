@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Tests de _TarStreamReader (lecteur tar des archives de backup).
+
+Le lecteur remplace tarfile pour la restauration : il doit relire ce que
+produit tarfile, et rejeter (tarfile.ReadError) les en-têtes pax tronqués ou
+malformés au lieu de boucler.
+"""
+
+import gzip
+import io
+import tarfile
+import threading
+
+import pytest
+
+from src.mcp_memory.core.backup import BackupService, _TarStreamReader
+
+
+def _member_blocks(name: str, data: bytes, type_=tarfile.REGTYPE) -> bytes:
+    """En-tête ustar + données bourrées au bloc de 512 octets."""
+    info = tarfile.TarInfo(name)
+    info.type = type_
+    info.size = len(data)
+    return info.tobuf(format=tarfile.USTAR_FORMAT) + data + b"\0" * (-len(data) % 512)
+
+
+def _archive_with_pax(payload: bytes) -> bytes:
+    """Archive : en-tête pax de contenu brut `payload`, puis un fichier ordinaire."""
+    return (
+        _member_blocks("././@PaxHeader", payload, tarfile.XHDTYPE)
+        + _member_blocks("backup/manifest.json", b'{"memory_id": "m"}')
+        + b"\0" * 1024
+    )
+
+
+def _read_all(raw: bytes) -> list:
+    with _TarStreamReader(io.BytesIO(raw)) as tar:
+        return [(member.name, tar.extractfile(member).read()) for member in tar]
+
+
+def _read_all_bounded(raw: bytes, timeout: float = 5.0) -> list:
+    """_read_all sur un thread : un lecteur qui boucle fait échouer le test au lieu de le bloquer."""
+    outcome = {}
+    
+    def _run():
+        try:
+            outcome["result"] = _read_all(raw)
+        except BaseException as e:
+            outcome["error"] = e
+    
+    thread = threading.Thread(target=_run, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "lecture de l'archive toujours en cours (boucle infinie ?)"
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+def test_reads_tarfile_output_with_pax_and_long_names():
+    long_name = "backup/documents/" + "d" * 150 + ".txt"
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w", format=tarfile.PAX_FORMAT) as tar:
+        for name, data in (("backup/manifest.json", b"{}"), (long_name, b"x" * 1000), ("backup/é.txt", b"")):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    
+    assert _read_all(buf.getvalue()) == [
+        ("backup/manifest.json", b"{}"), (long_name, b"x" * 1000), ("backup/é.txt", b""),
+    ]
+
+
+def test_valid_pax_record_overrides_name():
+    assert _read_all(_archive_with_pax(b"21 path=renamed.json\n")) == [
+        ("renamed.json", b'{"memory_id": "m"}'),
+    ]
+
+
+@pytest.mark.parametrize("payload", [
+    b"10 path=a\nXYZ",         # Octets sans espace après un enregistrement
+    b"XYZ",                    # Aucun espace
+    b"abc path=a\n",           # Longueur non numérique
+    b"0 path=a\n",             # Longueur nulle (n'avance pas)
+    b"2 path=a\n",             # Longueur qui s'arrête avant la clé
+    b"99 path=a\n",            # Longueur au-delà des données
+    b" 10 path=a\n",           # Longueur vide
+    b"11 size=-5\n",           # Taille non numérique
+])
+def test_malformed_pax_header_raises(payload):
+    with pytest.raises(tarfile.ReadError):
+        _read_all_bounded(_archive_with_pax(payload))
+
+
+def test_truncated_pax_header_raises():
+    raw = _archive_with_pax(b"21 path=renamed.json\n")
+    with pytest.raises(tarfile.ReadError):
+        _read_all(raw[:512 + 10])  # Coupée au milieu des données pax
+
+
+def test_truncated_header_block_raises():
+    raw = _archive_with_pax(b"21 path=renamed.json\n")
+    with pytest.raises(tarfile.ReadError):
+        _read_all(raw[:1024 + 100])  # Coupée au milieu de l'en-tête du fichier
+
+
+def test_read_archive_manifest_rejects_malformed_pax():
+    archive = gzip.compress(_archive_with_pax(b"10 path=a\nXYZ"))
+    assert BackupService.read_archive_manifest(archive) is None
+    
+    archive = gzip.compress(_archive_with_pax(b"22 path=manifest.json\n"))
+    assert BackupService.read_archive_manifest(archive) == {"memory_id": "m"}